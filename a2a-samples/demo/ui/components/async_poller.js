@@ -3,11 +3,24 @@ import {
   html,
 } from 'https://cdn.jsdelivr.net/gh/lit/dist@3/core/lit-core.min.js';
 
+// Server-sent event types that mean the app state changed.
+const STREAM_EVENTS = [
+  'conversation',
+  'message',
+  'task',
+  'status-update',
+  'artifact-update',
+  'resync',
+];
+// Bursts of pushed changes trigger at most one refresh per this many ms.
+const MIN_REFRESH_MS = 100;
+
 class AsyncPoller extends LitElement {
   static properties = {
     triggerEvent: {type: String},
     action: {type: Object},
     polling_interval: {type: Number},
+    stream_url: {type: String},
   };
 
   render() {
@@ -18,21 +31,75 @@ class AsyncPoller extends LitElement {
     if (this.polling_interval <= 0) {
       return;
     }
+    this.connect();
     if (this.action) {
-      setTimeout(() => {
-        this.runTimeout(this.action)
+      this.timer = setTimeout(() => {
+        this.runTimeout(this.action);
       }, this.polling_interval * 1000);
     }
   }
 
-  runTimeout(action) {
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    clearTimeout(this.timer);
+    clearTimeout(this.pending);
+    if (this.source) {
+      this.source.close();
+      this.source = null;
+    }
+  }
+
+  // While the stream is open, changes are pushed and polling is skipped.
+  connect() {
+    if (!this.stream_url || !window.EventSource) {
+      return;
+    }
+    this.source = new EventSource(this.stream_url);
+    this.source.onopen = () => {
+      this.streaming = true;
+      // Catch up on anything missed while disconnected.
+      this.refresh();
+    };
+    this.source.onerror = () => {
+      // EventSource reconnects on its own; poll until it does.
+      this.streaming = false;
+    };
+    for (const type of STREAM_EVENTS) {
+      this.source.addEventListener(type, () => this.refresh());
+    }
+  }
+
+  refresh() {
+    if (this.polling_interval <= 0 || this.pending) {
+      return;
+    }
+    const wait = (this.lastRefresh || 0) + MIN_REFRESH_MS - Date.now();
+    if (wait > 0) {
+      this.pending = setTimeout(() => {
+        this.pending = null;
+        this.refresh();
+      }, wait);
+      return;
+    }
+    this.lastRefresh = Date.now();
     this.dispatchEvent(
       new MesopEvent(this.triggerEvent, {
-        action: action,
+        action: this.action,
       }),
     );
+  }
+
+  runTimeout(action) {
+    if (!this.streaming) {
+      this.lastRefresh = Date.now();
+      this.dispatchEvent(
+        new MesopEvent(this.triggerEvent, {
+          action: action,
+        }),
+      );
+    }
     if (this.polling_interval > 0) {
-      setTimeout(() => {
+      this.timer = setTimeout(() => {
         this.runTimeout();
       }, this.polling_interval * 1000);
     }
@@ -7,19 +7,31 @@ import httpx
 from service.types import (
     AgentClientHTTPError,
     AgentClientJSONError,
+    CancelMessageRequest,
+    CancelMessageResponse,
     CreateConversationRequest,
     CreateConversationResponse,
     GetEventRequest,
     GetEventResponse,
+    GetEventSinceRequest,
+    GetEventSinceResponse,
+    GetMessageStatusRequest,
+    GetMessageStatusResponse,
     JSONRPCRequest,
     ListAgentRequest,
     ListAgentResponse,
     ListConversationRequest,
     ListConversationResponse,
+    ListConversationSinceRequest,
+    ListConversationSinceResponse,
     ListMessageRequest,
     ListMessageResponse,
+    ListMessageSinceRequest,
+    ListMessageSinceResponse,
     ListTaskRequest,
     ListTaskResponse,
+    ListTaskSinceRequest,
+    ListTaskSinceResponse,
     PendingMessageRequest,
     PendingMessageResponse,
     RegisterAgentRequest,
@@ -38,6 +50,18 @@ class ConversationClient:
     ) -> SendMessageResponse:
         return SendMessageResponse(**await self._send_request(payload))
 
+    async def get_message_status(
+        self, payload: GetMessageStatusRequest
+    ) -> GetMessageStatusResponse:
+        """The dispatch state of a sent message."""
+        return GetMessageStatusResponse(**await self._send_request(payload))
+
+    async def cancel_message(
+        self, payload: CancelMessageRequest
+    ) -> CancelMessageResponse:
+        """Cancels a queued or running message."""
+        return CancelMessageResponse(**await self._send_request(payload))
+
     async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
         async with httpx.AsyncClient() as client:
             try:
@@ -82,6 +106,32 @@ class ConversationClient:
     async def list_tasks(self, payload: ListTaskRequest) -> ListTaskResponse:
         return ListTaskResponse(**await self._send_request(payload))
 
+    async def list_conversations_since(
+        self, payload: ListConversationSinceRequest
+    ) -> ListConversationSinceResponse:
+        """Conversations changed since a cursor, with message ids only."""
+        return ListConversationSinceResponse(
+            **await self._send_request(payload)
+        )
+
+    async def list_messages_since(
+        self, payload: ListMessageSinceRequest
+    ) -> ListMessageSinceResponse:
+        """One conversation's messages changed since a cursor."""
+        return ListMessageSinceResponse(**await self._send_request(payload))
+
+    async def list_tasks_since(
+        self, payload: ListTaskSinceRequest
+    ) -> ListTaskSinceResponse:
+        """Tasks changed since a cursor."""
+        return ListTaskSinceResponse(**await self._send_request(payload))
+
+    async def get_events_since(
+        self, payload: GetEventSinceRequest
+    ) -> GetEventSinceResponse:
+        """Events added since a cursor."""
+        return GetEventSinceResponse(**await self._send_request(payload))
+
     async def register_agent(
         self, payload: RegisterAgentRequest
     ) -> RegisterAgentResponse:
@@ -36,6 +36,9 @@ from remote_agent_connection import TaskCallbackArg
 from utils.agent_card import get_agent_card
 
 from service.server.application_manager import ApplicationManager
+from service.server.change_feed import ChangeFeed
+from service.server.indexed_store import Changes, IndexedStore
+from service.server.retention import ExpiringDict, Retention
 from service.types import Conversation, Event
 
 
@@ -53,13 +56,39 @@ class ADKHostManager(ApplicationManager):
         api_key: str = '',
         uses_vertex_ai: bool = False,
     ):
-        self._conversations: list[Conversation] = []
-        self._messages: list[Message] = []
-        self._tasks: list[Task] = []
-        self._events: dict[str, Event] = {}
-        self._pending_message_ids: list[str] = []
+        # Conversations are stored without their messages, which are kept
+        # (and bounded) in _messages and attached when a conversation is read;
+        # conversation lists and deltas carry only their ids.
+        self._conversations: IndexedStore[Conversation] = IndexedStore(
+            key=lambda c: c.conversation_id,
+            retention=Retention.from_env('CONVERSATIONS', 1000),
+            on_evict=self._end_session,
+        )
+        # Session deletions still running, referenced so they are not collected.
+        self._session_deletes: set[asyncio.Task] = set()
+        self._message_retention = Retention.from_env('MESSAGES', 10000)
+        self._messages: IndexedStore[Message] = IndexedStore(
+            key=lambda m: m.message_id,
+            group=lambda m: m.context_id,
+            retention=self._message_retention,
+        )
+        self._tasks: IndexedStore[Task] = IndexedStore(
+            key=lambda t: t.id,
+            group=lambda t: t.context_id,
+            retention=Retention.from_env('TASKS', 10000),
+        )
+        self._events: IndexedStore[Event] = IndexedStore(
+            key=lambda e: e.id, retention=Retention.from_env('EVENTS', 10000)
+        )
+        # Task updates and new messages are pushed to the UI through this.
+        self._changes = ChangeFeed()
+        # Insertion-ordered set of message ids still being processed
+        self._pending_message_ids: dict[str, None] = {}
         self._agents: list[AgentCard] = []
-        self._artifact_chunks: dict[str, list[Artifact]] = {}
+        # Chunked artifacts still being assembled; abandoned ones expire.
+        self._artifact_chunks: ExpiringDict[str, list[Artifact]] = ExpiringDict(
+            Retention.from_env('ARTIFACT_CHUNKS', 1000, ttl=3600)
+        )
         self._session_service = InMemorySessionService()
         self._artifact_service = InMemoryArtifactService()
         self._memory_service = InMemoryMemoryService()
@@ -85,7 +114,9 @@ class ADKHostManager(ApplicationManager):
         self._initialize_host()
 
         # Map of message id to task id
-        self._task_map: dict[str, str] = {}
+        self._task_map: ExpiringDict[str, str] = ExpiringDict(
+            self._message_retention
+        )
         # Map to manage 'lost' message ids until protocol level id is introduced
         self._next_id: dict[
             str, str
@@ -107,9 +138,57 @@ class ADKHostManager(ApplicationManager):
         )
         conversation_id = session.id
         c = Conversation(conversation_id=conversation_id, is_active=True)
-        self._conversations.append(c)
+        self._conversations.put(c)
+        self._changes.publish('conversation', c)
         return c
 
+    def _end_session(self, conversation: Conversation) -> None:
+        # Drops the ADK session of a conversation evicted from the store.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(
+            self._session_service.delete_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=conversation.conversation_id,
+            )
+        )
+        self._session_deletes.add(task)
+        task.add_done_callback(self._session_deletes.discard)
+
+    def _with_messages(self, conversation: Conversation) -> Conversation:
+        return conversation.model_copy(
+            update={
+                'messages': self._messages.in_group(
+                    conversation.conversation_id
+                )
+            }
+        )
+
+    def _with_message_ids(self, conversation: Conversation) -> Conversation:
+        return conversation.model_copy(
+            update={
+                'message_ids': [
+                    m.message_id
+                    for m in self._messages.in_group(
+                        conversation.conversation_id
+                    )
+                ]
+            }
+        )
+
+    def _touch_conversation(self, conversation_id: str | None) -> None:
+        # Re-put so conversation/since reports the new message id.
+        conversation = (
+            self._conversations.get(conversation_id)
+            if conversation_id
+            else None
+        )
+        if conversation:
+            self._conversations.put(conversation)
+
     def update_api_key(self, api_key: str):
         """Update the API key and reinitialize the host if needed"""
         if api_key and api_key != self.api_key:
@@ -122,34 +201,35 @@ class ADKHostManager(ApplicationManager):
                 self._initialize_host()
 
                 # Map of message id to task id
-                self._task_map = {}
+                self._task_map = ExpiringDict(self._message_retention)
 
     def sanitize_message(self, message: Message) -> Message:
         if message.context_id:
-            conversation = self.get_conversation(message.context_id)
-            if not conversation:
+            if message.context_id not in self._conversations:
                 return message
+            messages = self._messages.in_group(message.context_id)
             # Check if the last event in the conversation was tied to a task.
-            if conversation.messages:
-                task_id = conversation.messages[-1].task_id
-                if task_id and task_still_open(
-                    next(
-                        filter(lambda x: x and x.id == task_id, self._tasks),
-                        None,
-                    )
-                ):
+            if messages:
+                task_id = messages[-1].task_id
+                if task_id and task_still_open(self._tasks.get(task_id)):
                     message.task_id = task_id
         return message
 
     async def process_message(self, message: Message):
         message_id = message.message_id
         if message_id:
-            self._pending_message_ids.append(message_id)
+            self._pending_message_ids[message_id] = None
+        try:
+            await self._run_host(message)
+        finally:
+            # Also when the message was cancelled or failed.
+            self._pending_message_ids.pop(message_id, None)
+
+    async def _run_host(self, message: Message) -> None:
         context_id = message.context_id
-        conversation = self.get_conversation(context_id)
-        self._messages.append(message)
-        if conversation:
-            conversation.messages.append(message)
+        self._messages.put(message)
+        self._touch_conversation(context_id)
+        self._changes.publish('message', message)
         self.add_event(
             Event(
                 id=str(uuid.uuid4()),
@@ -212,23 +292,28 @@ class ADKHostManager(ApplicationManager):
             response = await self.adk_content_to_message(
                 final_event.content, context_id, task_id
             )
-            self._messages.append(response)
+            self._messages.put(response)
 
-        if conversation and response:
-            conversation.messages.append(response)
-        self._pending_message_ids.remove(message_id)
+        if response:
+            self._touch_conversation(context_id)
+            self._changes.publish('message', response)
 
     def add_task(self, task: Task):
-        self._tasks.append(task)
+        self._tasks.put(task)
 
     def update_task(self, task: Task):
-        for i, t in enumerate(self._tasks):
-            if t.id == task.id:
-                self._tasks[i] = task
-                return
+        if task.id in self._tasks:
+            self._tasks.put(task)
 
     def task_callback(self, task: TaskCallbackArg, agent_card: AgentCard):
         self.emit_event(task, agent_card)
+        current_task = self.apply_task_update(task)
+        # Sent as 'task', 'status-update' or 'artifact-update'.
+        self._changes.publish(task.kind, task)
+        return current_task
+
+    def apply_task_update(self, task: TaskCallbackArg) -> Task:
+        """Applies a task or task update to the stored task and returns it."""
         if isinstance(task, TaskStatusUpdateEvent):
             current_task = self.add_or_get_task(task)
             current_task.status = task.status
@@ -242,7 +327,7 @@ class ADKHostManager(ApplicationManager):
             self.update_task(current_task)
             return current_task
         # Otherwise this is a Task, either new or updated
-        if not any(filter(lambda x: x and x.id == task.id, self._tasks)):
+        if task.id not in self._tasks:
             self.attach_message_to_task(task.status.message, task.id)
             self.add_task(task)
             return task
@@ -340,9 +425,7 @@ class ADKHostManager(ApplicationManager):
             task_id = event.task_id
         if not task_id:
             task_id = str(uuid.uuid4())
-        current_task = next(
-            filter(lambda x: x.id == task_id, self._tasks), None
-        )
+        current_task = self._tasks.get(task_id)
         if not current_task:
             context_id = event.context_id
             current_task = Task(
@@ -389,32 +472,28 @@ class ADKHostManager(ApplicationManager):
                     current_task.artifacts.append(current_temp_artifact)
                 else:
                     current_task.artifacts = [current_temp_artifact]
-                del self._artifact_chunks[artifact.artifact_id][-1]
+                chunks = self._artifact_chunks[artifact.artifact_id]
+                del chunks[-1]
+                if not chunks:
+                    self._artifact_chunks.pop(artifact.artifact_id)
 
     def add_event(self, event: Event):
-        self._events[event.id] = event
+        self._events.put(event)
 
     def get_conversation(
         self, conversation_id: str | None
     ) -> Conversation | None:
         if not conversation_id:
             return None
-        return next(
-            filter(
-                lambda c: c and c.conversation_id == conversation_id,
-                self._conversations,
-            ),
-            None,
-        )
+        conversation = self._conversations.get(conversation_id)
+        return self._with_messages(conversation) if conversation else None
 
     def get_pending_messages(self) -> list[tuple[str, str]]:
         rval = []
-        for message_id in self._pending_message_ids:
+        # Copied: messages finish on the host's event loop while this is read.
+        for message_id in list(self._pending_message_ids):
             if message_id in self._task_map:
-                task_id = self._task_map[message_id]
-                task = next(
-                    filter(lambda x: x.id == task_id, self._tasks), None
-                )
+                task = self._tasks.get(self._task_map[message_id])
                 if not task:
                     rval.append((message_id, ''))
                 elif task.history and task.history[-1].parts:
@@ -449,16 +528,45 @@ class ADKHostManager(ApplicationManager):
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return [self._with_message_ids(c) for c in self._conversations.values()]
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return self._tasks.values()
+
+    def conversation_tasks(self, conversation_id: str) -> list[Task]:
+        """The tasks of one conversation, without scanning the others."""
+        return self._tasks.in_group(conversation_id)
 
     @property
     def events(self) -> list[Event]:
         return sorted(self._events.values(), key=lambda x: x.timestamp)
 
+    @property
+    def changes(self) -> ChangeFeed:
+        """The feed pushing task, artifact and message changes to the UI."""
+        return self._changes
+
+    def conversations_since(self, cursor: int) -> Changes[Conversation]:
+        """Conversations changed after `cursor`, with message ids only."""
+        changes = self._conversations.changed_since(cursor)
+        changes.items = [self._with_message_ids(c) for c in changes.items]
+        return changes
+
+    def messages_since(
+        self, conversation_id: str, cursor: int
+    ) -> Changes[Message]:
+        """One conversation's messages put after `cursor`."""
+        return self._messages.changed_since(cursor, group=conversation_id)
+
+    def tasks_since(self, cursor: int) -> Changes[Task]:
+        """Tasks put after `cursor`."""
+        return self._tasks.changed_since(cursor)
+
+    def events_since(self, cursor: int) -> Changes[Event]:
+        """Events added after `cursor`."""
+        return self._events.changed_since(cursor)
+
     def adk_content_from_message(self, message: Message) -> types.Content:
         parts: list[types.Part] = []
         for p in message.parts:
@@ -609,17 +717,6 @@ class ADKHostManager(ApplicationManager):
             )
         return parts
 
-    def process_message_threadsafe(
-        self, message: Message, loop: asyncio.AbstractEventLoop
-    ):
-        """Safely run process_message from a thread using the given event loop."""
-        future = asyncio.run_coroutine_threadsafe(
-            self.process_message(message), loop
-        )
-        return (
-            future  # You can call future.result() to get the result if needed
-        )
-
 
 def get_message_id(m: Message | None) -> str | None:
     if not m or not m.metadata or 'message_id' not in m.metadata:
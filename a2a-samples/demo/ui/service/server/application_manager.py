@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from a2a.types import AgentCard, Message, Task
 
+from service.server.change_feed import ChangeFeed
+from service.server.indexed_store import Changes
 from service.types import Conversation, Event
 
 
@@ -51,3 +53,26 @@ class ApplicationManager(ABC):
     @abstractmethod
     def events(self) -> list[Event]:
         pass
+
+    @property
+    @abstractmethod
+    def changes(self) -> ChangeFeed:
+        pass
+
+    @abstractmethod
+    def conversations_since(self, cursor: int) -> Changes[Conversation]:
+        pass
+
+    @abstractmethod
+    def messages_since(
+        self, conversation_id: str, cursor: int
+    ) -> Changes[Message]:
+        pass
+
+    @abstractmethod
+    def tasks_since(self, cursor: int) -> Changes[Task]:
+        pass
+
+    @abstractmethod
+    def events_since(self, cursor: int) -> Changes[Event]:
+        pass
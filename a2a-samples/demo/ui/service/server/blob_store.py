@@ -0,0 +1,94 @@
+import contextlib
+import os
+import re
+import tempfile
+import time
+
+from pathlib import Path
+
+from a2a.types import FilePart
+
+from service.server.retention import Retention
+
+
+# Spilled files are swept at most this often.
+SWEEP_INTERVAL_SECONDS = 60.0
+
+_SAFE_ID = re.compile(r'^[A-Za-z0-9-]{1,64}$')
+
+
+class BlobStore:
+    """File parts spilled from memory to a local directory, one JSON file each.
+
+    Files stay servable by id until the retention policy removes them: beyond
+    `max_items` the oldest go first, and any older than `ttl` are deleted.
+    """
+
+    def __init__(self, root: str | Path, retention: Retention):
+        self.root = Path(root)
+        self.retention = retention
+        self._last_sweep = 0.0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, file_id: str) -> Path | None:
+        if not _SAFE_ID.match(file_id):
+            return None
+        return self.root / f'{file_id}.json'
+
+    def put(self, file_id: str, part: FilePart) -> None:
+        """Writes a file part under its id, replacing any earlier one."""
+        path = self._path(file_id)
+        if path is None:
+            return
+        fd, name = tempfile.mkstemp(dir=self.root, prefix='.tmp-')
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(part.model_dump_json())
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink()
+            raise
+        now = time.time()
+        if now - self._last_sweep >= SWEEP_INTERVAL_SECONDS:
+            self.sweep(now)
+
+    def get(self, file_id: str) -> FilePart | None:
+        """The file part stored under this id, or None if missing or expired."""
+        path = self._path(file_id)
+        if path is None:
+            return None
+        try:
+            if self.retention.expired(path.stat().st_mtime, time.time()):
+                return None
+            return FilePart.model_validate_json(
+                path.read_text(encoding='utf-8')
+            )
+        except FileNotFoundError:
+            return None
+
+    def sweep(self, now: float | None = None) -> None:
+        """Deletes spilled files the retention policy no longer keeps."""
+        now = now or time.time()
+        self._last_sweep = now
+        files = sorted(
+            (updated, path)
+            for path in self.root.glob('*.json')
+            if (updated := _mtime(path)) is not None
+        )
+        for i, (updated, path) in enumerate(files):
+            if not (
+                self.retention.over(len(files) - i)
+                or self.retention.expired(updated, now)
+            ):
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+
+def _mtime(path: Path) -> float | None:
+    # None for a file removed since it was listed, e.g. by another sweep.
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
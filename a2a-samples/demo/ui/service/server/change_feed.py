@@ -0,0 +1,85 @@
+import asyncio
+import contextlib
+import threading
+
+from collections.abc import AsyncIterator
+
+from pydantic import BaseModel
+
+
+# Notifications buffered per subscriber before it is told to resync instead.
+QUEUE_SIZE = 256
+# Idle streams send a comment this often so proxies keep them open.
+KEEPALIVE_SECONDS = 15.0
+
+
+class ChangeFeed:
+    """Pushes what changes in a host manager to server-sent event streams.
+
+    Every open stream has its own queue on the event loop serving it, and
+    `publish` may be called from any thread. Nothing is serialized while no
+    stream is open. A stream that falls `QUEUE_SIZE` notifications behind has
+    its backlog replaced by a single `resync` event, after which the client
+    should refetch through the */since endpoints.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[
+            asyncio.Queue[tuple[str, str]], asyncio.AbstractEventLoop
+        ] = {}
+
+    def publish(self, kind: str, payload: BaseModel) -> None:
+        """Sends `payload` as a `kind` event to every open stream."""
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        if not subscribers:
+            return
+        item = (kind, payload.model_dump_json(exclude_none=True))
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for queue, loop in subscribers:
+            if loop is current:
+                _offer(queue, item)
+                continue
+            # A RuntimeError means the stream's loop has closed; the stream
+            # unsubscribes on its own.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_offer, queue, item)
+
+    async def stream(
+        self, keepalive: float = KEEPALIVE_SECONDS
+    ) -> AsyncIterator[str]:
+        """Server-sent events for everything published from now on."""
+        queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        try:
+            # Sent straight away so the client knows the stream is open.
+            yield ': connected\n\n'
+            while True:
+                try:
+                    kind, data = await asyncio.wait_for(queue.get(), keepalive)
+                except TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f'event: {kind}\ndata: {data}\n\n'
+        finally:
+            with self._lock:
+                self._subscribers.pop(queue, None)
+
+    def __len__(self) -> int:
+        """The number of open streams."""
+        return len(self._subscribers)
+
+
+def _offer(
+    queue: asyncio.Queue[tuple[str, str]], item: tuple[str, str]
+) -> None:
+    if queue.full():
+        while not queue.empty():
+            queue.get_nowait()
+        item = ('resync', '{}')
+    queue.put_nowait(item)
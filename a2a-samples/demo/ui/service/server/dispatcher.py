@@ -0,0 +1,108 @@
+import asyncio
+import logging
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from service.server.retention import ExpiringDict, Retention
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised by Dispatcher.submit when no more jobs may wait."""
+
+    def __init__(self, max_queued: int) -> None:
+        super().__init__(
+            f'{max_queued} jobs are already waiting, try again later'
+        )
+
+
+@dataclass
+class Job:
+    """One submitted job and where it is in its lifecycle."""
+
+    id: str
+    # queued, running, completed, failed or cancelled
+    state: str = 'queued'
+    error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class Dispatcher:
+    """Runs submitted jobs as tasks on the server's event loop, a few at a time.
+
+    At most `workers` jobs run at once and up to `max_queued` more wait their
+    turn in submission order; beyond that `submit` raises QueueFullError rather than
+    letting a burst pile up unbounded work. Jobs are tracked by id while they
+    are pending and their final state is kept according to `retention`.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queued: int,
+        retention: Retention | None = None,
+    ):
+        self.workers = workers
+        self.max_queued = max_queued
+        self._slots = asyncio.Semaphore(workers)
+        self._active: dict[str, Job] = {}
+        self._finished: ExpiringDict[str, Job] = ExpiringDict(
+            retention or Retention()
+        )
+
+    def submit(self, job_id: str, work: Callable[[], Awaitable[None]]) -> Job:
+        """Schedules `work()`; submitting a pending id again is a no-op."""
+        job = self._active.get(job_id)
+        if job is not None:
+            return job
+        # Counts every pending job: one submitted this tick has not taken a
+        # free worker yet, but will.
+        if len(self._active) >= self.workers + self.max_queued:
+            raise QueueFullError(self.max_queued)
+        job = Job(id=job_id)
+        job.task = asyncio.get_running_loop().create_task(self._run(job, work))
+        job.task.add_done_callback(lambda task: self._finish(job, task))
+        self._active[job_id] = job
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancels a queued or running job; False if it is not pending."""
+        job = self._active.get(job_id)
+        if job is None or job.task is None:
+            return False
+        return job.task.cancel()
+
+    def get(self, job_id: str) -> Job | None:
+        """A pending job, or a finished one still retained; else None."""
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+    def queued(self) -> list[str]:
+        """Ids of the jobs still waiting for a worker, oldest first."""
+        return [j.id for j in self._active.values() if j.state == 'queued']
+
+    def running(self) -> list[str]:
+        """Ids of the jobs currently running."""
+        return [j.id for j in self._active.values() if j.state == 'running']
+
+    async def _run(self, job: Job, work: Callable[[], Awaitable[None]]) -> None:
+        async with self._slots:
+            job.state = 'running'
+            await work()
+
+    def _finish(self, job: Job, task: asyncio.Task) -> None:
+        # A done callback rather than a finally block, since a job cancelled
+        # before it starts never runs its coroutine at all.
+        if task.cancelled():
+            job.state = 'cancelled'
+        elif (error := task.exception()) is not None:
+            job.state = 'failed'
+            job.error = str(error)
+            logger.exception('Message %s failed', job.id, exc_info=error)
+        else:
+            job.state = 'completed'
+        job.task = None
+        self._active.pop(job.id, None)
+        self._finished[job.id] = job
@@ -2,6 +2,8 @@ import asyncio
 import datetime
 import uuid
 
+from collections import deque
+
 from a2a.types import (
     AgentCard,
     Artifact,
@@ -18,6 +20,9 @@ from utils.agent_card import get_agent_card
 
 from service.server import test_image
 from service.server.application_manager import ApplicationManager
+from service.server.change_feed import ChangeFeed
+from service.server.indexed_store import Changes
+from service.server.retention import ExpiringDict, Retention
 from service.types import Conversation, Event
 
 
@@ -29,28 +34,38 @@ class InMemoryFakeAgentManager(ApplicationManager):
     uses to send messages to the agent and provide information for the frontend.
     """
 
-    _conversations: list[Conversation]
-    _messages: list[Message]
-    _tasks: list[Task]
-    _events: list[Event]
-    _pending_message_ids: list[str]
+    _conversations: deque[Conversation]
+    _messages: deque[Message]
+    _tasks: deque[Task]
+    _events: deque[Event]
+    # Insertion-ordered set of message ids still being processed
+    _pending_message_ids: dict[str, None]
     _next_message_idx: int
     _agents: list[AgentCard]
 
     def __init__(self):
-        self._conversations = []
-        self._messages = []
-        self._tasks = []
-        self._events = []
-        self._pending_message_ids = []
+        # Oldest entries are dropped beyond the configured limits.
+        self._conversations = deque(
+            maxlen=Retention.from_env('CONVERSATIONS', 1000).max_items
+        )
+        message_retention = Retention.from_env('MESSAGES', 10000)
+        self._messages = deque(maxlen=message_retention.max_items)
+        self._message_limit = message_retention.max_items
+        self._tasks = deque(maxlen=Retention.from_env('TASKS', 10000).max_items)
+        self._events = deque(
+            maxlen=Retention.from_env('EVENTS', 10000).max_items
+        )
+        self._pending_message_ids = {}
         self._next_message_idx = 0
         self._agents = []
-        self._task_map = {}
+        self._task_map: ExpiringDict[str, str] = ExpiringDict(message_retention)
+        self._changes = ChangeFeed()
 
     def create_conversation(self) -> Conversation:
         conversation_id = str(uuid.uuid4())
         c = Conversation(conversation_id=conversation_id, is_active=True)
         self._conversations.append(c)
+        self._changes.publish('conversation', c)
         return c
 
     def sanitize_message(self, message: Message) -> Message:
@@ -73,15 +88,23 @@ class InMemoryFakeAgentManager(ApplicationManager):
         return message
 
     async def process_message(self, message: Message):
-        self._messages.append(message)
         message_id = message.message_id
+        if message_id:
+            self._pending_message_ids[message_id] = None
+        try:
+            await self._respond(message)
+        finally:
+            # Also when the message was cancelled or failed.
+            self._pending_message_ids.pop(message_id, None)
+
+    async def _respond(self, message: Message) -> None:
+        self._messages.append(message)
         context_id = message.context_id or ''
         task_id = message.task_id or ''
-        if message_id:
-            self._pending_message_ids.append(message_id)
         conversation = self.get_conversation(context_id)
         if conversation:
-            conversation.messages.append(message)
+            self._append_message(conversation, message)
+        self._changes.publish('message', message)
         self._events.append(
             Event(
                 id=str(uuid.uuid4()),
@@ -107,7 +130,8 @@ class InMemoryFakeAgentManager(ApplicationManager):
         await asyncio.sleep(self._next_message_idx)
         response = self.next_message()
         if conversation:
-            conversation.messages.append(response)
+            self._append_message(conversation, response)
+        self._changes.publish('message', response)
         self._events.append(
             Event(
                 id=str(uuid.uuid4()),
@@ -116,7 +140,6 @@ class InMemoryFakeAgentManager(ApplicationManager):
                 timestamp=datetime.datetime.utcnow().timestamp(),
             )
         )
-        self._pending_message_ids.remove(message_id)
         # Now clean up the task
         if task:
             task.status.state = TaskState.completed
@@ -133,13 +156,22 @@ class InMemoryFakeAgentManager(ApplicationManager):
                 task.history.append(response)
             self.update_task(task)
 
+    def _append_message(
+        self, conversation: Conversation, message: Message
+    ) -> None:
+        conversation.messages.append(message)
+        if self._message_limit:
+            del conversation.messages[: -self._message_limit]
+
     def add_task(self, task: Task):
         self._tasks.append(task)
+        self._changes.publish(task.kind, task)
 
     def update_task(self, task: Task):
         for i, t in enumerate(self._tasks):
             if t.id == task.id:
                 self._tasks[i] = task
+                self._changes.publish(task.kind, task)
                 return
 
     def add_event(self, event: Event):
@@ -205,16 +237,51 @@ class InMemoryFakeAgentManager(ApplicationManager):
 
     @property
     def conversations(self) -> list[Conversation]:
-        return self._conversations
+        return list(self._conversations)
 
     @property
     def tasks(self) -> list[Task]:
-        return self._tasks
+        return list(self._tasks)
 
     @property
     def events(self) -> list[Event]:
         return []
 
+    @property
+    def changes(self) -> ChangeFeed:
+        """The feed pushing task, artifact and message changes to the UI."""
+        return self._changes
+
+    # Changes are not tracked here, so every sync is a full resync.
+    def conversations_since(self, cursor: int) -> Changes[Conversation]:
+        """Every conversation, with message ids only."""
+        items = [
+            c.model_copy(
+                update={
+                    'messages': [],
+                    'message_ids': [m.message_id for m in c.messages],
+                }
+            )
+            for c in self._conversations
+        ]
+        return Changes(cursor=0, items=items, reset=True)
+
+    def messages_since(
+        self, conversation_id: str, cursor: int
+    ) -> Changes[Message]:
+        """Every message of one conversation."""
+        conversation = self.get_conversation(conversation_id)
+        messages = list(conversation.messages) if conversation else []
+        return Changes(cursor=0, items=messages, reset=True)
+
+    def tasks_since(self, cursor: int) -> Changes[Task]:
+        """Every task."""
+        return Changes(cursor=0, items=self.tasks, reset=True)
+
+    def events_since(self, cursor: int) -> Changes[Event]:
+        """Every event (none are kept here)."""
+        return Changes(cursor=0, items=self.events, reset=True)
+
 
 _contextId = str(uuid.uuid4())
 
@@ -0,0 +1,199 @@
+import itertools
+import time
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from service.server.retention import Retention
+
+
+T = TypeVar('T')
+
+# Removals remembered per store; older cursors get a full resync instead.
+TOMBSTONES = 1000
+
+# One sequence shared by every store, starting from the clock so that cursors
+# handed out before a server restart are older than anything after it.
+_sequence = itertools.count(time.time_ns() // 1000)
+
+
+@dataclass
+class Changes(Generic[T]):
+    """What changed in a store after a cursor.
+
+    With `reset` set, `items` is the whole store and anything the caller holds
+    that is not in it should be dropped.
+    """
+
+    cursor: int
+    items: list[T] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    reset: bool = False
+
+
+class IndexedStore(Generic[T]):
+    """An insertion-ordered collection indexed by id and, optionally, by group.
+
+    Lookups, inserts and replacements by id are O(1), and the items of one
+    group (e.g. the tasks of a conversation) are listed without scanning the
+    rest, so the host manager does not slow down as its history grows. With a
+    `retention` policy the least recently updated items are evicted once the
+    store is over its size limit or they outlive its TTL; `on_evict(item)` is
+    called for each of those (not for explicit removals).
+
+    Every put and removal takes the next number of a shared sequence, so a
+    caller can ask for only what `changed_since` the cursor it last saw.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], str],
+        group: Callable[[T], str | None] | None = None,
+        retention: Retention | None = None,
+        on_evict: Callable[[T], None] | None = None,
+    ):
+        self._key = key
+        self._group = group
+        self.retention = retention or Retention()
+        self._on_evict = on_evict
+        self._items: dict[str, T] = {}
+        # group key -> item ids in insertion order (dicts as ordered sets)
+        self._groups: dict[str, dict[str, None]] = {}
+        # item id -> (sequence, time) of the last put, oldest first
+        self._updated: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        # (sequence, item id) of recent removals
+        self._removed: deque[tuple[int, str]] = deque(maxlen=TOMBSTONES)
+        # Cursors older than this can no longer be answered with a delta.
+        self._floor = next(_sequence)
+
+    def put(self, item: T) -> T:
+        """Adds an item, or replaces the one with the same id in place."""
+        item_id = self._key(item)
+        previous = self._items.get(item_id)
+        if previous is not None and self._group:
+            old_group = self._group(previous)
+            if old_group != self._group(item):
+                self._unindex(old_group, item_id)
+        self._items[item_id] = item
+        if self._group:
+            group = self._group(item)
+            if group is not None:
+                self._groups.setdefault(group, {})[item_id] = None
+        self._updated[item_id] = (next(_sequence), time.monotonic())
+        self._updated.move_to_end(item_id)
+        self.evict()
+        return item
+
+    def get(self, item_id: str | None) -> T | None:
+        """The item with this id, or None if it is missing or expired."""
+        if item_id is None:
+            return None
+        updated = self._updated.get(item_id)
+        if updated is not None and self.retention.expired(
+            updated[1], time.monotonic()
+        ):
+            self._drop(item_id)
+            return None
+        return self._items.get(item_id)
+
+    def remove(self, item_id: str) -> T | None:
+        """Removes an item by id and returns it, recording the removal."""
+        item = self._items.pop(item_id, None)
+        self._updated.pop(item_id, None)
+        if item is None:
+            return None
+        if self._group:
+            self._unindex(self._group(item), item_id)
+        if len(self._removed) == self._removed.maxlen:
+            self._floor = self._removed[0][0]
+        self._removed.append((next(_sequence), item_id))
+        return item
+
+    def in_group(self, group: str | None) -> list[T]:
+        """The items of one group, in the order they joined it."""
+        self.evict()
+        ids = self._groups.get(group, {}) if group is not None else {}
+        return [self._items[item_id] for item_id in ids]
+
+    def values(self) -> list[T]:
+        """Every item, least recently inserted first."""
+        self.evict()
+        return list(self._items.values())
+
+    @property
+    def cursor(self) -> int:
+        """The sequence number of the latest change to the store."""
+        last = self._removed[-1][0] if self._removed else self._floor
+        if self._updated:
+            last = max(last, next(reversed(self._updated.values()))[0])
+        return last
+
+    def changed_since(
+        self, cursor: int, group: str | None = None
+    ) -> Changes[T]:
+        """Items put and ids removed after `cursor`, oldest change first.
+
+        A cursor from before the oldest removal still remembered (or from
+        another server process) gets the whole store back with `reset` set.
+        With a `group`, only that group's items are returned; removals are
+        not filtered, as removed items no longer have a group.
+        """
+        self.evict()
+        latest = self.cursor
+        if cursor < self._floor or cursor > latest:
+            items = self.values() if group is None else self.in_group(group)
+            return Changes(cursor=latest, items=items, reset=True)
+        items = []
+        for item_id, (seq, _) in reversed(self._updated.items()):
+            if seq <= cursor:
+                break
+            item = self._items[item_id]
+            if group is None or (self._group and self._group(item) == group):
+                items.append(item)
+        items.reverse()
+        removed: dict[str, None] = {}
+        for seq, item_id in reversed(self._removed):
+            if seq <= cursor:
+                break
+            if item_id not in self._items:
+                removed[item_id] = None
+        return Changes(cursor=latest, items=items, removed=list(removed))
+
+    def evict(self) -> None:
+        """Applies the retention policy now."""
+        now = time.monotonic()
+        while self._updated:
+            item_id, (_, updated) = next(iter(self._updated.items()))
+            if not (
+                self.retention.over(len(self._items))
+                or self.retention.expired(updated, now)
+            ):
+                break
+            self._drop(item_id)
+
+    def _drop(self, item_id: str) -> None:
+        item = self.remove(item_id)
+        if item is not None and self._on_evict:
+            self._on_evict(item)
+
+    def _unindex(self, group: str | None, item_id: str) -> None:
+        ids = self._groups.get(group) if group is not None else None
+        if ids is None:
+            return
+        ids.pop(item_id, None)
+        if not ids:
+            del self._groups[group]
+
+    def __contains__(self, item_id: object) -> bool:
+        """Whether an item with this id is stored."""
+        return item_id in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the items."""
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        """The number of items stored."""
+        return len(self._items)
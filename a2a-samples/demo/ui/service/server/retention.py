@@ -0,0 +1,130 @@
+import os
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+@dataclass(frozen=True)
+class Retention:
+    """How much of something the server keeps in memory.
+
+    Entries beyond `max_items` are evicted least recently updated first, and
+    entries not updated for `ttl` seconds are evicted whenever the collection is
+    next written or listed. None disables either limit.
+    """
+
+    max_items: int | None = None
+    ttl: float | None = None
+
+    @classmethod
+    def from_env(
+        cls, name: str, max_items: int | None, ttl: float | None = None
+    ) -> 'Retention':
+        """Overrides the defaults from A2A_UI_<NAME>_MAX / _TTL_SECONDS.
+
+        0 in either variable means unlimited.
+        """
+        max_env = os.environ.get(f'A2A_UI_{name}_MAX')
+        ttl_env = os.environ.get(f'A2A_UI_{name}_TTL_SECONDS')
+        if max_env is not None:
+            max_items = int(max_env) or None
+        if ttl_env is not None:
+            ttl = float(ttl_env) or None
+        return cls(max_items=max_items, ttl=ttl)
+
+    def over(self, count: int) -> bool:
+        """Whether `count` entries are more than the policy keeps."""
+        return self.max_items is not None and count > self.max_items
+
+    def expired(self, updated: float, now: float) -> bool:
+        """Whether an entry last updated at `updated` has outlived the TTL."""
+        return self.ttl is not None and now - updated > self.ttl
+
+
+class ExpiringDict(Generic[K, V]):
+    """A mapping bounded by a Retention policy; least recently used goes first.
+
+    Reads and writes both count as use. `on_evict(key, value)` is called for
+    every entry dropped by the policy (not for explicit pops), e.g. to spill it
+    somewhere cheaper than memory.
+    """
+
+    def __init__(
+        self,
+        retention: Retention,
+        on_evict: Callable[[K, V], None] | None = None,
+    ):
+        self.retention = retention
+        self._on_evict = on_evict
+        # key -> (value, last use), least recently used first
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Stores a value as the most recently used entry."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        self.evict()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """The value for `key` (counted as a use), or `default`."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, updated = entry
+        now = time.monotonic()
+        if self.retention.expired(updated, now):
+            self._drop(key)
+            return default
+        self._entries[key] = (value, now)
+        self._entries.move_to_end(key)
+        return value
+
+    def __getitem__(self, key: K) -> V:
+        """The value for `key`; raises KeyError if missing or expired."""
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)  # type: ignore[return-value]
+
+    def __contains__(self, key: object) -> bool:
+        """Whether `key` is stored and not expired, without counting a use."""
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and not self.retention.expired(
+            entry[1], time.monotonic()
+        )
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Removes and returns the value for `key` without calling on_evict."""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def evict(self) -> None:
+        """Applies the retention policy now."""
+        now = time.monotonic()
+        while self._entries:
+            key, (_, updated) = next(iter(self._entries.items()))
+            if not (
+                self.retention.over(len(self._entries))
+                or self.retention.expired(updated, now)
+            ):
+                break
+            self._drop(key)
+
+    def _drop(self, key: K) -> None:
+        value, _ = self._entries.pop(key)
+        if self._on_evict:
+            self._on_evict(key, value)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterates over a snapshot of the keys, least recently used first."""
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        """The number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
@@ -1,32 +1,45 @@
-import asyncio
 import base64
 import os
-import threading
+import tempfile
 import uuid
 
-from typing import cast
+from pathlib import Path
 
 import httpx
 
 from a2a.types import FilePart, FileWithUri, Message, Part
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from service.types import (
+    CancelMessageResponse,
     CreateConversationResponse,
+    Delta,
     GetEventResponse,
+    GetEventSinceResponse,
+    GetMessageStatusResponse,
+    JSONRPCError,
     ListAgentResponse,
     ListConversationResponse,
+    ListConversationSinceResponse,
     ListMessageResponse,
+    ListMessageSinceResponse,
     ListTaskResponse,
+    ListTaskSinceResponse,
     MessageInfo,
+    MessageStatus,
     PendingMessageResponse,
     RegisterAgentResponse,
     SendMessageResponse,
+    SyncParams,
 )
 
 from .adk_host_manager import ADKHostManager, get_message_id
 from .application_manager import ApplicationManager
+from .blob_store import BlobStore
+from .dispatcher import Dispatcher, QueueFullError
 from .in_memory_manager import InMemoryFakeAgentManager
+from .retention import ExpiringDict, Retention
 
 
 class ConversationServer:
@@ -54,8 +67,30 @@ class ConversationServer:
             )
         else:
             self.manager = InMemoryFakeAgentManager()
-        self._file_cache = {}  # dict[str, FilePart] maps file id to message data
-        self._message_to_cache = {}  # dict[str, str] maps message id to cache id
+        # Files evicted from memory are spilled to disk and served from there.
+        self._file_blobs = BlobStore(
+            os.environ.get(
+                'A2A_UI_BLOB_DIR',
+                Path(tempfile.gettempdir()) / 'a2a_ui_files',
+            ),
+            Retention.from_env('BLOBS', None, ttl=24 * 3600),
+        )
+        # maps file id to message data
+        self._file_cache: ExpiringDict[str, FilePart] = ExpiringDict(
+            Retention.from_env('FILE_CACHE', 256),
+            on_evict=self._file_blobs.put,
+        )
+        # maps message part id to file id
+        self._message_to_cache: ExpiringDict[str, str] = ExpiringDict(
+            Retention.from_env('FILE_IDS', 10000)
+        )
+        # Messages are processed as tasks on this event loop, a few at a time,
+        # with a bounded number waiting their turn.
+        self._dispatcher = Dispatcher(
+            workers=int(os.environ.get('A2A_UI_MESSAGE_WORKERS', '8')),
+            max_queued=int(os.environ.get('A2A_UI_MESSAGE_QUEUE_MAX', '100')),
+            retention=Retention.from_env('MESSAGE_STATUS', 10000),
+        )
 
         app.add_api_route(
             '/conversation/create', self._create_conversation, methods=['POST']
@@ -64,10 +99,29 @@ class ConversationServer:
             '/conversation/list', self._list_conversation, methods=['POST']
         )
         app.add_api_route('/message/send', self._send_message, methods=['POST'])
+        app.add_api_route(
+            '/message/status', self._message_status, methods=['POST']
+        )
+        app.add_api_route(
+            '/message/cancel', self._cancel_message, methods=['POST']
+        )
         app.add_api_route('/events/get', self._get_events, methods=['POST'])
         app.add_api_route(
             '/message/list', self._list_messages, methods=['POST']
         )
+        # Cursor-based deltas of the lists above, for clients that poll.
+        app.add_api_route(
+            '/conversation/since', self._conversations_since, methods=['POST']
+        )
+        app.add_api_route(
+            '/message/since', self._messages_since, methods=['POST']
+        )
+        app.add_api_route('/task/since', self._tasks_since, methods=['POST'])
+        app.add_api_route('/events/since', self._events_since, methods=['POST'])
+        # Server-sent events as tasks, artifacts and messages change.
+        app.add_api_route(
+            '/events/stream', self._stream_events, methods=['GET']
+        )
         app.add_api_route(
             '/message/pending', self._pending_messages, methods=['POST']
         )
@@ -96,20 +150,19 @@ class ConversationServer:
         message_data = await request.json()
         message = Message(**message_data['params'])
         message = self.manager.sanitize_message(message)
-        loop = asyncio.get_event_loop()
-        if isinstance(self.manager, ADKHostManager):
-            t = threading.Thread(
-                target=lambda: cast(
-                    'ADKHostManager', self.manager
-                ).process_message_threadsafe(message, loop)
+        try:
+            self._dispatcher.submit(
+                message.message_id,
+                lambda: self.manager.process_message(message),
             )
-        else:
-            t = threading.Thread(
-                target=lambda: asyncio.run(
-                    self.manager.process_message(message)
-                )
+        except QueueFullError as e:
+            response = SendMessageResponse(
+                error=JSONRPCError(code=-32000, message=str(e))
+            )
+            return JSONResponse(
+                status_code=429,
+                content=response.model_dump(mode='json', exclude_none=True),
             )
-        t.start()
         return SendMessageResponse(
             result=MessageInfo(
                 message_id=message.message_id,
@@ -117,6 +170,25 @@ class ConversationServer:
             )
         )
 
+    async def _message_status(
+        self, request: Request
+    ) -> GetMessageStatusResponse:
+        message_data = await request.json()
+        job = self._dispatcher.get(message_data['params'])
+        if job is None:
+            return GetMessageStatusResponse()
+        return GetMessageStatusResponse(
+            result=MessageStatus(
+                message_id=job.id, state=job.state, error=job.error
+            )
+        )
+
+    async def _cancel_message(self, request: Request) -> CancelMessageResponse:
+        message_data = await request.json()
+        return CancelMessageResponse(
+            result=self._dispatcher.cancel(message_data['params'])
+        )
+
     async def _list_messages(self, request: Request):
         message_data = await request.json()
         conversation_id = message_data['params']
@@ -137,7 +209,9 @@ class ConversationServer:
             new_parts: list[Part] = []
             for i, p in enumerate(m.parts):
                 part = p.root
-                if part.kind != 'file':
+                # Parts already referencing a url (including ones rewritten
+                # on an earlier listing) have no bytes to cache.
+                if part.kind != 'file' or isinstance(part.file, FileWithUri):
                     new_parts.append(p)
                     continue
                 message_part_id = f'{message_id}:{i}'
@@ -164,9 +238,13 @@ class ConversationServer:
         return rval
 
     async def _pending_messages(self):
-        return PendingMessageResponse(
-            result=self.manager.get_pending_messages()
+        pending = self.manager.get_pending_messages()
+        # Messages still waiting for a worker are not known to the manager.
+        pending.extend(
+            (message_id, 'Queued...')
+            for message_id in self._dispatcher.queued()
         )
+        return PendingMessageResponse(result=pending)
 
     def _list_conversation(self):
         return ListConversationResponse(result=self.manager.conversations)
@@ -177,6 +255,43 @@ class ConversationServer:
     def _list_tasks(self):
         return ListTaskResponse(result=self.manager.tasks)
 
+    async def _conversations_since(
+        self, request: Request
+    ) -> ListConversationSinceResponse:
+        params = await _sync_params(request)
+        changes = self.manager.conversations_since(params.cursor)
+        return ListConversationSinceResponse(result=Delta(**vars(changes)))
+
+    async def _messages_since(
+        self, request: Request
+    ) -> ListMessageSinceResponse:
+        params = await _sync_params(request)
+        if not params.conversation_id:
+            return ListMessageSinceResponse(result=Delta(cursor=0, reset=True))
+        changes = self.manager.messages_since(
+            params.conversation_id, params.cursor
+        )
+        changes.items = self.cache_content(changes.items)
+        return ListMessageSinceResponse(result=Delta(**vars(changes)))
+
+    async def _tasks_since(self, request: Request) -> ListTaskSinceResponse:
+        params = await _sync_params(request)
+        changes = self.manager.tasks_since(params.cursor)
+        return ListTaskSinceResponse(result=Delta(**vars(changes)))
+
+    async def _events_since(self, request: Request) -> GetEventSinceResponse:
+        params = await _sync_params(request)
+        changes = self.manager.events_since(params.cursor)
+        return GetEventSinceResponse(result=Delta(**vars(changes)))
+
+    def _stream_events(self) -> StreamingResponse:
+        return StreamingResponse(
+            self.manager.changes.stream(),
+            media_type='text/event-stream',
+            # Stop proxies from caching or buffering the stream.
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
     async def _register_agent(self, request: Request):
         message_data = await request.json()
         url = message_data['params']
@@ -187,9 +302,9 @@ class ConversationServer:
         return ListAgentResponse(result=self.manager.agents)
 
     def _files(self, file_id):
-        if file_id not in self._file_cache:
-            raise Exception('file not found')
-        part = self._file_cache[file_id]
+        part = self._file_cache.get(file_id) or self._file_blobs.get(file_id)
+        if part is None:
+            return Response(status_code=404, content='file not found')
         if 'image' in part.file.mime_type:
             return Response(
                 content=base64.b64decode(part.file.bytes),
@@ -210,3 +325,8 @@ class ConversationServer:
             return {'status': 'error', 'message': 'No API key provided'}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
+
+
+async def _sync_params(request: Request) -> SyncParams:
+    message_data = await request.json()
+    return SyncParams(**(message_data.get('params') or {}))
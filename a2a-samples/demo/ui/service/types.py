@@ -1,4 +1,4 @@
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Generic, Literal, TypeVar
 from uuid import uuid4
 
 from a2a.types import (
@@ -9,6 +9,9 @@ from a2a.types import (
 from pydantic import BaseModel, Field, TypeAdapter
 
 
+T = TypeVar('T')
+
+
 class JSONRPCMessage(BaseModel):
     jsonrpc: Literal['2.0'] = '2.0'
     id: int | str | None = Field(default_factory=lambda: uuid4().hex)
@@ -36,6 +39,9 @@ class Conversation(BaseModel):
     name: str = ''
     task_ids: list[str] = Field(default_factory=list)
     messages: list[Message] = Field(default_factory=list)
+    # Set instead of `messages` in conversation lists and deltas; the messages
+    # themselves are fetched through message/since.
+    message_ids: list[str] = Field(default_factory=list)
 
 
 class Event(BaseModel):
@@ -46,6 +52,28 @@ class Event(BaseModel):
     timestamp: float
 
 
+class SyncParams(BaseModel):
+    """Where a */since request resumes from."""
+
+    # The cursor of the last delta applied; 0 fetches everything.
+    cursor: int = 0
+    # Only for message/since: the conversation whose messages to sync
+    conversation_id: str | None = None
+
+
+class Delta(BaseModel, Generic[T]):
+    """What changed on the server after a cursor.
+
+    Pass `cursor` back to get the next delta. With `reset` set, `items` is
+    the complete list and replaces whatever the client holds.
+    """
+
+    cursor: int
+    items: list[T] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    reset: bool = False
+
+
 class SendMessageRequest(JSONRPCRequest):
     method: Literal['message/send'] = 'message/send'
     params: Message
@@ -61,6 +89,19 @@ class ListMessageResponse(JSONRPCResponse):
     result: list[Message] | None = None
 
 
+class ListMessageSinceRequest(JSONRPCRequest):
+    """Asks for one conversation's messages changed since a cursor."""
+
+    method: Literal['message/since'] = 'message/since'
+    params: SyncParams
+
+
+class ListMessageSinceResponse(JSONRPCResponse):
+    """The messages changed since the requested cursor."""
+
+    result: Delta[Message] | None = None
+
+
 class MessageInfo(BaseModel):
     message_id: str
     context_id: str
@@ -70,6 +111,43 @@ class SendMessageResponse(JSONRPCResponse):
     result: Message | MessageInfo | None = None
 
 
+class MessageStatus(BaseModel):
+    """Where a sent message is in the dispatcher."""
+
+    message_id: str
+    # queued, running, completed, failed or cancelled
+    state: str
+    error: str | None = None
+
+
+class GetMessageStatusRequest(JSONRPCRequest):
+    """Asks for the dispatch state of a sent message."""
+
+    method: Literal['message/status'] = 'message/status'
+    # This is the message id
+    params: str
+
+
+class GetMessageStatusResponse(JSONRPCResponse):
+    """The message's state, or None if it is unknown."""
+
+    result: MessageStatus | None = None
+
+
+class CancelMessageRequest(JSONRPCRequest):
+    """Asks to cancel a queued or running message."""
+
+    method: Literal['message/cancel'] = 'message/cancel'
+    # This is the message id
+    params: str
+
+
+class CancelMessageResponse(JSONRPCResponse):
+    """Whether the message was cancelled."""
+
+    result: bool | None = None
+
+
 class GetEventRequest(JSONRPCRequest):
     method: Literal['events/get'] = 'events/get'
 
@@ -78,6 +156,19 @@ class GetEventResponse(JSONRPCResponse):
     result: list[Event] | None = None
 
 
+class GetEventSinceRequest(JSONRPCRequest):
+    """Asks for the events added since a cursor."""
+
+    method: Literal['events/since'] = 'events/since'
+    params: SyncParams = Field(default_factory=SyncParams)
+
+
+class GetEventSinceResponse(JSONRPCResponse):
+    """The events added since the requested cursor."""
+
+    result: Delta[Event] | None = None
+
+
 class ListConversationRequest(JSONRPCRequest):
     method: Literal['conversation/list'] = 'conversation/list'
 
@@ -86,6 +177,19 @@ class ListConversationResponse(JSONRPCResponse):
     result: list[Conversation] | None = None
 
 
+class ListConversationSinceRequest(JSONRPCRequest):
+    """Asks for the conversations changed since a cursor."""
+
+    method: Literal['conversation/since'] = 'conversation/since'
+    params: SyncParams = Field(default_factory=SyncParams)
+
+
+class ListConversationSinceResponse(JSONRPCResponse):
+    """The conversations changed since the cursor, with message ids only."""
+
+    result: Delta[Conversation] | None = None
+
+
 class PendingMessageRequest(JSONRPCRequest):
     method: Literal['message/pending'] = 'message/pending'
 
@@ -110,6 +214,19 @@ class ListTaskResponse(JSONRPCResponse):
     result: list[Task] | None = None
 
 
+class ListTaskSinceRequest(JSONRPCRequest):
+    """Asks for the tasks changed since a cursor."""
+
+    method: Literal['task/since'] = 'task/since'
+    params: SyncParams = Field(default_factory=SyncParams)
+
+
+class ListTaskSinceResponse(JSONRPCResponse):
+    """The tasks changed since the requested cursor."""
+
+    result: Delta[Task] | None = None
+
+
 class RegisterAgentRequest(JSONRPCRequest):
     method: Literal['agent/register'] = 'agent/register'
     # This is the base url of the agent card
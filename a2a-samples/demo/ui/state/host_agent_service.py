@@ -1,26 +1,33 @@
 import json
 import os
 import sys
+import threading
 import traceback
 import uuid
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from a2a.types import FileWithBytes, Message, Part, Role, Task, TaskState
 from service.client.client import ConversationClient
 from service.types import (
     Conversation,
     CreateConversationRequest,
+    Delta,
     Event,
-    GetEventRequest,
+    GetEventSinceRequest,
     ListAgentRequest,
     ListConversationRequest,
+    ListConversationSinceRequest,
     ListMessageRequest,
+    ListMessageSinceRequest,
     ListTaskRequest,
+    ListTaskSinceRequest,
     MessageInfo,
     PendingMessageRequest,
     RegisterAgentRequest,
     SendMessageRequest,
+    SyncParams,
 )
 
 from .state import (
@@ -35,6 +42,15 @@ from .state import (
 
 server_url = 'http://localhost:12000'
 
+T = TypeVar('T')
+S = TypeVar('S')
+
+# The event log is the same for every session, so one copy per process is kept
+# in sync with the server.
+_events: dict[str, Event] = {}
+_events_cursor = 0
+_events_lock = threading.Lock()
+
 
 async def ListConversations() -> list[Conversation]:
     client = ConversationClient(server_url)
@@ -89,13 +105,32 @@ async def AddRemoteAgent(path: str):
 
 
 async def GetEvents() -> list[Event]:
+    """All events, fetching only those newer than the last call."""
+    global _events_cursor
+    delta = await GetEventsSince(_events_cursor)
+    with _events_lock:
+        # A concurrent call may already have applied a newer delta.
+        if delta and (delta.reset or delta.cursor >= _events_cursor):
+            merged = apply_delta(
+                list(_events.values()), delta, lambda e: e, lambda e: e.id
+            )
+            _events.clear()
+            _events.update((e.id, e) for e in merged)
+            _events_cursor = delta.cursor
+        return sorted(_events.values(), key=lambda e: e.timestamp)
+
+
+async def GetEventsSince(cursor: int) -> Delta[Event] | None:
+    """Events added after `cursor`, or None if the server could not be reached."""
     client = ConversationClient(server_url)
     try:
-        response = await client.get_events(GetEventRequest())
-        return response.result if response.result else []
+        response = await client.get_events_since(
+            GetEventSinceRequest(params=SyncParams(cursor=cursor))
+        )
+        return response.result
     except Exception as e:
         print('Failed to get events', e)
-    return []
+    return None
 
 
 async def GetProcessingMessages():
@@ -133,32 +168,114 @@ async def ListMessages(conversation_id: str) -> list[Message]:
     return []
 
 
+async def ListConversationsSince(cursor: int) -> Delta[Conversation] | None:
+    """Conversations changed after `cursor`, or None on failure."""
+    client = ConversationClient(server_url)
+    try:
+        response = await client.list_conversations_since(
+            ListConversationSinceRequest(params=SyncParams(cursor=cursor))
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to list conversations: ', e)
+    return None
+
+
+async def ListMessagesSince(
+    conversation_id: str, cursor: int
+) -> Delta[Message] | None:
+    """One conversation's messages changed after `cursor`, or None on failure."""
+    client = ConversationClient(server_url)
+    try:
+        response = await client.list_messages_since(
+            ListMessageSinceRequest(
+                params=SyncParams(
+                    cursor=cursor, conversation_id=conversation_id
+                )
+            )
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to list messages ', e)
+    return None
+
+
+async def GetTasksSince(cursor: int) -> Delta[Task] | None:
+    """Tasks changed after `cursor`, or None on failure."""
+    client = ConversationClient(server_url)
+    try:
+        response = await client.list_tasks_since(
+            ListTaskSinceRequest(params=SyncParams(cursor=cursor))
+        )
+        return response.result
+    except Exception as e:
+        print('Failed to list tasks ', e)
+    return None
+
+
+def apply_delta(
+    current: list[S],
+    delta: Delta[T],
+    convert: Callable[[T], S],
+    key: Callable[[S], str],
+) -> list[S]:
+    """Merges a delta into a state list.
+
+    Changed entries are replaced where they are and new ones appended, so only
+    the delta is converted. The list is returned as is if nothing changed.
+    """
+    if delta.reset:
+        return [convert(x) for x in delta.items]
+    if not delta.items and not delta.removed:
+        return current
+    removed = set(delta.removed)
+    merged = {key(x): x for x in current if key(x) not in removed}
+    for item in delta.items:
+        converted = convert(item)
+        merged[key(converted)] = converted
+    return list(merged.values())
+
+
 async def UpdateAppState(state: AppState, conversation_id: str):
-    """Update the app state."""
+    """Update the app state with what changed since the last update."""
     try:
         if conversation_id:
             state.current_conversation_id = conversation_id
-            messages = await ListMessages(conversation_id)
-            if not messages:
-                state.messages = []
-            else:
-                state.messages = [convert_message_to_state(x) for x in messages]
-        conversations = await ListConversations()
-        if not conversations:
-            state.conversations = []
-        else:
-            state.conversations = [
-                convert_conversation_to_state(x) for x in conversations
-            ]
-
-        state.task_list = []
-        for task in await GetTasks():
-            state.task_list.append(
-                SessionTask(
+            if state.messages_conversation_id != conversation_id:
+                state.messages_conversation_id = conversation_id
+                state.messages_cursor = 0
+            messages = await ListMessagesSince(
+                conversation_id, state.messages_cursor
+            )
+            if messages:
+                state.messages = apply_delta(
+                    state.messages or [],
+                    messages,
+                    convert_message_to_state,
+                    lambda x: x.message_id,
+                )
+                state.messages_cursor = messages.cursor
+        conversations = await ListConversationsSince(state.conversations_cursor)
+        if conversations:
+            state.conversations = apply_delta(
+                state.conversations or [],
+                conversations,
+                convert_conversation_to_state,
+                lambda x: x.conversation_id,
+            )
+            state.conversations_cursor = conversations.cursor
+        tasks = await GetTasksSince(state.tasks_cursor)
+        if tasks:
+            state.task_list = apply_delta(
+                state.task_list,
+                tasks,
+                lambda task: SessionTask(
                     context_id=extract_conversation_id(task),
                     task=convert_task_to_state(task),
-                )
+                ),
+                lambda x: x.task.task_id,
             )
+            state.tasks_cursor = tasks.cursor
         state.background_tasks = await GetProcessingMessages()
         state.message_aliases = GetMessageAliases()
     except Exception as e:
@@ -206,7 +323,8 @@ def convert_conversation_to_state(
         conversation_id=conversation.conversation_id,
         conversation_name=conversation.name,
         is_active=conversation.is_active,
-        message_ids=[extract_message_id(x) for x in conversation.messages],
+        message_ids=conversation.message_ids
+        or [extract_message_id(x) for x in conversation.messages],
     )
 
 
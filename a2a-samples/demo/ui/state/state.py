@@ -89,6 +89,12 @@ class AppState:
     # This is used to track the message sent to agent with form data
     form_responses: dict[str, str] = dataclasses.field(default_factory=dict)
     polling_interval: int = 1
+    # Sync cursors: each refresh only fetches what changed after these.
+    conversations_cursor: int = 0
+    tasks_cursor: int = 0
+    messages_cursor: int = 0
+    # The conversation that `messages` and `messages_cursor` belong to
+    messages_conversation_id: str = ''
 
     # Added for API key management
     api_key: str = ''
@@ -1,6 +1,16 @@
+import asyncio
+import base64
 import unittest
 
-from a2a.types import DataPart, FilePart, TextPart
+from a2a.types import (
+    DataPart,
+    FilePart,
+    FileWithBytes,
+    Message,
+    Part,
+    Role,
+    TextPart,
+)
 from google.genai import types
 from service.server.adk_host_manager import ADKHostManager
 
@@ -198,6 +208,39 @@ class ADKHostManagerTest(unittest.TestCase):
             message.parts[2], DataPart, 'Third part should be DataPart'
         )
 
+    def test_conversation_delta_carries_message_ids(self) -> None:
+        """Test a conversation delta lists new message ids, not the messages."""
+        conversation = asyncio.run(self.manager.create_conversation())
+        cursor = self.manager.conversations_since(0).cursor
+        message = Message(
+            message_id='m1',
+            context_id=conversation.conversation_id,
+            role=Role.user,
+            parts=[
+                Part(
+                    root=FilePart(
+                        file=FileWithBytes(
+                            bytes=base64.b64encode(b'x' * 100_000).decode(),
+                            mime_type='image/png',
+                        )
+                    )
+                )
+            ],
+        )
+        # What process_message does with an incoming message.
+        self.manager._messages.put(message)  # noqa: SLF001
+        self.manager._touch_conversation(  # noqa: SLF001
+            conversation.conversation_id
+        )
+
+        changes = self.manager.conversations_since(cursor)
+        self.assertEqual(len(changes.items), 1)
+        self.assertEqual(changes.items[0].message_ids, ['m1'])
+        self.assertEqual(changes.items[0].messages, [])
+        self.assertLess(len(changes.items[0].model_dump_json()), 1000)
+        delta = self.manager.messages_since(conversation.conversation_id, 0)
+        self.assertEqual([m.message_id for m in delta.items], ['m1'])
+
 
 if __name__ == '__main__':
     unittest.main()
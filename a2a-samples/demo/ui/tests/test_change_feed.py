@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import unittest
+
+from pydantic import BaseModel
+from service.server import change_feed
+from service.server.change_feed import ChangeFeed
+
+
+class Payload(BaseModel):
+    id: str
+    note: str | None = None
+
+
+class ChangeFeedTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the server-sent event feed behind /events/stream."""
+
+    async def asyncSetUp(self) -> None:  # noqa: N802
+        """Set up a feed with one open stream."""
+        self.feed = ChangeFeed()
+        self.stream = self.feed.stream()
+        self.assertEqual(await anext(self.stream), ': connected\n\n')
+
+    async def asyncTearDown(self) -> None:  # noqa: N802
+        """Close the stream."""
+        await self.stream.aclose()
+
+    async def test_publish(self) -> None:
+        """Published payloads arrive as named events, in order."""
+        self.feed.publish('task', Payload(id='t1'))
+        self.feed.publish('message', Payload(id='m1', note='hi'))
+        self.assertEqual(
+            await anext(self.stream), 'event: task\ndata: {"id":"t1"}\n\n'
+        )
+        self.assertEqual(
+            await anext(self.stream),
+            'event: message\ndata: {"id":"m1","note":"hi"}\n\n',
+        )
+
+    async def test_publish_from_another_thread(self) -> None:
+        """Payloads published off the stream's event loop are delivered."""
+        thread = threading.Thread(
+            target=lambda: asyncio.run(
+                self._publish_async('status-update', Payload(id='t1'))
+            )
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(
+            await asyncio.wait_for(anext(self.stream), 1),
+            'event: status-update\ndata: {"id":"t1"}\n\n',
+        )
+
+    async def _publish_async(self, kind: str, payload: Payload) -> None:
+        self.feed.publish(kind, payload)
+
+    async def test_overflow_resyncs(self) -> None:
+        """A stream that falls too far behind is told to resync instead."""
+        for i in range(change_feed.QUEUE_SIZE + 1):
+            self.feed.publish('task', Payload(id=f't{i}'))
+        self.assertEqual(
+            await anext(self.stream), 'event: resync\ndata: {}\n\n'
+        )
+
+    async def test_keepalive_and_unsubscribe(self) -> None:
+        """Idle streams send comments and leave the feed once closed."""
+        stream = self.feed.stream(keepalive=0.01)
+        await anext(stream)
+        self.assertEqual(len(self.feed), 2)
+        self.assertEqual(await anext(stream), ': keepalive\n\n')
+        await stream.aclose()
+        self.assertEqual(len(self.feed), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
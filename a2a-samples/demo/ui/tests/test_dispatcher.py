@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+
+from service.server.dispatcher import Dispatcher, QueueFullError
+
+
+class DispatcherTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the bounded message dispatcher behind /message/send."""
+
+    async def asyncSetUp(self) -> None:  # noqa: N802
+        """Set up a dispatcher with two workers and room for two waiting."""
+        self.dispatcher = Dispatcher(workers=2, max_queued=2)
+        self.release = asyncio.Event()
+        self.started: list[str] = []
+
+    def _job(self, job_id: str):
+        async def work() -> None:
+            self.started.append(job_id)
+            await self.release.wait()
+
+        return self.dispatcher.submit(job_id, work)
+
+    async def test_bounded_concurrency(self) -> None:
+        """Only `workers` jobs run at once; the rest wait in order."""
+        jobs = [self._job(f'm{i}') for i in range(4)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, ['m0', 'm1'])
+        self.assertEqual(self.dispatcher.running(), ['m0', 'm1'])
+        self.assertEqual(self.dispatcher.queued(), ['m2', 'm3'])
+        self.release.set()
+        await asyncio.gather(*(job.task for job in jobs))
+        await asyncio.sleep(0)
+        self.assertEqual(self.started, ['m0', 'm1', 'm2', 'm3'])
+        self.assertEqual(self.dispatcher.get('m3').state, 'completed')
+        self.assertEqual(self.dispatcher.running(), [])
+
+    async def test_queue_limit(self) -> None:
+        """Submissions beyond the queue limit are refused."""
+        for i in range(4):
+            self._job(f'm{i}')
+        with self.assertRaises(QueueFullError):
+            self._job('m4')
+        self.assertIsNone(self.dispatcher.get('m4'))
+        # A pending id is not queued twice.
+        self.assertIs(self._job('m3'), self.dispatcher.get('m3'))
+
+    async def test_cancel(self) -> None:
+        """Queued and running jobs can be cancelled by id."""
+        jobs = [self._job(f'm{i}') for i in range(3)]
+        await asyncio.sleep(0)
+        self.assertTrue(self.dispatcher.cancel('m0'))
+        self.assertTrue(self.dispatcher.cancel('m2'))
+        await asyncio.sleep(0)
+        self.release.set()
+        await asyncio.gather(
+            *(job.task for job in jobs), return_exceptions=True
+        )
+        await asyncio.sleep(0)
+        self.assertEqual(self.dispatcher.get('m0').state, 'cancelled')
+        self.assertEqual(self.dispatcher.get('m1').state, 'completed')
+        self.assertEqual(self.dispatcher.get('m2').state, 'cancelled')
+        self.assertEqual(self.started, ['m0', 'm1'])
+        self.assertFalse(self.dispatcher.cancel('m0'))
+        self.assertFalse(self.dispatcher.cancel('unknown'))
+
+    async def test_failure(self) -> None:
+        """A job that raises is marked failed with its error."""
+
+        async def work() -> None:
+            raise ValueError('boom')
+
+        with self.assertLogs('service.server.dispatcher', 'ERROR') as logs:
+            job = self.dispatcher.submit('m0', work)
+            await asyncio.gather(job.task, return_exceptions=True)
+            await asyncio.sleep(0)
+        self.assertIn('ValueError: boom', logs.output[0])
+        self.assertEqual(self.dispatcher.get('m0').state, 'failed')
+        self.assertEqual(self.dispatcher.get('m0').error, 'boom')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from dataclasses import dataclass
+
+from service.server import indexed_store
+from service.server.indexed_store import IndexedStore
+from service.server.retention import Retention
+
+
+@dataclass
+class Item:
+    id: str
+    context_id: str | None = None
+    value: int = 0
+
+
+class IndexedStoreTest(unittest.TestCase):
+    """Tests for the id and group indexes behind the host managers."""
+
+    def setUp(self) -> None:
+        """Set up a store indexed by id and grouped by context id."""
+        self.store = IndexedStore(
+            key=lambda x: x.id, group=lambda x: x.context_id
+        )
+
+    def test_put_and_get(self) -> None:
+        """Items are found by id and listed in insertion order."""
+        for i in range(3):
+            self.store.put(Item(id=f't{i}', context_id='c'))
+        self.assertEqual(self.store.get('t1').id, 't1')
+        self.assertIsNone(self.store.get('missing'))
+        self.assertIsNone(self.store.get(None))
+        self.assertEqual([x.id for x in self.store], ['t0', 't1', 't2'])
+        self.assertEqual(len(self.store), 3)
+        self.assertIn('t2', self.store)
+
+    def test_put_replaces_in_place(self) -> None:
+        """Replacing an item keeps its position and does not duplicate it."""
+        self.store.put(Item(id='a', context_id='c'))
+        self.store.put(Item(id='b', context_id='c'))
+        self.store.put(Item(id='a', context_id='c', value=1))
+        self.assertEqual(
+            [(x.id, x.value) for x in self.store.values()], [('a', 1), ('b', 0)]
+        )
+        self.assertEqual([x.id for x in self.store.in_group('c')], ['a', 'b'])
+
+    def test_groups(self) -> None:
+        """Items are listed per group, and moved when their group changes."""
+        self.store.put(Item(id='a', context_id='c1'))
+        self.store.put(Item(id='b', context_id='c2'))
+        self.store.put(Item(id='c', context_id='c1'))
+        self.store.put(Item(id='d'))
+        self.assertEqual([x.id for x in self.store.in_group('c1')], ['a', 'c'])
+        self.store.put(Item(id='a', context_id='c2'))
+        self.assertEqual([x.id for x in self.store.in_group('c1')], ['c'])
+        self.assertEqual([x.id for x in self.store.in_group('c2')], ['b', 'a'])
+        self.assertEqual(self.store.in_group(None), [])
+        self.assertEqual(self.store.in_group('unknown'), [])
+
+    def test_remove(self) -> None:
+        """Removed items disappear from both indexes."""
+        self.store.put(Item(id='a', context_id='c'))
+        self.assertEqual(self.store.remove('a').id, 'a')
+        self.assertIsNone(self.store.remove('a'))
+        self.assertNotIn('a', self.store)
+        self.assertEqual(self.store.in_group('c'), [])
+
+    def test_without_group(self) -> None:
+        """A store without a group function only indexes by id."""
+        store = IndexedStore(key=lambda x: x.id)
+        store.put(Item(id='a', context_id='c'))
+        self.assertEqual(store.in_group('c'), [])
+        self.assertEqual(store.get('a').context_id, 'c')
+
+    def test_retention_evicts(self) -> None:
+        """Items beyond the limit are evicted and reported to on_evict."""
+        evicted: list[str] = []
+        store = IndexedStore(
+            key=lambda x: x.id,
+            retention=Retention(max_items=2),
+            on_evict=lambda x: evicted.append(x.id),
+        )
+        for i in range(3):
+            store.put(Item(id=f't{i}'))
+        self.assertEqual([x.id for x in store], ['t1', 't2'])
+        self.assertEqual(evicted, ['t0'])
+        store.remove('t1')
+        self.assertEqual(evicted, ['t0'])
+
+    def test_changed_since(self) -> None:
+        """A cursor yields only the items put and removed after it."""
+        self.store.put(Item(id='a', context_id='c1'))
+        self.store.put(Item(id='b', context_id='c2'))
+        cursor = self.store.changed_since(0).cursor
+        self.assertEqual(self.store.changed_since(cursor).items, [])
+        self.store.put(Item(id='a', context_id='c1', value=1))
+        self.store.put(Item(id='c', context_id='c1'))
+        self.store.remove('b')
+        changes = self.store.changed_since(cursor)
+        self.assertFalse(changes.reset)
+        self.assertEqual(
+            [(x.id, x.value) for x in changes.items], [('a', 1), ('c', 0)]
+        )
+        self.assertEqual(changes.removed, ['b'])
+        grouped = self.store.changed_since(cursor, group='c2')
+        self.assertEqual((grouped.items, grouped.removed), ([], ['b']))
+        self.assertGreater(changes.cursor, cursor)
+        latest = self.store.changed_since(changes.cursor)
+        self.assertEqual((latest.items, latest.removed), ([], []))
+        self.assertEqual(latest.cursor, changes.cursor)
+
+    def test_changed_since_resets_unknown_cursors(self) -> None:
+        """Cursors the store cannot answer get the whole store back."""
+        self.store.put(Item(id='a', context_id='c'))
+        for cursor in (0, self.store.cursor + 1):
+            changes = self.store.changed_since(cursor)
+            self.assertTrue(changes.reset)
+            self.assertEqual([x.id for x in changes.items], ['a'])
+        cursor = self.store.cursor
+        for i in range(indexed_store.TOMBSTONES + 1):
+            self.store.put(Item(id=f't{i}'))
+            self.store.remove(f't{i}')
+        changes = self.store.changed_since(cursor)
+        self.assertTrue(changes.reset)
+        self.assertEqual([x.id for x in changes.items], ['a'])
+        self.assertFalse(self.store.changed_since(changes.cursor).reset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import unittest
+
+from unittest import mock
+
+from service.server.indexed_store import IndexedStore
+from service.server.retention import ExpiringDict, Retention
+
+
+class RetentionTest(unittest.TestCase):
+    """Tests for the retention policies bounding the server's memory."""
+
+    def test_from_env(self) -> None:
+        """Environment variables override the defaults; 0 means unlimited."""
+        with mock.patch.dict(
+            os.environ,
+            {'A2A_UI_TASKS_MAX': '5', 'A2A_UI_TASKS_TTL_SECONDS': '0'},
+        ):
+            retention = Retention.from_env('TASKS', 100, ttl=60)
+        self.assertEqual(retention, Retention(max_items=5, ttl=None))
+        self.assertEqual(
+            Retention.from_env('UNSET', 100, ttl=60),
+            Retention(max_items=100, ttl=60),
+        )
+
+    def test_expiring_dict_evicts_least_recently_used(self) -> None:
+        """Beyond max_items the least recently used entry is evicted."""
+        evicted = []
+        d = ExpiringDict(
+            Retention(max_items=2),
+            on_evict=lambda k, v: evicted.append((k, v)),
+        )
+        d['a'] = 1
+        d['b'] = 2
+        self.assertEqual(d['a'], 1)  # 'b' is now the least recently used
+        d['c'] = 3
+        self.assertEqual(evicted, [('b', 2)])
+        self.assertNotIn('b', d)
+        self.assertEqual(sorted(d), ['a', 'c'])
+        self.assertEqual(d.pop('a'), 1)
+        self.assertEqual(evicted, [('b', 2)], 'pop is not an eviction')
+
+    def test_expiring_dict_ttl(self) -> None:
+        """Entries not used within the TTL are gone."""
+        evicted = []
+        d = ExpiringDict(
+            Retention(ttl=10), on_evict=lambda k, v: evicted.append(k)
+        )
+        with mock.patch('time.monotonic', return_value=100.0):
+            d['a'] = 1
+        with mock.patch('time.monotonic', return_value=105.0):
+            self.assertIn('a', d)
+        with mock.patch('time.monotonic', return_value=111.0):
+            self.assertNotIn('a', d)
+            self.assertIsNone(d.get('a'))
+            with self.assertRaises(KeyError):
+                d['a']
+        self.assertEqual(evicted, ['a'])
+
+    def test_indexed_store_max_items(self) -> None:
+        """The least recently updated items are evicted from every index."""
+        store = IndexedStore(
+            key=lambda x: x[0],
+            group=lambda x: x[1],
+            retention=Retention(max_items=2),
+        )
+        store.put(('a', 'c'))
+        store.put(('b', 'c'))
+        store.put(('a', 'c'))
+        store.put(('d', 'c'))
+        self.assertEqual([x[0] for x in store.values()], ['a', 'd'])
+        self.assertEqual([x[0] for x in store.in_group('c')], ['a', 'd'])
+        self.assertIsNone(store.get('b'))
+
+    def test_indexed_store_ttl(self) -> None:
+        """Items not updated within the TTL are evicted when next read."""
+        store = IndexedStore(key=lambda x: x, retention=Retention(ttl=10))
+        with mock.patch('time.monotonic', return_value=100.0):
+            store.put('a')
+        with mock.patch('time.monotonic', return_value=105.0):
+            store.put('b')
+        with mock.patch('time.monotonic', return_value=112.0):
+            self.assertIsNone(store.get('a'))
+            self.assertEqual(store.values(), ['b'])
+        with mock.patch('time.monotonic', return_value=120.0):
+            self.assertEqual(store.values(), [])
+            self.assertEqual(len(store), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
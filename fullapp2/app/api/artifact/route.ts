@@ -1,7 +1,7 @@
 import { NextRequest } from "next/server";
 import { NextResponse } from "next/server";
-import { createReadStream, statSync } from "fs";
-import { basename } from "path";
+import { createReadStream, realpathSync, statSync } from "fs";
+import { basename, dirname, join } from "path";
 import { readFile as readFileCb } from "fs";
 import { promisify } from "util";
 
@@ -54,6 +54,27 @@ function sanitizeHtmlStrayFences(html: string): string {
   return out;
 }
 
+// Decks stored by the slAIde artifact store are named by their content hash and were
+// cleaned once when generated, so they are streamed as-is and cached forever. Only
+// files in the store's directory (the server's SLAIDE_ARTIFACT_DIR) qualify; any other
+// <hash>.html is treated like any other HTML file.
+const STORED_ARTIFACT = /^([0-9a-f]{32})\.html$/;
+const ARTIFACT_DIR =
+  process.env.SLAIDE_ARTIFACT_DIR || join(process.cwd(), "..", "slAIde", ".artifacts");
+
+// Returns the artifact id when `path` is a deck in the artifact store, else null.
+function storedArtifactId(path: string): string | null {
+  const match = STORED_ARTIFACT.exec(basename(path));
+  if (!match) return null;
+  try {
+    // Resolved, so "..", symlinks and relative paths cannot fake the directory.
+    if (dirname(realpathSync(path)) !== realpathSync(ARTIFACT_DIR)) return null;
+  } catch {
+    return null;
+  }
+  return match[1];
+}
+
 // Streams an artifact (HTML or PDF) from disk to the client.
 // Accepts either ?path=/absolute/path or an inline POST/JSON { html } for HTML-only responses.
 export async function GET(req: NextRequest) {
@@ -83,6 +104,19 @@ export async function GET(req: NextRequest) {
       return new NextResponse(stream as any, { headers });
     }
 
+    const artifactId = storedArtifactId(path);
+    if (artifactId) {
+      const etag = `"${artifactId}"`;
+      headers.set("ETag", etag);
+      headers.set("Cache-Control", "public, max-age=31536000, immutable");
+      if (req.headers.get("if-none-match")?.split(",").some((t) => t.trim() === etag)) {
+        return new NextResponse(null, { status: 304, headers });
+      }
+      headers.set("Content-Type", "text/html; charset=utf-8");
+      headers.set("Content-Length", String(stats.size));
+      return new NextResponse(createReadStream(path) as any, { headers });
+    }
+
     if (isHtml) {
       // Read and sanitize stray fence markers without altering scripts
       let text = await readFile(path, { encoding: "utf-8" });
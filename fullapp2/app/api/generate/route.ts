@@ -84,6 +84,14 @@ export async function POST(req: NextRequest) {
     // Summary case: pdf path
     const pdfPath = data?.pdf_path || data?.pdf || data?.path_pdf;
 
+    // An artifact id comes with the html_path of the deck the artifact store wrote
+    // atomically (temp file + rename), so that one file is complete as soon as it is
+    // returned. Any other path (a PDF, or HTML under another key) is still polled.
+    const storedHtmlPath =
+      typeof data?.artifact_id === "string" && typeof data?.html_path === "string"
+        ? data.html_path
+        : null;
+
     if (pdfPath && typeof pdfPath === "string") {
       // Wait for PDF file to be fully written
       await waitForStableFile(pdfPath, { kind: "pdf" });
@@ -92,7 +100,9 @@ export async function POST(req: NextRequest) {
 
     if (htmlPath && typeof htmlPath === "string") {
       // Wait for HTML file to be fully written and complete
-      await waitForStableFile(htmlPath, { kind: "html" });
+      if (htmlPath !== storedHtmlPath) {
+        await waitForStableFile(htmlPath, { kind: "html" });
+      }
       return NextResponse.json({ kind: "html", filePath: htmlPath });
     }
 
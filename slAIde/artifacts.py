@@ -0,0 +1,111 @@
+"""Content-addressed deck storage with completion signaling.
+
+Decks are written atomically (temp file + rename) as <root>/<artifact_id>.html, where
+the id is a hash of the HTML, so a path that exists always holds a complete deck.
+Generations started through a Job report completion via `Job.wait()` instead of
+consumers polling the file system.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+
+# Finished jobs kept for status lookups; the oldest are forgotten beyond this.
+MAX_TRACKED_JOBS = 1024
+
+
+def write_atomic(path, text):
+    """Writes `text` (str or bytes) to `path` so readers only ever see the old file or the complete new one."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") if isinstance(text, bytes) else os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ArtifactStore:
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def artifact_id(html):
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()[:32]
+
+    def path(self, artifact_id):
+        if not artifact_id.isalnum():
+            raise KeyError(artifact_id)
+        return os.path.join(self.root, f"{artifact_id}.html")
+
+    def put(self, html):
+        """Stores a deck and returns its id; storing the same deck twice is a no-op."""
+        artifact_id = self.artifact_id(html)
+        path = self.path(artifact_id)
+        if not os.path.exists(path):
+            write_atomic(path, html)
+        return artifact_id
+
+    def exists(self, artifact_id):
+        try:
+            return os.path.exists(self.path(artifact_id))
+        except KeyError:
+            return False
+
+
+class Job:
+    """One background generation; `wait()` resolves once its artifact is stored or it fails."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = "running"
+        self.artifact_id = None
+        self.error = None
+        self.usage = None
+        self._done = asyncio.Event()
+
+    def finish(self, artifact_id=None, error=None, usage=None):
+        self.status = "error" if error else "done"
+        self.artifact_id, self.error, self.usage = artifact_id, error, usage
+        self._done.set()
+
+    async def wait(self, timeout=None):
+        """Waits up to `timeout` seconds for completion and returns whether the job finished."""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._done.is_set()
+
+    def to_dict(self):
+        return {"job_id": self.id, "status": self.status, "artifact_id": self.artifact_id,
+                "error": self.error, "usage": self.usage}
+
+
+class JobRegistry:
+    def __init__(self):
+        self._jobs = OrderedDict()
+        # Strong references so running job tasks are not garbage collected.
+        self._tasks = set()
+
+    def start(self, coro_factory):
+        """Runs `coro_factory(job)` in the background and returns the new Job."""
+        job = Job()
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_TRACKED_JOBS:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.status == "running":
+                break
+            self._jobs.popitem(last=False)
+        task = asyncio.create_task(coro_factory(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
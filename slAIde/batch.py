@@ -0,0 +1,185 @@
+"""Generates decks for every prompt in a JSONL file.
+
+    python batch.py transcripts.jsonl --out decks/ --parallelism 4 --rpm 30
+
+Each input line is {"id": "...", "prompt": "...", "prompt_variant": "..."} ("id" and
+"prompt_variant" are optional; ids must stay distinct once made file-safe). Decks are
+written to <out>/<id>.html and one result line per item is appended to
+<out>/manifest.jsonl. Re-running with the same --out skips items the manifest already
+records as done.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+from google.genai import errors
+
+from artifacts import write_atomic
+from runtime import generate
+
+logger = logging.getLogger("batch")
+
+MANIFEST = "manifest.jsonl"
+
+
+class Pacer:
+    """Spaces request starts to stay under a requests-per-minute budget.
+
+    A rate-limit error pushes every later start back by the backoff it asks for.
+    """
+
+    def __init__(self, rpm):
+        self.interval = 60.0 / rpm if rpm else 0.0
+        self.next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            delay = self.next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.next_start = max(self.next_start, time.monotonic()) + self.interval
+
+    def back_off(self, seconds):
+        self.next_start = max(self.next_start, time.monotonic() + seconds)
+
+
+def is_rate_limited(error):
+    if isinstance(error, errors.APIError) and error.code == 429:
+        return True
+    return "RESOURCE_EXHAUSTED" in str(error)
+
+
+def item_id(line_number, item):
+    raw = str(item.get("id") or "")
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", raw).strip("._")
+    if safe:
+        return safe
+    digest = hashlib.sha256(item["prompt"].encode("utf-8")).hexdigest()[:12]
+    return f"{line_number:05d}-{digest}"
+
+
+def load_items(path):
+    """Reads the input file, rejecting items whose decks would overwrite each other."""
+    items = []
+    seen = {}
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if isinstance(item, str):
+                item = {"prompt": item}
+            if not item.get("prompt"):
+                raise ValueError(f"{path}:{line_number}: missing \"prompt\"")
+            safe_id = item_id(line_number, item)
+            # Case-folded, since <id>.html may land on a case-insensitive filesystem.
+            first = seen.setdefault(safe_id.casefold(), (line_number, safe_id))
+            if first[0] != line_number:
+                raise ValueError(
+                    f"{path}:{line_number}: id {item.get('id')!r} would overwrite {first[1]}.html "
+                    f"from line {first[0]}"
+                )
+            items.append(dict(item, id=safe_id))
+    return items
+
+
+def completed_ids(out_dir):
+    """Ids the manifest records as done whose deck file is still present."""
+    done = set()
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted run.
+                    continue
+                if entry.get("status") == "ok" and os.path.exists(os.path.join(out_dir, entry.get("html_path", ""))):
+                    done.add(entry["id"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+async def run_item(item, out_dir, pacer, retries):
+    started = time.monotonic()
+    entry = {"id": item["id"], "status": "error", "attempts": 0}
+    for attempt in range(retries + 1):
+        await pacer.wait()
+        entry["attempts"] = attempt + 1
+        try:
+            state = await generate(item["prompt"], item.get("prompt_variant"))
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+            if attempt == retries:
+                break
+            backoff = min(60.0, 2.0 ** attempt * 5)
+            if is_rate_limited(e):
+                pacer.back_off(backoff)
+            else:
+                await asyncio.sleep(backoff / 5)
+            logger.warning("%s: attempt %d failed (%s), retrying", item["id"], attempt + 1, entry["error"])
+            continue
+        html = state.get("final_html")
+        entry["usage"] = state.get("usage")
+        if not html:
+            entry["error"] = "pipeline produced no final_html"
+            break
+        html_path = f"{item['id']}.html"
+        write_atomic(os.path.join(out_dir, html_path), html)
+        entry.update(status="ok", html_path=html_path, error=None)
+        break
+    entry["latency_s"] = round(time.monotonic() - started, 3)
+    return entry
+
+
+async def run_batch(items, out_dir, parallelism=4, rpm=0, retries=3):
+    os.makedirs(out_dir, exist_ok=True)
+    done = completed_ids(out_dir)
+    pending = [item for item in items if item["id"] not in done]
+    logger.info("%d items, %d already done, %d to run", len(items), len(items) - len(pending), len(pending))
+
+    pacer = Pacer(rpm)
+    semaphore = asyncio.Semaphore(max(1, parallelism))
+    summary = {"ok": 0, "error": 0, "skipped": len(items) - len(pending)}
+
+    with open(os.path.join(out_dir, MANIFEST), "a", encoding="utf-8") as manifest:
+        async def worker(item):
+            async with semaphore:
+                entry = await run_item(item, out_dir, pacer, retries)
+            entry["finished_at"] = time.time()
+            manifest.write(json.dumps(entry) + "\n")
+            manifest.flush()
+            summary[entry["status"]] += 1
+            logger.info("%s: %s in %.1fs", item["id"], entry["status"], entry["latency_s"])
+
+        await asyncio.gather(*(worker(item) for item in pending))
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate slide decks for a JSONL file of prompts.")
+    parser.add_argument("input", help="JSONL file, one {\"prompt\": ...} object per line")
+    parser.add_argument("--out", required=True, help="directory for <id>.html decks and manifest.jsonl")
+    parser.add_argument("--parallelism", type=int, default=4, help="decks generated at once (default: 4)")
+    parser.add_argument("--rpm", type=float, default=0, help="max pipeline starts per minute, 0 for no limit")
+    parser.add_argument("--retries", type=int, default=3, help="retries per item after a failure (default: 3)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    summary = asyncio.run(
+        run_batch(load_items(args.input), args.out, args.parallelism, args.rpm, args.retries)
+    )
+    print(json.dumps(summary))
+    return 0 if summary["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""A local stand-in for Gemini that replays recorded stage outputs.
+
+`install()` registers FakeLlm for every model name Gemini would serve, so the real
+pipeline (routing, callbacks, per-slide writers, the server) runs unchanged while no
+request leaves the machine.
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+from typing import AsyncGenerator
+
+from google.adk.models import BaseLlm, Gemini, LlmResponse
+from google.adk.models.registry import LLMRegistry
+from google.genai import types
+
+from lead_agent.cache import stage_for
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+DEFAULT_FIXTURE = os.path.join(FIXTURES_DIR, "space.json")
+
+_AGENT_NAME = re.compile(r'Your internal name is "([^"]+)"')
+
+
+class Settings:
+    """Replay behaviour shared by every FakeLlm instance (the registry builds one per agent)."""
+
+    def __init__(self, fixture=DEFAULT_FIXTURE, latency=0.0, jitter=0.0, seconds_per_token=0.0):
+        with open(fixture, encoding="utf-8") as f:
+            self.fixture = json.load(f)
+        html_file = self.fixture.get("final_html_file")
+        if html_file and "final_html" not in self.fixture:
+            with open(os.path.join(os.path.dirname(fixture), html_file), encoding="utf-8") as f:
+                self.fixture["final_html"] = f.read()
+        self.latency = latency
+        self.jitter = jitter
+        self.seconds_per_token = seconds_per_token
+
+
+settings = None
+
+
+def load_prompt(fixture=DEFAULT_FIXTURE):
+    with open(fixture, encoding="utf-8") as f:
+        return json.load(f)["prompt"]
+
+
+def response_text(agent_name, structured):
+    """Returns the recorded output for the stage `agent_name` produces."""
+    fixture = settings.fixture
+    if agent_name.startswith("SlideWriter_"):
+        slides = fixture["slides"]
+        return slides[int(agent_name.rsplit("_", 1)[1]) % len(slides)]
+    if agent_name.startswith("InputSummarizer_"):
+        return fixture["input_outline"]
+    stage = stage_for(agent_name)
+    value = fixture.get(stage)
+    if value is None:
+        raise KeyError(f"fixture has no recorded output for stage {stage!r} ({agent_name})")
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, ensure_ascii=False)
+        # Without a response schema the real model fences its JSON; keep parsing paths honest.
+        return text if structured else f"```json\n{text}\n```"
+    return value
+
+
+class FakeLlm(BaseLlm):
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return Gemini.supported_models()
+
+    async def generate_content_async(self, llm_request, stream=False) -> AsyncGenerator[LlmResponse, None]:
+        config = llm_request.config
+        match = _AGENT_NAME.search(str(config.system_instruction or ""))
+        agent_name = match.group(1) if match else ""
+        text = response_text(agent_name, config.response_schema is not None)
+
+        prompt_chars = len(str(config.system_instruction or "")) + sum(
+            len(part.text or "") for content in llm_request.contents or [] for part in content.parts or []
+        )
+        output_tokens = max(1, len(text) // 4)
+        delay = settings.latency + random.uniform(0, settings.jitter) + output_tokens * settings.seconds_per_token
+        if delay > 0:
+            await asyncio.sleep(delay)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            finish_reason=types.FinishReason.STOP,
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_chars // 4,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_chars // 4 + output_tokens,
+            ),
+        )
+
+
+def install(fixture=DEFAULT_FIXTURE, latency=0.0, jitter=0.0, seconds_per_token=0.0):
+    """Routes every Gemini model name to FakeLlm replaying `fixture`."""
+    global settings
+    settings = Settings(fixture, latency, jitter, seconds_per_token)
+    LLMRegistry.register(FakeLlm)
+    LLMRegistry.resolve.cache_clear()
+    return settings
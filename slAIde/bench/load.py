@@ -0,0 +1,188 @@
+"""Offline load test: drives server.py backed by the fake model and reports latency and memory.
+
+    cd slAIde
+    python -m bench.load --requests 200 --concurrency 16 --latency 0.5
+
+Starts `bench.serve` in a subprocess (pass --url to target a server that is already
+running), sends the fixture prompt to /run or /run/stream, and prints a JSON report
+with p50/p95/p99 latency, throughput, status counts and the server's peak RSS. Runs
+entirely on localhost.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import httpx
+
+from bench import fake_llm
+
+READY_TIMEOUT_SECONDS = 60.0
+RSS_SAMPLE_SECONDS = 0.05
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[rank]
+
+
+def rss_mb(pid):
+    """Current resident set size of a process, from /proc (Linux)."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def sample_rss(pid, peak):
+    while True:
+        value = rss_mb(pid)
+        if value is not None:
+            peak["mb"] = max(peak["mb"], value)
+        await asyncio.sleep(RSS_SAMPLE_SECONDS)
+
+
+async def wait_ready(client, process):
+    deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"bench server exited with code {process.returncode}")
+        try:
+            if (await client.get("/usage")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("bench server did not become ready")
+
+
+async def one_request(client, endpoint, prompt):
+    started = time.perf_counter()
+    if endpoint == "/run/stream":
+        first = None
+        async with client.stream("POST", endpoint, json={"prompt": prompt}) as response:
+            async for _ in response.aiter_bytes():
+                if first is None:
+                    first = time.perf_counter() - started
+        return response.status_code, time.perf_counter() - started, first
+    response = await client.post(endpoint, json={"prompt": prompt})
+    return response.status_code, time.perf_counter() - started, None
+
+
+async def drive(client, endpoint, prompt, total, concurrency):
+    results = []
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            try:
+                results.append(await one_request(client, endpoint, prompt))
+            except httpx.HTTPError as e:
+                results.append((type(e).__name__, None, None))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results, time.perf_counter() - started
+
+
+def report(results, elapsed, peak_rss, final_rss):
+    latencies = sorted(latency for status, latency, _ in results if status == 200)
+    first_chunks = sorted(first for status, _, first in results if status == 200 and first is not None)
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 1)
+
+    summary = {
+        "requests": len(results),
+        "ok": len(latencies),
+        "status": dict(Counter(str(status) for status, _, _ in results)),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 0.50)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(latencies[-1] if latencies else None),
+        },
+        "server_rss_mb": {"peak": round(peak_rss, 1) if peak_rss else None,
+                          "final": round(final_rss, 1) if final_rss else None},
+        "client_max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    if first_chunks:
+        summary["first_chunk_ms"] = {
+            "p50": ms(percentile(first_chunks, 0.50)),
+            "p95": ms(percentile(first_chunks, 0.95)),
+            "p99": ms(percentile(first_chunks, 0.99)),
+        }
+    return summary
+
+
+async def run(args):
+    process = None
+    url = args.url
+    if url is None:
+        url = f"http://127.0.0.1:{args.port}"
+        process = subprocess.Popen(
+            [sys.executable, "-m", "bench.serve", "--port", str(args.port), "--fixture", args.fixture,
+             "--latency", str(args.latency), "--jitter", str(args.jitter),
+             "--seconds-per-token", str(args.seconds_per_token)],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=url, timeout=args.timeout, limits=limits) as client:
+            await wait_ready(client, process)
+            prompt = fake_llm.load_prompt(args.fixture)
+            if args.warmup:
+                await drive(client, args.endpoint, prompt, args.warmup, min(args.warmup, args.concurrency))
+            peak = {"mb": 0.0}
+            sampler = asyncio.create_task(sample_rss(process.pid, peak)) if process else None
+            try:
+                results, elapsed = await drive(client, args.endpoint, prompt, args.requests, args.concurrency)
+            finally:
+                if sampler:
+                    sampler.cancel()
+            final = rss_mb(process.pid) if process else None
+            return report(results, elapsed, peak["mb"] or None, final)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the slAIde server against a local fake model.")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=4, help="requests sent before measuring")
+    parser.add_argument("--endpoint", choices=["/run", "/run/stream"], default="/run")
+    parser.add_argument("--latency", type=float, default=0.0, help="fake model seconds per call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform random seconds per call")
+    parser.add_argument("--seconds-per-token", type=float, default=0.0)
+    parser.add_argument("--fixture", default=fake_llm.DEFAULT_FIXTURE)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="target an already running server instead of starting bench.serve")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
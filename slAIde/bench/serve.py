@@ -0,0 +1,30 @@
+"""Runs server.py with every model call answered by the replaying FakeLlm.
+
+    python -m bench.serve --port 8765 --latency 0.5 --jitter 0.2
+"""
+
+import argparse
+
+import uvicorn
+
+from bench import fake_llm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the slAIde pipeline against a local fake model.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixture", default=fake_llm.DEFAULT_FIXTURE, help="recorded stage outputs (JSON)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every model call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform random seconds per call")
+    parser.add_argument("--seconds-per-token", type=float, default=0.0, help="simulated generation speed")
+    args = parser.parse_args(argv)
+
+    fake_llm.install(args.fixture, args.latency, args.jitter, args.seconds_per_token)
+    import server
+
+    uvicorn.run(server.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
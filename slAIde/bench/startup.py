@@ -0,0 +1,81 @@
+"""Cold-start benchmark: how long a fresh interpreter takes to import and build the pipeline.
+
+    cd slAIde
+    python -m bench.startup --repeat 5 --importtime
+
+Each measurement runs in a new subprocess so nothing is cached in memory. Reports the
+median seconds for importing the server module (what a worker pays before it can accept
+connections), building the pipeline runners (what the first request pays unless the
+server preloads), and both together; --importtime also lists the slowest modules from
+`python -X importtime`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SLAIDE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+started = time.perf_counter()
+import server
+imported = time.perf_counter()
+import runtime
+runtime.preload()
+built = time.perf_counter()
+print(json.dumps({"import_server": imported - started, "build_pipeline": built - imported, "total": built - started}))
+"""
+
+
+def probe():
+    # Preloading in the server's lifespan would not run here (no ASGI startup), but keep it off regardless.
+    env = dict(os.environ, SLAIDE_PRELOAD="off")
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=SLAIDE_DIR, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(limit):
+    """Top modules by cumulative import time (microseconds) for `import server` plus preload."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server, runtime; runtime.preload()"],
+        cwd=SLAIDE_DIR, env=dict(os.environ, SLAIDE_PRELOAD="off"), capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        # Only top-level entries (one space of indent): nested imports are counted in their parent.
+        if not module.startswith("  "):
+            rows.append((int(cumulative), module.strip()))
+    return [{"module": module, "ms": round(us / 1000, 1)} for us, module in sorted(rows, reverse=True)[:limit]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure slAIde's cold import and pipeline build time.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true", help="also list the slowest top-level imports")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    runs = [probe() for _ in range(args.repeat)]
+    report = {
+        name: {"median_s": round(statistics.median(run[name] for run in runs), 3),
+               "min_s": round(min(run[name] for run in runs), 3)}
+        for name in ("import_server", "build_pipeline", "total")
+    }
+    report["runs"] = len(runs)
+    if args.importtime:
+        report["slowest_imports"] = slowest_imports(args.top)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
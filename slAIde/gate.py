@@ -0,0 +1,82 @@
+import asyncio
+import math
+import time
+
+
+class GateFull(Exception):
+    """Raised by GenerationGate.admit when both the running and waiting slots are taken."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Too many deck generations in progress; retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class GenerationGate:
+    """Bounds concurrent deck generations, with a bounded FIFO of waiting requests.
+
+    `admit()` reserves a place synchronously (or raises GateFull), so the caller can
+    answer 429 before doing any work; the returned slot is then entered to wait for a
+    running slot.
+    """
+
+    def __init__(self, max_active, max_waiting, on_start=None):
+        self.max_active = max(1, max_active)
+        self.max_waiting = max(0, max_waiting)
+        self.admitted = 0
+        self.active = 0
+        # Smoothed generation time, used to estimate Retry-After.
+        self.average_seconds = 30.0
+        # Called with the seconds a request waited for its slot.
+        self.on_start = on_start
+        self._semaphore = asyncio.Semaphore(self.max_active)
+
+    @property
+    def waiting(self):
+        return self.admitted - self.active
+
+    def retry_after(self):
+        rounds = (self.waiting + 1) / self.max_active
+        return max(1, math.ceil(rounds * self.average_seconds))
+
+    def admit(self):
+        if self.admitted >= self.max_active + self.max_waiting:
+            raise GateFull(self.retry_after())
+        self.admitted += 1
+        return GenerationSlot(self)
+
+    def _record(self, seconds):
+        self.average_seconds = 0.8 * self.average_seconds + 0.2 * seconds
+
+
+class GenerationSlot:
+    def __init__(self, gate):
+        self.gate = gate
+        self.admitted_at = time.monotonic()
+        self.started = None
+        self.closed = False
+
+    async def __aenter__(self):
+        try:
+            await self.gate._semaphore.acquire()
+        except BaseException:
+            self.close()
+            raise
+        self.gate.active += 1
+        self.started = time.monotonic()
+        if self.gate.on_start is not None:
+            self.gate.on_start(self.started - self.admitted_at)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Gives the reservation back; safe to call more than once or without entering."""
+        if self.closed:
+            return
+        self.closed = True
+        self.gate.admitted -= 1
+        if self.started is not None:
+            self.gate.active -= 1
+            self.gate._semaphore.release()
+            self.gate._record(time.monotonic() - self.started)
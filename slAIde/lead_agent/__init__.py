@@ -0,0 +1,8 @@
+def __getattr__(name):
+    # The agents are built on first access, so importing lead_agent.config, .render
+    # and friends does not pay for google.adk and every agent's construction.
+    if name in ("root_agent", "stream_agent"):
+        from lead_agent import agent
+
+        return getattr(agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
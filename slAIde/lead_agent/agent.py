@@ -1,15 +1,65 @@
-from google.adk.agents import SequentialAgent, LlmAgent
+from google.adk.agents import ParallelAgent, SequentialAgent
 
+from lead_agent import config, telemetry
+from lead_agent.subagents.deck_shell_agent.agent import Deck_shell_agent
+from lead_agent.subagents.input_condense_agent.agent import Input_condense_agent
+from lead_agent.subagents.parallel_slide_writer_agent.agent import Parallel_slide_writer_agent
 from lead_agent.subagents.slide_count_agent.agent import Slide_count_agent
 from lead_agent.subagents.slide_render_agent.agent import Slide_render_agent
 from lead_agent.subagents.slide_writer_agent.agent import Slide_writer_agent
+from lead_agent.subagents.stats_extract_agent.agent import Stats_extract_agent
+from lead_agent.subagents.template_render_agent.agent import Template_render_agent
+
+RENDERERS = {
+    "template": Template_render_agent,
+    "llm": Slide_render_agent,
+}
+WRITERS = {
+    "single": Slide_writer_agent,
+    "parallel": Parallel_slide_writer_agent,
+}
+if config.RENDERER not in RENDERERS:
+    raise ValueError(f"SLAIDE_RENDERER must be one of {sorted(RENDERERS)}, got {config.RENDERER!r}")
+if config.WRITER not in WRITERS:
+    raise ValueError(f"SLAIDE_WRITER must be one of {sorted(WRITERS)}, got {config.WRITER!r}")
+
+if config.STATS_EXTRACTION not in ("on", "off"):
+    raise ValueError(f"SLAIDE_STATS_EXTRACTION must be 'on' or 'off', got {config.STATS_EXTRACTION!r}")
+if config.SPECULATIVE_SHELL not in ("on", "off"):
+    raise ValueError(f"SLAIDE_SPECULATIVE_SHELL must be 'on' or 'off', got {config.SPECULATIVE_SHELL!r}")
+
+planning = [
+    *([Stats_extract_agent] if config.STATS_EXTRACTION == "on" else []),
+    Input_condense_agent,
+    Slide_count_agent,
+]
+writer = WRITERS[config.WRITER]
+renderer = RENDERERS[config.RENDERER]
+# Streamed decks are rendered slide by slide by the server (streaming.DeckStream), so
+# that pipeline is the planner plus the per-slide writer, whatever the writer and
+# renderer settings. Its stages are copies, since an agent can only have one parent.
+stream_stages = [*(stage_agent.clone() for stage_agent in planning), Parallel_slide_writer_agent.clone()]
+for stage_agent in [*planning, writer, renderer, *stream_stages]:
+    telemetry.instrument(stage_agent)
+
+writing = writer
+if config.RENDERER == "template" and config.SPECULATIVE_SHELL == "on":
+    # The template shell depends on the plan alone (unlike the LLM renderer's whole
+    # document), so it is built while the writer runs and the renderer only adds slides.
+    writing = ParallelAgent(
+        name="ContentAndShellWriter",
+        sub_agents=[writer, telemetry.instrument(Deck_shell_agent)],
+        description="Writes the slide content while the deck shell and theme are built from the plan.",
+    )
 
 root_agent = SequentialAgent(
     name="PresentationPipelineAgent",
-    sub_agents=[
-        Slide_count_agent,
-        Slide_writer_agent,
-        Slide_render_agent
-    ],
+    sub_agents=[*planning, writing, renderer],
     description="Generates a complete presentation by running a planner, a writer, and a renderer in sequence.",
-)
\ No newline at end of file
+)
+
+stream_agent = SequentialAgent(
+    name="PresentationStreamAgent",
+    sub_agents=stream_stages,
+    description="Plans a presentation and writes each slide in its own call, for decks rendered as they stream.",
+)
@@ -0,0 +1,242 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+
+from lead_agent import config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload format changes so stale entries are never replayed.
+KEY_VERSION = "1"
+
+# Pipeline stage (state key) each agent produces; per-slide writers are
+# "SlideWriter_<n>" and share the all_slides_content stage.
+STAGES = {
+    "StatsExtractor": "stats_series",
+    "LongInputCondenser": "input_outline",
+    "ParallelSlidesContentWriter": "all_slides_content",
+    "TemplateDeckRenderer": "final_html",
+    "DeckShellBuilder": "deck_shell",
+    "SlideTopicAndStyleGenerator": "json_plan",
+    "AllSlidesContentWriter": "all_slides_content",
+    "SlideWriter": "all_slides_content",
+    "FullDeckHtmlRenderer": "final_html",
+    "SlideEditPlanner": "edit_plan",
+    "InputSummarizer": "input_outline",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def stage_for(agent_name):
+    return STAGES.get(re.sub(r"_\d+$", "", agent_name), agent_name)
+
+
+def _normalize(text):
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def cache_key(llm_request):
+    """Hashes the normalized input contents, the model name and the instruction text."""
+    contents = [
+        [content.role or "", [_normalize(part.text) for part in content.parts or [] if part.text]]
+        for content in llm_request.contents or []
+    ]
+    instruction = llm_request.config.system_instruction if llm_request.config else None
+    if instruction is not None and not isinstance(instruction, str):
+        instruction = json.dumps(instruction, default=str, sort_keys=True)
+    payload = json.dumps(
+        [KEY_VERSION, llm_request.model or "", _normalize(instruction), contents],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryCache:
+    """In-process LRU tier bounded by entry count."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskCache:
+    """On-disk tier bounded by total bytes; least recently used files are evicted first."""
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._files())
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            # mtime doubles as the last-access time used for eviction.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        with self._lock:
+            try:
+                self._size -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, path)
+            self._size += len(value)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        files = sorted(self._files(), key=lambda f: f[2])
+        self._size = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        for path, size, _ in files:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+
+class StageCache:
+    """Looks tiers up in order, promoting hits into the faster tiers, and counts hits/misses per stage."""
+
+    def __init__(self, tiers):
+        self.tiers = list(tiers)
+        self.counters = defaultdict(lambda: {"hits": 0, "misses": 0, "stores": 0})
+
+    def get(self, key, stage):
+        for i, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster in self.tiers[:i]:
+                    faster.set(key, value)
+                self.counters[stage]["hits"] += 1
+                return value
+        self.counters[stage]["misses"] += 1
+        return None
+
+    def set(self, key, value, stage):
+        for tier in self.tiers:
+            tier.set(key, value)
+        self.counters[stage]["stores"] += 1
+
+    def stats(self):
+        """Returns {stage: {"hits", "misses", "stores", "hit_rate"}}."""
+        stats = {}
+        for stage, counts in self.counters.items():
+            lookups = counts["hits"] + counts["misses"]
+            stats[stage] = dict(counts, hit_rate=counts["hits"] / lookups if lookups else 0.0)
+        return stats
+
+
+def build_cache(mode=config.CACHE):
+    if mode == "off":
+        return None
+    tiers = [MemoryCache(config.CACHE_MEMORY_ENTRIES)]
+    if mode == "disk":
+        tiers.append(DiskCache(config.CACHE_DIR, config.CACHE_DISK_BYTES))
+    elif mode != "memory":
+        raise ValueError(f"SLAIDE_CACHE must be one of ['disk', 'memory', 'off'], got {mode!r}")
+    return StageCache(tiers)
+
+
+stage_cache = build_cache()
+
+# Keys computed before a model call, waiting for the response to be stored. A failed
+# call drops its key; a cancelled one never comes back, so only the newest are kept.
+MAX_PENDING = 4096
+_pending = OrderedDict()
+
+
+def lookup_cached_response(callback_context, llm_request):
+    """before_model_callback: returns the cached response, skipping the model call on a hit."""
+    if stage_cache is None:
+        return None
+    stage = stage_for(callback_context.agent_name)
+    key = cache_key(llm_request)
+    cached = stage_cache.get(key, stage)
+    if cached is None:
+        _pending[(callback_context.invocation_id, callback_context.agent_name)] = key
+        while len(_pending) > MAX_PENDING:
+            _pending.popitem(last=False)
+        return None
+    logger.info("cache hit for %s (%s)", stage, key[:12])
+    from google.adk.models import LlmResponse  # Deferred: keeps importing the cache cheap.
+
+    response = LlmResponse.model_validate_json(cached)
+    response.custom_metadata = dict(response.custom_metadata or {}, cache="hit")
+    return response
+
+
+def store_cached_response(callback_context, llm_response):
+    """after_model_callback: stores complete, successful responses under the pending key.
+
+    Only responses the model finished on its own (finish_reason STOP) are kept, so a
+    deck cut off at MAX_TOKENS or blocked by a safety filter is not served again.
+    """
+    if stage_cache is None or llm_response.partial:
+        return None
+    key = _pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+    if key is None or llm_response.error_code or not llm_response.content:
+        return None
+    if llm_response.finish_reason != "STOP":
+        return None
+    stage_cache.set(
+        key,
+        llm_response.model_dump_json(exclude_none=True).encode("utf-8"),
+        stage_for(callback_context.agent_name),
+    )
+    return None
+
+
+def discard_pending_key(callback_context, llm_request, error):
+    """on_model_error_callback: forgets the failed call's key; the error still propagates."""
+    _pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+    return None
@@ -0,0 +1,14 @@
+from lead_agent.cache import discard_pending_key, lookup_cached_response, store_cached_response
+from lead_agent.chunking import use_condensed_input
+from lead_agent.routing import route_model
+from lead_agent.telemetry import end_model_call, record_model_error, start_model_call
+from lead_agent.usage import record_usage
+
+# Model callbacks shared by every LlmAgent in the pipeline. ADK runs them in
+# order; the first before-callback that returns a response skips the model call.
+# A long input is swapped for its outline first, so routing measures and the cache
+# key covers what is actually sent; routing then picks the model the key includes.
+# Timing starts after routing so cache hits (which skip AFTER_MODEL) are still seen.
+BEFORE_MODEL = [use_condensed_input, route_model, start_model_call, lookup_cached_response]
+AFTER_MODEL = [end_model_call, record_usage, store_cached_response]
+ON_MODEL_ERROR = [record_model_error, discard_pending_key]
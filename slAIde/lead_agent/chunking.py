@@ -0,0 +1,61 @@
+import re
+
+from google.genai import types
+
+from lead_agent import config
+
+# Section boundaries in order of preference: markdown/numbered headings or ALL-CAPS
+# heading lines, then blank lines (paragraphs), then sentence ends.
+_SECTION = re.compile(r"\n(?=[ \t]*(?:#{1,6} |\d+(?:\.\d+)*[.)] +[A-Z]|[A-Z][A-Z0-9 ,:&'\-]{3,}\n))")
+_PARAGRAPH = re.compile(r"\n[ \t]*\n")
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+# Session state key holding the condensed outline that stands in for a long input.
+OUTLINE_KEY = "input_outline"
+
+
+def _boundaries(text, start, end, pattern):
+    return [m.end() for m in pattern.finditer(text, start, end)]
+
+
+def iter_chunks(text, max_chars):
+    """Yields (start, end) spans of `text`, each at most `max_chars`, split on section boundaries.
+
+    Spans are produced lazily from offsets, so callers slice only the chunks they are
+    working on. A span is cut at the last heading before the limit, else the last blank
+    line, else the last sentence end, and only as a last resort mid-sentence.
+    """
+    start, length = 0, len(text)
+    while start < length:
+        end = min(start + max_chars, length)
+        if end < length:
+            for pattern in (_SECTION, _PARAGRAPH, _SENTENCE):
+                cuts = [cut for cut in _boundaries(text, start, end, pattern) if cut > start + max_chars // 4]
+                if cuts:
+                    end = cuts[-1]
+                    break
+        yield start, end
+        start = end
+
+
+def needs_condensing(text):
+    return len(text) > config.CHUNK_THRESHOLD_CHARS
+
+
+def use_condensed_input(callback_context, llm_request):
+    """before_model_callback: swaps an over-long user input for the condensed outline.
+
+    Any user part longer than SLAIDE_CHUNK_THRESHOLD_CHARS is replaced once
+    `input_outline` exists, so later stages never resend the raw transcript.
+    """
+    outline = callback_context.state.get(OUTLINE_KEY)
+    if not outline:
+        return None
+    for content in llm_request.contents or []:
+        if content.role != "user":
+            continue
+        content.parts = [
+            types.Part(text=outline) if part.text and needs_condensing(part.text) else part
+            for part in content.parts or []
+        ]
+    return None
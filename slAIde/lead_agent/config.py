@@ -0,0 +1,82 @@
+import os
+
+# Which stage turns `all_slides_content` into `final_html`:
+#   "template" - local, deterministic renderer (no model call)
+#   "llm"      - the original FullDeckHtmlRenderer LlmAgent
+RENDERER = os.getenv("SLAIDE_RENDERER", "template").strip().lower()
+
+# How template-rendered decks carry the shared navigation/chart runtime:
+#   "inline" - the minified bundle is embedded, so the deck works as a standalone file
+#   "link"   - the deck references the versioned bundle served under RUNTIME_URL
+RUNTIME = os.getenv("SLAIDE_RUNTIME", "inline").strip().lower()
+RUNTIME_URL = os.getenv("SLAIDE_RUNTIME_URL", "/runtime")
+
+# How `all_slides_content` is written:
+#   "single"   - one Slide_writer_agent call for the whole deck
+#   "parallel" - one concurrent writer call per slide title in `json_plan`
+WRITER = os.getenv("SLAIDE_WRITER", "single").strip().lower()
+# Upper bound on in-flight per-slide writer calls in "parallel" mode.
+WRITER_CONCURRENCY = int(os.getenv("SLAIDE_WRITER_CONCURRENCY", "8"))
+# With the template renderer, build the deck shell and theme from `json_plan` while the
+# writer runs, so the renderer only fills in the slides: "on" (default) or "off".
+SPECULATIVE_SHELL = os.getenv("SLAIDE_SPECULATIVE_SHELL", "on").strip().lower()
+
+# Stage output cache in front of every model call:
+#   "off"    - always call the model
+#   "memory" - in-process LRU only
+#   "disk"   - in-process LRU backed by an on-disk tier
+CACHE = os.getenv("SLAIDE_CACHE", "off").strip().lower()
+CACHE_MEMORY_ENTRIES = int(os.getenv("SLAIDE_CACHE_MEMORY_ENTRIES", "256"))
+CACHE_DIR = os.getenv("SLAIDE_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache", "stages"))
+CACHE_DISK_BYTES = int(os.getenv("SLAIDE_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+
+# Prompt variant used by the slide agents: "full" (worked examples inline) or
+# "compact" (examples trimmed). A request can also pick one explicitly.
+PROMPT_VARIANT = os.getenv("SLAIDE_PROMPT_VARIANT", "full").strip().lower()
+# Fraction of requests without an explicit choice that get "compact", for A/B runs.
+PROMPT_COMPACT_SHARE = float(os.getenv("SLAIDE_PROMPT_COMPACT_SHARE", "0"))
+
+# Model routing: "size" picks each call's model tier from the prompt size / slide count
+# and raises a lower max_output_tokens to the tier's budget (see lead_agent/routing.py);
+# "off" (default) keeps every agent's model and budget.
+ROUTING = os.getenv("SLAIDE_ROUTING", "off").strip().lower()
+# Model behind each routing tier.
+MODEL_TIERS = {
+    "fast": os.getenv("SLAIDE_MODEL_FAST", "gemini-2.5-flash-lite"),
+    "standard": os.getenv("SLAIDE_MODEL_STANDARD", "gemini-2.5-flash"),
+}
+# JSON file (or inline JSON) overriding per-stage routing policies, merged over the defaults.
+ROUTING_POLICY = os.getenv("SLAIDE_ROUTING_POLICY", "")
+# Output tokens added to a routed budget for the model's thinking, which counts against
+# max_output_tokens; a request with an explicit thinking_budget adds that instead.
+ROUTING_THINKING_HEADROOM = int(os.getenv("SLAIDE_ROUTING_THINKING_HEADROOM", "8192"))
+
+# Run the deterministic chart-data extraction pass (lead_agent/stats.py) before the
+# planner: "on" (default) or "off".
+STATS_EXTRACTION = os.getenv("SLAIDE_STATS_EXTRACTION", "on").strip().lower()
+
+# Inputs longer than this many characters are split on section boundaries into
+# CHUNK_CHARS pieces, summarized concurrently, and reduced to an outline for the planner.
+CHUNK_THRESHOLD_CHARS = int(os.getenv("SLAIDE_CHUNK_THRESHOLD_CHARS", "48000"))
+CHUNK_CHARS = int(os.getenv("SLAIDE_CHUNK_CHARS", "12000"))
+CHUNK_CONCURRENCY = int(os.getenv("SLAIDE_CHUNK_CONCURRENCY", "8"))
+
+# Instrumentation (lead_agent/telemetry.py): stage timings are always logged as JSON lines;
+# "on" also exports them as OpenTelemetry spans via the globally configured tracer provider,
+# and serves Prometheus-style metrics at /metrics on the pipeline server.
+OTEL = os.getenv("SLAIDE_OTEL", "off").strip().lower()
+METRICS = os.getenv("SLAIDE_METRICS", "off").strip().lower()
+
+# Build the pipeline (google.adk, every agent and runner) when the server starts rather than
+# on its first request: "on" (default) or "off". Importing the server never builds it.
+PRELOAD = os.getenv("SLAIDE_PRELOAD", "on").strip().lower()
+
+# Where pipeline sessions (and so each deck's state) live (slAIde/sessions.py): "memory"
+# (default; dropped after each request), "sqlite" (a database file, for several processes
+# on one node) or "file" (one file per session in a shared directory). Persistent sessions
+# are kept after a run so any worker can edit the deck by its session_id, and expire
+# SESSION_TTL_SECONDS after their last change. SESSION_PATH overrides the database file
+# or directory (default slAIde/.sessions/sqlite/sessions.db or slAIde/.sessions/files).
+SESSIONS = os.getenv("SLAIDE_SESSIONS", "memory").strip().lower()
+SESSION_PATH = os.getenv("SLAIDE_SESSION_PATH", "")
+SESSION_TTL_SECONDS = float(os.getenv("SLAIDE_SESSION_TTL_SECONDS", "86400"))
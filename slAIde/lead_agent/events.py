@@ -0,0 +1,25 @@
+"""Helpers for reading pipeline events, kept free of agent imports so the server can load them cheaply."""
+
+SLIDE_WRITER_PREFIX = "SlideWriter_"
+
+
+def slide_index(author):
+    """Returns the slide index of a per-slide writer event author, or None."""
+    if author and author.startswith(SLIDE_WRITER_PREFIX):
+        suffix = author[len(SLIDE_WRITER_PREFIX):]
+        if suffix.isdigit():
+            return int(suffix)
+    return None
+
+
+def final_text(event):
+    if event.partial or not event.is_final_response() or not event.content:
+        return None
+    return "".join(part.text or "" for part in event.content.parts or []).strip()
+
+
+def strip_fence(text):
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rstrip().removesuffix("```").strip()
+    return text
@@ -0,0 +1,61 @@
+import json
+import random
+
+from lead_agent import config
+
+VARIANTS = ("full", "compact")
+# Session state key holding the prompt variant chosen for a request.
+VARIANT_KEY = "prompt_variant"
+
+_registry = {}
+
+
+def state_text(value):
+    """Formats a state value for a prompt; typed (dict/list) state is rendered as JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return "" if value is None else str(value)
+
+
+def register(stage, full, compact=None, keys=()):
+    """Registers a stage's prompt variants and returns the InstructionProvider for its agent.
+
+    Templates with `keys` are filled from session state with str.format; templates
+    without keys are used verbatim. `compact` falls back to `full` when omitted.
+    """
+    _registry[stage] = {"full": full, "compact": compact or full, "keys": tuple(keys)}
+
+    def provider(context):
+        return render(stage, variant_of(context.state), context.state)
+
+    return provider
+
+
+def render(stage, variant, state):
+    entry = _registry[stage]
+    template = entry[variant if variant in VARIANTS else "full"]
+    if not entry["keys"]:
+        return template
+    return template.format(**{key: state_text(state.get(key)) for key in entry["keys"]})
+
+
+def variant_of(state):
+    variant = state.get(VARIANT_KEY) or config.PROMPT_VARIANT
+    return variant if variant in VARIANTS else "full"
+
+
+def choose_variant(requested=None):
+    """Picks the variant for a new request: an explicit choice, else the configured A/B split."""
+    if requested in VARIANTS:
+        return requested
+    if config.PROMPT_COMPACT_SHARE > 0 and random.random() < config.PROMPT_COMPACT_SHARE:
+        return "compact"
+    return config.PROMPT_VARIANT if config.PROMPT_VARIANT in VARIANTS else "full"
+
+
+def prompt_sizes():
+    """Returns {stage: {variant: characters}} for the registered templates."""
+    return {
+        stage: {variant: len(entry[variant]) for variant in VARIANTS}
+        for stage, entry in _registry.items()
+    }
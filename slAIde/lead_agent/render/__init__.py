@@ -0,0 +1,18 @@
+from lead_agent.render.deck import (
+    deck_title,
+    is_template_deck,
+    load_json_state,
+    load_slides_content,
+    render_deck,
+    render_runtime,
+    render_shell,
+    render_slide,
+    render_slides,
+    render_theme,
+    replace_slide,
+    replace_theme,
+)
+from lead_agent.render.bundle import RUNTIME_FILES, RUNTIME_VERSION
+from lead_agent.render.sanitize import clean_html
+from lead_agent.render.template import SHELL_TAIL
+from lead_agent.render.themes import Theme, theme_for
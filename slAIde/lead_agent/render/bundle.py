@@ -0,0 +1,36 @@
+import hashlib
+import re
+
+from lead_agent.render.template import DECK_CSS, DECK_JS
+
+_CSS_SPACE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify_css(css):
+    """Drops line breaks and the whitespace around CSS punctuation."""
+    return _CSS_SPACE.sub(r"\1", " ".join(css.split())).replace(";}", "}")
+
+
+def minify_js(js):
+    """Joins DECK_JS-style sources, where every line ends a statement or opens/closes a block.
+
+    Not a general minifier: a line ending without `;`, `{`, `}` or `,` would be
+    joined onto the next one unchanged, so keep the runtime written that way.
+    """
+    return "".join(line.strip() for line in js.splitlines())
+
+
+RUNTIME_CSS = minify_css(DECK_CSS)
+RUNTIME_JS = minify_js(DECK_JS)
+# Content hash of the bundle; it names the served files so they can be cached forever.
+RUNTIME_VERSION = hashlib.sha256((RUNTIME_CSS + "\0" + RUNTIME_JS).encode("utf-8")).hexdigest()[:12]
+
+RUNTIME_FILES = {
+    f"slaide-{RUNTIME_VERSION}.css": ("text/css; charset=utf-8", RUNTIME_CSS),
+    f"slaide-{RUNTIME_VERSION}.js": ("text/javascript; charset=utf-8", RUNTIME_JS),
+}
+
+
+def runtime_url(base_url, kind):
+    """Returns the URL of the bundle's `css` or `js` file under `base_url`."""
+    return f"{base_url.rstrip('/')}/slaide-{RUNTIME_VERSION}.{kind}"
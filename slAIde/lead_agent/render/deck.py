@@ -0,0 +1,230 @@
+import json
+import re
+from html import escape
+
+from lead_agent import config
+from lead_agent.render.bundle import RUNTIME_CSS, RUNTIME_JS, runtime_url
+from lead_agent.render.markdown import parse_slide
+from lead_agent.render.template import (
+    BAR_ROW_TEMPLATE,
+    CHART_TEMPLATE,
+    INLINE_SCRIPT_TEMPLATE,
+    INLINE_STYLES_TEMPLATE,
+    LINKED_SCRIPT_TEMPLATE,
+    LINKED_STYLES_TEMPLATE,
+    SHELL_TAIL,
+    SHELL_TEMPLATE,
+    SLIDE_TEMPLATE,
+    THEME_TEMPLATE,
+)
+from lead_agent.render.themes import theme_for
+
+MIN_VISIBLE_PERCENT = 1.5
+
+_SLIDE_INDEX = re.compile(r'<div class="slide" data-index="(\d+)">')
+_DIV_TAG = re.compile(r"<div\b|</div>")
+_THEME_BLOCK = re.compile(r'<style id="slaide-theme">.*?</style>', re.DOTALL)
+_INLINE = re.compile(r"\*\*(.+?)\*\*|`([^`]+)`|(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])")
+
+
+def load_json_state(value):
+    """Returns a state value written by an LlmAgent as a dict.
+
+    Accepts a dict as-is, or a JSON string optionally wrapped in a ```json fence.
+    """
+    if isinstance(value, dict):
+        return value
+    if not value:
+        return {}
+    text = str(value).strip()
+    # Only strip an outer fence; slide strings contain ```bar fences of their own.
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rstrip().removesuffix("```")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return json.loads(text[start:end + 1])
+
+
+def load_slides_content(value, default_style=""):
+    """Returns (style, slides) from the writer's `all_slides_content` state value."""
+    content = load_json_state(value)
+    slides = content.get("all_slides_content") or []
+    if isinstance(slides, str):
+        slides = [slides]
+    return content.get("style") or default_style, [str(s) for s in slides]
+
+
+def _inline(text):
+    def replace(match):
+        bold, code, italic = match.groups()
+        if bold is not None:
+            return f"<strong>{bold}</strong>"
+        if code is not None:
+            return f"<code>{code}</code>"
+        return f"<em>{italic}</em>"
+
+    return _INLINE.sub(replace, escape(text, quote=False))
+
+
+def _format_value(value):
+    return f"{value:,}"
+
+
+def _render_chart(title, rows):
+    max_value = max(value for _, value in rows)
+    row_html = []
+    for label, value in rows:
+        width = (value / max_value) * 100 if max_value > 0 else 0
+        if value > 0:
+            width = max(width, MIN_VISIBLE_PERCENT)
+        else:
+            width = 0
+        row_html.append(BAR_ROW_TEMPLATE.substitute(
+            label=escape(label),
+            value=_format_value(value),
+            width=f"{width:.2f}",
+        ))
+    summary = ", ".join(f"{label}: {_format_value(value)}" for label, value in rows)
+    return CHART_TEMPLATE.substitute(
+        label=escape(f"{title} bar chart" if title else "Bar chart"),
+        description=escape(summary),
+        rows="".join(row_html),
+    )
+
+
+def render_slide(markdown, theme, index=0):
+    """Renders one markdown slide as a `<div class="slide">`, or None if it should be dropped.
+
+    A slide whose ```bar fence has no parsable rows is dropped, as the LLM renderer was told to.
+    """
+    slide = parse_slide(markdown)
+    parts = []
+    if slide.title:
+        parts.append(f"<h1>{_inline(slide.title)}</h1>")
+    if slide.chart is not None:
+        if not slide.chart:
+            return None
+        parts.append(_render_chart(slide.title, slide.chart))
+    else:
+        parts.extend(f"<p>{_inline(p)}</p>" for p in slide.paragraphs)
+        if slide.bullets:
+            items = "".join(f"<li>{theme.emoji} {_inline(b)}</li>" for b in slide.bullets)
+            parts.append(f"<ul>{items}</ul>")
+    if not parts:
+        return None
+    return SLIDE_TEMPLATE.substitute(index=index, body="".join(parts))
+
+
+def deck_title(slides):
+    for markdown in slides:
+        title = parse_slide(markdown).title
+        if title:
+            return title
+    return "Presentation"
+
+
+def render_theme(style):
+    """Returns the `<style>` block holding the CSS variables for a planner `style`."""
+    return THEME_TEMPLATE.substitute(theme_variables=theme_for(style).css_variables())
+
+
+def render_runtime(mode=None):
+    """Returns the (styles, script) tags for the shared runtime bundle.
+
+    "inline" embeds the minified bundle so the deck works as a standalone file;
+    "link" points at the versioned files under SLAIDE_RUNTIME_URL instead.
+    """
+    mode = mode or config.RUNTIME
+    if mode == "inline":
+        return INLINE_STYLES_TEMPLATE.substitute(css=RUNTIME_CSS), INLINE_SCRIPT_TEMPLATE.substitute(js=RUNTIME_JS)
+    if mode == "link":
+        return (
+            LINKED_STYLES_TEMPLATE.substitute(href=runtime_url(config.RUNTIME_URL, "css")),
+            LINKED_SCRIPT_TEMPLATE.substitute(src=runtime_url(config.RUNTIME_URL, "js")),
+        )
+    raise ValueError(f"Unknown SLAIDE_RUNTIME {mode!r}; expected 'inline' or 'link'")
+
+
+def render_shell(style, title="Presentation", runtime=None):
+    """Returns the deck document up to the open slides container.
+
+    Followed by the slide divs and SHELL_TAIL it makes a complete deck; a streamed
+    deck sends it before any slide content exists.
+    """
+    styles, script = render_runtime(runtime)
+    return SHELL_TEMPLATE.substitute(title=escape(title), theme=render_theme(style), styles=styles, script=script)
+
+
+def render_slides(style, slides):
+    """Renders the slide divs that go between a deck's shell and SHELL_TAIL."""
+    theme = theme_for(style)
+    rendered = []
+    # data-index is the position in all_slides_content, so edits can target a slide
+    # even when an earlier one was dropped.
+    for index, markdown in enumerate(slides):
+        html = render_slide(markdown, theme, index)
+        if html is not None:
+            rendered.append(html)
+    return "\n".join(rendered)
+
+
+def render_deck(style, slides, runtime=None, shell=None):
+    """Renders a complete HTML deck from markdown slides; self-contained with the inline runtime.
+
+    `shell` is a render_shell() result built ahead of time for this style and title.
+    """
+    if shell is None:
+        shell = render_shell(style, deck_title(slides), runtime)
+    return shell + render_slides(style, slides) + SHELL_TAIL
+
+
+def is_template_deck(html):
+    """Whether `html` was rendered here, so its slides and theme can be patched in place.
+
+    Decks from the LLM renderer (or sent by a client) have no theme block or slide
+    container of ours to patch.
+    """
+    return bool(html) and SHELL_TAIL in html and _THEME_BLOCK.search(html) is not None
+
+
+def _slide_span(html, index):
+    start = html.find(f'<div class="slide" data-index="{index}">')
+    if start == -1:
+        return None
+    depth = 0
+    for tag in _DIV_TAG.finditer(html, start):
+        depth += 1 if tag.group() == "<div" else -1
+        if depth == 0:
+            return start, tag.end()
+    return None
+
+
+def replace_slide(html, index, fragment):
+    """Swaps one `<div class="slide">` of a rendered deck for `fragment`.
+
+    A missing slide is inserted in data-index order, and a None fragment removes the slide.
+    """
+    fragment = fragment or ""
+    span = _slide_span(html, index)
+    if span is not None:
+        start, end = span
+        return html[:start] + fragment + html[end:]
+    if not fragment:
+        return html
+    for later in _SLIDE_INDEX.finditer(html):
+        if int(later.group(1)) > index:
+            return html[:later.start()] + fragment + "\n" + html[later.start():]
+    tail = html.rfind(SHELL_TAIL)
+    if tail == -1:
+        raise ValueError("not a deck rendered by lead_agent.render")
+    return html[:tail] + "\n" + fragment + html[tail:]
+
+
+def replace_theme(html, style):
+    """Swaps a rendered deck's theme `<style>` block for the one of `style`."""
+    return _THEME_BLOCK.sub(lambda _: render_theme(style), html, count=1)
@@ -0,0 +1,74 @@
+import re
+from dataclasses import dataclass, field
+
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+_FENCE = re.compile(r"^\s*```\s*([\w-]*)\s*$")
+_NUMBER = re.compile(r"^[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)?(?:\.\d+)?$")
+
+
+@dataclass
+class Slide:
+    title: str = ""
+    bullets: list = field(default_factory=list)
+    paragraphs: list = field(default_factory=list)
+    # None when the slide has no ```bar fence, otherwise the parsed (label, value) rows.
+    chart: list = None
+
+
+def parse_number(text):
+    """Parses "1,234.5", "-3" or "42%" style values; returns None if not numeric."""
+    text = text.strip().rstrip("%").strip()
+    if not text or not _NUMBER.match(text) or not any(c.isdigit() for c in text):
+        return None
+    value = float(text.replace(",", ""))
+    return int(value) if value.is_integer() else value
+
+
+def parse_bar_chart(body):
+    """Parses `Label: value` lines, splitting on the first colon only."""
+    rows = []
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        label, sep, raw = line.partition(":")
+        value = parse_number(raw) if sep else None
+        if value is None or not label.strip():
+            continue
+        rows.append((label.strip(), value))
+    return rows
+
+
+def parse_slide(markdown):
+    """Splits one markdown slide from the writer into title, bullets, text and chart."""
+    slide = Slide()
+    fence_lang, fence_lines = None, []
+    for line in (markdown or "").replace("\r\n", "\n").split("\n"):
+        fence = _FENCE.match(line)
+        if fence_lang is not None:
+            if fence and not fence.group(1):
+                if fence_lang == "bar":
+                    slide.chart = (slide.chart or []) + parse_bar_chart("\n".join(fence_lines))
+                fence_lang, fence_lines = None, []
+            else:
+                fence_lines.append(line)
+            continue
+        if fence:
+            fence_lang = fence.group(1).lower()
+            continue
+        if not line.strip():
+            continue
+        heading = _HEADING.match(line)
+        if heading and not slide.title:
+            slide.title = heading.group(1)
+            continue
+        bullet = _BULLET.match(line)
+        if bullet:
+            slide.bullets.append(bullet.group(1).strip())
+        else:
+            slide.paragraphs.append(heading.group(1) if heading else line.strip())
+    # An unterminated fence still counts, the writer sometimes drops the closing ```.
+    if fence_lang == "bar":
+        slide.chart = (slide.chart or []) + parse_bar_chart("\n".join(fence_lines))
+    return slide
@@ -0,0 +1,50 @@
+import re
+
+# One tokenizer pass over the document. Raw-text elements are matched whole so their
+# contents (scripts, stylesheets, preformatted text) are copied through untouched.
+_TOKEN = re.compile(
+    r"(?P<raw><(?P<raw_name>script|style|pre|textarea)\b[^>]*>.*?</(?P=raw_name)\s*>)"
+    r"|(?P<comment><!--.*?-->)"
+    r"|(?P<tag></?[A-Za-z!][^>]*>)"
+    r"|(?P<text>[^<]+|<)",
+    re.DOTALL | re.IGNORECASE,
+)
+# Markdown code fences (```html, '''json, ...) the model sometimes wraps the document in.
+# Only a fence alone on its line (or alone between two tags) counts; ''' in prose is kept.
+_FENCE = re.compile(r"(?:^|(?<=\n))[ \t]*(?:```|''')[A-Za-z]*[ \t]*(?=\n|$)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _collapse(match):
+    return "\n" if "\n" in match.group() else " "
+
+
+def clean_html(html):
+    """Strips markdown fences and comments outside raw-text elements and collapses whitespace.
+
+    Runs once over the model's `final_html` so stored decks can be served byte for byte.
+    Whitespace runs become a single newline or space, which renders the same; conditional
+    comments (`<!--[if ...]>`) are kept.
+    """
+    out = []
+    for token in _TOKEN.finditer(html):
+        kind = token.lastgroup
+        text = token.group()
+        if kind == "comment":
+            if text.startswith("<!--[if"):
+                out.append(text)
+        elif kind == "text":
+            out.append(_WHITESPACE.sub(_collapse, _FENCE.sub("", text)))
+        else:
+            out.append(text)
+    return "".join(out).strip() + "\n"
+
+
+def clean_final_html(callback_context):
+    """after_agent_callback: replaces the renderer's `final_html` with its cleaned form."""
+    html = callback_context.state.get("final_html")
+    if isinstance(html, str):
+        cleaned = clean_html(html)
+        if cleaned != html:
+            callback_context.state["final_html"] = cleaned
+    return None
@@ -0,0 +1,114 @@
+from string import Template
+
+# The deck document the FullDeckHtmlRenderer prompt asks the model to produce, with
+# the per-style values pulled out into CSS variables so one template serves every theme.
+DECK_CSS = """
+body{margin:0;font-family:var(--font);background-color:var(--bg);color:var(--text);display:flex;justify-content:center;align-items:center;min-height:100vh;overflow:hidden;line-height:1.5}
+h1{color:var(--heading);margin:0 0 20px;text-shadow:0 0 2px rgba(0,0,0,.15)}
+p{margin:0 0 15px}
+ul{list-style:none;padding-left:0;margin-top:20px}
+li{margin-bottom:12px;font-size:1.1em;line-height:1.5}
+.slides-container{width:90vw;max-width:1200px;height:70vh;max-height:700px;display:flex;justify-content:center;align-items:center;position:relative}
+.slide{background-color:var(--slide-bg);border:2px solid var(--border);border-radius:15px;padding:40px 60px;box-shadow:0 0 20px rgba(0,0,0,.25);width:100%;height:100%;box-sizing:border-box;display:none;flex-direction:column;justify-content:flex-start;align-items:flex-start;overflow-y:auto}
+.slide.active{display:flex}
+.nav-button{position:fixed;top:50%;transform:translateY(-50%);background-color:var(--button-bg);color:var(--button-text);border:2px solid var(--accent);border-radius:50%;width:60px;height:60px;font-size:2em;cursor:pointer;display:flex;justify-content:center;align-items:center;transition:background-color .3s,color .3s,box-shadow .3s;user-select:none;z-index:1000}
+.nav-button:hover:not(:disabled){background-color:var(--accent);color:var(--slide-bg);box-shadow:0 0 10px rgba(0,0,0,.3)}
+.nav-button:disabled{opacity:.4;cursor:not-allowed;box-shadow:none}
+#prevButton{left:2vw}
+#nextButton{right:2vw}
+.bar-chart{width:100%;margin-top:30px;display:flex;flex-direction:column;gap:15px;padding-bottom:20px}
+.bar-row{display:flex;align-items:center;min-height:40px}
+.bar-label{width:20%;flex-shrink:0;margin-right:15px;font-weight:bold}
+.bar-track{flex-grow:1;background-color:var(--track);height:30px;border-radius:5px;position:relative;overflow:hidden}
+.bar-fill{height:100%;background-color:var(--fill);width:0%;border-radius:5px;display:flex;align-items:center;justify-content:flex-end;padding-right:10px;box-sizing:border-box;transition:width .8s ease-out}
+.bar-value{color:var(--value-text);font-weight:bold;font-size:.95em;white-space:nowrap}
+"""
+
+# Navigation plus lazy, idempotent bar filling. Widths are computed in Python at
+# render time and stored in data-width, so the script only animates them in.
+# Slides are looked up on every call so a streamed deck can mount them as they arrive.
+DECK_JS = """
+(function(){
+var prev=document.getElementById('prevButton'),next=document.getElementById('nextButton'),current=0;
+function slides(){return document.querySelectorAll('.slides-container > .slide');}
+function fillChart(chart){
+if(chart.dataset.rendered==='1')return;
+chart.dataset.rendered='1';
+chart.querySelectorAll('.bar-fill').forEach(function(fill){setTimeout(function(){fill.style.width=fill.dataset.width+'%';},50);});
+}
+function showSlide(idx){
+var all=slides();
+if(idx<0||idx>=all.length)return;
+all.forEach(function(s){s.classList.remove('active');});
+all[idx].classList.add('active');
+current=idx;
+prev.disabled=idx===0;
+next.disabled=idx===all.length-1;
+var chart=all[idx].querySelector('.bar-chart');
+if(chart)fillChart(chart);
+}
+function mount(slide){
+var container=slide.parentNode,index=+slide.dataset.index;
+for(var el=container.firstElementChild;el;el=el.nextElementSibling){
+if(el!==slide&&el.classList.contains('slide')&&+el.dataset.index>index){container.insertBefore(slide,el);break;}
+}
+var all=Array.prototype.slice.call(slides()),active=container.querySelector('.slide.active');
+showSlide(active?all.indexOf(active):0);
+}
+prev.addEventListener('click',function(){showSlide(current-1);});
+next.addEventListener('click',function(){showSlide(current+1);});
+document.addEventListener('keydown',function(e){
+if(e.key==='ArrowRight'||e.key===' ')showSlide(current+1);
+else if(e.key==='ArrowLeft')showSlide(current-1);
+});
+window.slaide={showSlide:showSlide,mount:mount};
+document.addEventListener('DOMContentLoaded',function(){showSlide(current);});
+})();
+"""
+
+THEME_TEMPLATE = Template('<style id="slaide-theme">:root{$theme_variables}</style>')
+
+# Everything up to the open slides container. The runtime script comes before the
+# slides so a streamed deck is navigable while the remaining slides are written.
+# $styles and $script hold the shared runtime, inlined or linked (see bundle.py).
+SHELL_TEMPLATE = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$title</title>
+$theme
+$styles
+</head>
+<body>
+<button id="prevButton" class="nav-button" aria-label="Previous Slide">◀</button>
+<button id="nextButton" class="nav-button" aria-label="Next Slide">▶</button>
+$script
+<div class="slides-container">
+"""
+)
+
+INLINE_STYLES_TEMPLATE = Template("<style>$css</style>")
+INLINE_SCRIPT_TEMPLATE = Template("<script>$js</script>")
+LINKED_STYLES_TEMPLATE = Template('<link rel="stylesheet" href="$href">')
+LINKED_SCRIPT_TEMPLATE = Template('<script src="$src"></script>')
+
+SHELL_TAIL = """
+</div>
+</body>
+</html>
+"""
+
+SLIDE_TEMPLATE = Template('<div class="slide" data-index="$index">$body</div>')
+
+CHART_TEMPLATE = Template(
+    '<div class="bar-chart" role="img" aria-label="$label" aria-description="$description">$rows</div>'
+)
+
+BAR_ROW_TEMPLATE = Template(
+    '<div class="bar-row" title="$label — $value">'
+    '<span class="bar-label">$label</span>'
+    '<div class="bar-track"><div class="bar-fill" data-width="$width" style="width:0%;">'
+    '<span class="bar-value">$value</span></div></div></div>'
+)
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+
+EMOJI_FONTS = "'Segoe UI Emoji', 'Apple Color Emoji', 'Noto Color Emoji', sans-serif"
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str
+    emoji: str
+    background: str
+    slide_background: str
+    text: str
+    heading: str
+    border: str
+    button_background: str
+    button_text: str
+    accent: str
+    track: str
+    fill: str
+    value_text: str
+    font: str = EMOJI_FONTS
+
+    def css_variables(self):
+        return (
+            f"--bg:{self.background};--slide-bg:{self.slide_background};"
+            f"--text:{self.text};--heading:{self.heading};--border:{self.border};"
+            f"--button-bg:{self.button_background};--button-text:{self.button_text};"
+            f"--accent:{self.accent};--track:{self.track};--fill:{self.fill};"
+            f"--value-text:{self.value_text};--font:{self.font};"
+        )
+
+
+THEMES = {
+    theme.name: theme
+    for theme in (
+        Theme("modern", "🚀", "#0f172a", "#1e293b", "#e2e8f0", "#38bdf8", "#334155",
+              "#1e293b", "#38bdf8", "#38bdf8", "#334155", "#38bdf8", "#0f172a"),
+        Theme("professional", "📌", "#eef2f7", "#ffffff", "#1f2937", "#1d4ed8", "#cbd5e1",
+              "#dbeafe", "#1d4ed8", "#1d4ed8", "#e5e7eb", "#2563eb", "#ffffff"),
+        Theme("business", "🎯", "#f3f4f6", "#ffffff", "#111827", "#0f766e", "#d1d5db",
+              "#ccfbf1", "#0f766e", "#0f766e", "#e5e7eb", "#0d9488", "#ffffff"),
+        Theme("creative", "🎨", "#fff7ed", "#ffffff", "#3b0764", "#c026d3", "#f5d0fe",
+              "#fae8ff", "#86198f", "#c026d3", "#f3e8ff", "#d946ef", "#ffffff"),
+        Theme("vintage", "📜", "#f4f0e6", "#fff8f0", "#222222", "#6b4c3b", "#d4bfa3",
+              "#e0d7c3", "#6b4c3b", "#6b4c3b", "#dddddd", "#6b4c3b", "#fff8f0"),
+        Theme("whimsical", "✨", "#f0f8ff", "#ffffff", "#333366", "#6a5acd", "#d8d8f0",
+              "#add8e6", "#333366", "#6a5acd", "#e0e0f8", "#ff69b4", "#ffffff"),
+        Theme("charming", "🌸", "#fdf5e6", "#ffffff", "#333333", "#a0522d", "#f1d9c4",
+              "#fbe3d0", "#a0522d", "#a0522d", "#f3e6da", "#cd853f", "#ffffff"),
+        Theme("epic", "⚔", "#111111", "#1c1917", "#f5f5f4", "#fbbf24", "#44403c",
+              "#292524", "#fbbf24", "#fbbf24", "#44403c", "#d97706", "#111111"),
+        Theme("intense", "🔥", "#190505", "#2a0a0a", "#fde8e8", "#f87171", "#7f1d1d",
+              "#450a0a", "#fca5a5", "#f87171", "#450a0a", "#ef4444", "#190505"),
+        Theme("playful", "🎈", "#fefce8", "#ffffff", "#1e3a8a", "#f97316", "#fde68a",
+              "#fef3c7", "#c2410c", "#f97316", "#fef3c7", "#fb923c", "#ffffff"),
+        Theme("minimalist", "▪", "#fafafa", "#ffffff", "#171717", "#171717", "#e5e5e5",
+              "#f5f5f5", "#171717", "#171717", "#e5e5e5", "#404040", "#ffffff"),
+        Theme("nature", "🌿", "#f0fdf4", "#ffffff", "#14532d", "#15803d", "#bbf7d0",
+              "#dcfce7", "#166534", "#15803d", "#dcfce7", "#22c55e", "#ffffff"),
+        Theme("futuristic", "🛸", "#030712", "#0b1120", "#e0f2fe", "#a78bfa", "#312e81",
+              "#1e1b4b", "#c4b5fd", "#a78bfa", "#1e1b4b", "#8b5cf6", "#030712"),
+        Theme("academic", "📚", "#f8fafc", "#ffffff", "#1e293b", "#7c2d12", "#e2e8f0",
+              "#f1f5f9", "#7c2d12", "#7c2d12", "#e2e8f0", "#9a3412", "#ffffff"),
+    )
+}
+
+# Styles the planner commonly emits that map onto one of the themes above.
+ALIASES = {
+    "corporate": "business",
+    "formal": "professional",
+    "clean": "minimalist",
+    "minimal": "minimalist",
+    "simple": "minimalist",
+    "fantasy": "epic",
+    "adventure": "epic",
+    "heroic": "epic",
+    "action": "intense",
+    "dramatic": "intense",
+    "bold": "intense",
+    "fun": "playful",
+    "cheerful": "playful",
+    "kids": "playful",
+    "artistic": "creative",
+    "retro": "vintage",
+    "classic": "vintage",
+    "historical": "vintage",
+    "magical": "whimsical",
+    "dreamy": "whimsical",
+    "cute": "charming",
+    "warm": "charming",
+    "cozy": "charming",
+    "organic": "nature",
+    "eco": "nature",
+    "tech": "futuristic",
+    "techy": "futuristic",
+    "sci-fi": "futuristic",
+    "space": "futuristic",
+    "educational": "academic",
+    "scholarly": "academic",
+    "scientific": "academic",
+}
+
+DEFAULT_THEME = "modern"
+
+
+def theme_for(style):
+    """Returns the theme for a planner `style` word, falling back to the default."""
+    key = (style or "").strip().lower()
+    for word in [key, *key.replace("/", " ").replace("-", " ").split()]:
+        name = ALIASES.get(word, word)
+        if name in THEMES:
+            return THEMES[name]
+    return THEMES[DEFAULT_THEME]
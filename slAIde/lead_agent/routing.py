@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+
+from lead_agent import config
+from lead_agent.cache import stage_for
+from lead_agent.render import load_json_state
+
+logger = logging.getLogger(__name__)
+
+# Per-stage policy: what to measure, then tiers as [upper bound (inclusive, None for no
+# bound), model tier, max_output_tokens]; the first tier whose bound covers the size wins.
+# The token figure is the answer budget: thinking headroom is added on top, and routing
+# only ever raises a lower cap the agent set itself, never lowers one.
+#   "prompt_chars" - characters of the request contents (the user's prompt or transcript)
+#   "slides"       - slide titles in `json_plan`; a per-slide writer always counts 1
+DEFAULT_POLICY = {
+    "json_plan": {
+        "measure": "prompt_chars",
+        "tiers": [[4000, "fast", 2048], [None, "standard", 4096]],
+    },
+    "all_slides_content": {
+        "measure": "slides",
+        "tiers": [[1, "fast", 2048], [6, "fast", 8192], [15, "standard", 16384], [None, "standard", 32768]],
+    },
+    "final_html": {
+        "measure": "slides",
+        "tiers": [[6, "standard", 16384], [None, "standard", 65536]],
+    },
+    "input_outline": {
+        "measure": "prompt_chars",
+        "tiers": [[None, "fast", 2048]],
+    },
+    "edit_plan": {
+        "measure": "slides",
+        "tiers": [[None, "fast", 2048]],
+    },
+}
+
+
+def load_policy(override=None):
+    """Returns DEFAULT_POLICY with stages from `override` (a JSON file path or JSON text) replaced."""
+    policy = dict(DEFAULT_POLICY)
+    if override:
+        if os.path.exists(override):
+            with open(override, encoding="utf-8") as f:
+                override = f.read()
+        policy.update(json.loads(override))
+    for stage, rule in policy.items():
+        if rule["measure"] not in ("prompt_chars", "slides"):
+            raise ValueError(f"routing policy for {stage!r}: unknown measure {rule['measure']!r}")
+        for _, tier, _ in rule["tiers"]:
+            if tier not in config.MODEL_TIERS:
+                raise ValueError(f"routing policy for {stage!r}: unknown model tier {tier!r}")
+    return policy
+
+
+policy = load_policy(config.ROUTING_POLICY) if config.ROUTING == "size" else None
+
+
+def measure(rule, agent_name, state, llm_request):
+    if rule["measure"] == "prompt_chars":
+        return sum(
+            len(part.text or "")
+            for content in llm_request.contents or []
+            for part in content.parts or []
+        )
+    if agent_name.startswith("SlideWriter_"):
+        return 1
+    try:
+        return len(load_json_state(state.get("json_plan")).get("slides") or [])
+    except ValueError:
+        return 0
+
+
+def choose(stage, size):
+    """Returns (model, max_output_tokens) for a stage and measured size, or None if unrouted."""
+    rule = policy.get(stage) if policy else None
+    if rule is None:
+        return None
+    for bound, tier, max_tokens in rule["tiers"]:
+        if bound is None or size <= bound:
+            return config.MODEL_TIERS[tier], max_tokens
+    return None
+
+
+def thinking_headroom(llm_request):
+    """Output tokens to reserve for thinking, which shares the max_output_tokens cap."""
+    thinking = llm_request.config.thinking_config
+    if thinking is not None and thinking.thinking_budget is not None and thinking.thinking_budget >= 0:
+        return thinking.thinking_budget
+    return config.ROUTING_THINKING_HEADROOM
+
+
+def route_model(callback_context, llm_request):
+    """before_model_callback: sets the request's model, and raises its output budget, for its stage and size.
+
+    Runs before the cache lookup so cache keys reflect the routed model.
+    """
+    if policy is None:
+        return None
+    stage = stage_for(callback_context.agent_name)
+    rule = policy.get(stage)
+    if rule is None:
+        return None
+    size = measure(rule, callback_context.agent_name, callback_context.state, llm_request)
+    choice = choose(stage, size)
+    if choice is None:
+        return None
+    model, max_tokens = choice
+    llm_request.model = model
+    budget = max_tokens + thinking_headroom(llm_request)
+    # No cap means the model's own limit, which is already the most it can give.
+    current = llm_request.config.max_output_tokens
+    if current is not None and current < budget:
+        llm_request.config.max_output_tokens = budget
+    logger.debug(
+        "%s: %s=%d -> %s, max %s output tokens",
+        stage, rule["measure"], size, model, llm_request.config.max_output_tokens,
+    )
+    return None
@@ -0,0 +1,47 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SlidePlan(BaseModel):
+    """The planner's `json_plan` output."""
+
+    # The prompts and downstream stages use the hyphenated keys; keep them on the wire and in state.
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+    style: str = Field(description="A one-word description of the visual theme.")
+    slides: list[str] = Field(description="The title or main topic of each slide, in order.")
+    stats_categories: list[str] = Field(
+        default_factory=list,
+        alias="stats-categories",
+        description="Bar chart labels; empty when the input has no statistics.",
+    )
+    stats_numbers: list[float] = Field(
+        default_factory=list,
+        alias="stats-numbers",
+        description="Bar chart values, matching stats-categories by index.",
+    )
+
+
+class SlideDeckContent(BaseModel):
+    """The writer's `all_slides_content` output."""
+
+    style: str = Field(description="The style copied from the plan.")
+    all_slides_content: list[str] = Field(
+        description="One markdown string per slide: a heading plus bullets, or a ```bar fence."
+    )
+
+
+class SlideEdit(BaseModel):
+    index: int = Field(description="0-based index of the slide to change, or the slide count to append a new slide.")
+    title: str = Field(description="The slide's title after the change.")
+    instruction: str = Field(description="What to change on this slide.")
+
+
+class DeckEditPlan(BaseModel):
+    """The edit planner's `edit_plan` output: only the slides a change request touches."""
+
+    edits: list[SlideEdit] = Field(description="One entry per slide that must be rewritten or added.")
+    style: Optional[str] = Field(
+        default=None, description="A new one-word style, only if the change asks for a different look."
+    )
@@ -0,0 +1,168 @@
+"""Deterministic bar chart data extraction from the user's input.
+
+One regex pass splits the text into clauses and finds the numbers in them; clauses with a
+single number become (label, value, unit) candidates, which are grouped by unit to pick the
+largest series that shares one. Work is linear in the input length.
+"""
+
+import re
+
+# At least this many rows sharing a unit make a chart series. A series is only trusted
+# as-is (confident) when it has HIGH_CONFIDENCE_SERIES rows, covers HIGH_CONFIDENCE_SHARE
+# of the single-number clauses and every label is clean (see clean_label); otherwise it
+# is only a hint for the planner.
+MIN_SERIES = 3
+HIGH_CONFIDENCE_SERIES = 4
+HIGH_CONFIDENCE_SHARE = 0.8
+MAX_LABEL_WORDS = 4
+MAX_CLEAN_LABEL_WORDS = 3
+MAX_CANDIDATES = 3
+
+# Clauses end at punctuation (but not inside "1,250" or "3.5") and at line breaks that
+# start a list item or paragraph; other line breaks are soft wraps.
+_CLAUSE = re.compile(r"(?:[^.;!?,\n]|[.,](?=\d)|\n(?![ \t]*(?:[-*•]|\d+[.)]\s|\n)))+")
+_NUMBER = re.compile(
+    r"(?P<currency>[$€£¥])?\s?(?<![\w.])(?P<value>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+    r"\s?(?P<scale>%|percent\b|k\b|thousand\b|m\b|mn\b|million\b|b\b|bn\b|billion\b|trillion\b)?",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9&'\-]*")
+_SCALES = {
+    "k": 1e3, "thousand": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9, "trillion": 1e12,
+}
+_STOPWORDS = frozenset(
+    "a an and are as at by for from in into is it its of on or over per than that the their "
+    "then to under up was were which while with within about around nearly almost just only "
+    "followed leads led had has have reached reaching totaled totalling total operating like such "
+    "also grew rose fell increased decreased dropped came stood surged climbed hit "
+    "i we you he she they us our your his her them sold made earned spent saw got".split()
+)
+
+
+def _year(value, currency, scale):
+    return not currency and not scale and value.is_integer() and 1900 <= value <= 2100
+
+
+def _label_before(words):
+    """Names the number from the words before it, skipping connectives.
+
+    "net income $800 million" -> "net income", "NASA leads with 150" -> "NASA".
+    """
+    end = len(words)
+    while end and words[end - 1].lower() in _STOPWORDS:
+        end -= 1
+    start = end
+    while start and end - start < MAX_LABEL_WORDS and words[start - 1].lower() not in _STOPWORDS:
+        start -= 1
+    return " ".join(words[start:end]) or None
+
+
+def _label_after(words):
+    """The words naming what was counted after the number ("lunar landings")."""
+    label = []
+    for word in words:
+        if word.lower() in _STOPWORDS:
+            if label:
+                break
+            continue
+        label.append(word)
+        if len(label) == MAX_LABEL_WORDS:
+            break
+    return " ".join(label) or None
+
+
+def clean_label(label):
+    """Whether a label reads like a category name ("NASA", "Q1", "North America").
+
+    Short, and starting with a capital or a digit: a lowercase fragment such as "costs"
+    is more likely part of a sentence than the name of a bar.
+    """
+    words = label.split()
+    return 0 < len(words) <= MAX_CLEAN_LABEL_WORDS and (label[0].isupper() or label[0].isdigit())
+
+
+def _unit_word(words):
+    for word in words:
+        lower = word.lower()
+        if lower not in _STOPWORDS:
+            return lower[:-1] if lower.endswith("s") and len(lower) > 3 else lower
+    return None
+
+
+def candidates(text):
+    """Returns (label, value, unit) rows for clauses holding exactly one non-year number."""
+    rows = []
+    for sentence_start, clause in _clauses(text):
+        numbers = [
+            m for m in _NUMBER.finditer(clause)
+            if not _year(float(m.group("value").replace(",", "")), m.group("currency"), m.group("scale"))
+        ]
+        if len(numbers) != 1:
+            continue
+        number = numbers[0]
+        value = float(number.group("value").replace(",", ""))
+        scale = (number.group("scale") or "").lower()
+        before = _WORD.findall(clause[:number.start()])
+        after = _WORD.findall(clause[number.end():])
+        label = _label_before(before)
+        if label:
+            unit = "%" if scale in ("%", "percent") else (number.group("currency") or _unit_word(after))
+            if unit is None and rows and rows[-1][3] == sentence_start:
+                # "followed by ESA with 45" shares the unit of the sentence's earlier number.
+                unit = rows[-1][2]
+        else:
+            label, unit = _label_after(after), "count"
+        if label:
+            rows.append((label, value * _SCALES.get(scale, 1.0), unit or "", sentence_start))
+    return [(label, value, unit) for label, value, unit, _ in rows]
+
+
+def _clauses(text):
+    sentence_start = 0
+    for match in _CLAUSE.finditer(text):
+        if match.start() > 0 and text[match.start() - 1] in ".!?\n":
+            sentence_start = match.start()
+        yield sentence_start, match.group()
+
+
+def extract_series(text):
+    """Returns {"categories", "numbers", "unit", "confident", "alternatives"} or None.
+
+    Rows are grouped by unit; the largest group with at least MIN_SERIES distinct labels
+    is the series, and the next groups are offered as alternatives.
+    """
+    rows = candidates(text)
+    if len(rows) < MIN_SERIES:
+        return None
+    # unit -> {lowercased label: (label, value)}, keeping each label's first value.
+    groups = {}
+    counts = {}
+    for label, value, unit in rows:
+        groups.setdefault(unit, {}).setdefault(label.lower(), (label, round(value, 6)))
+        counts[unit] = counts.get(unit, 0) + 1
+    series = []
+    # Most rows first; ties keep the units' first-seen order.
+    for unit in sorted(groups, key=lambda u: -counts[u]):
+        if counts[unit] < MIN_SERIES:
+            break
+        members = groups[unit].values()
+        if len(members) >= MIN_SERIES:
+            series.append((unit, [label for label, _ in members], [value for _, value in members]))
+        if len(series) > MAX_CANDIDATES:
+            break
+    if not series:
+        return None
+    unit, labels, numbers = series[0]
+    confident = (
+        len(labels) >= HIGH_CONFIDENCE_SERIES
+        and len(labels) >= HIGH_CONFIDENCE_SHARE * len(rows)
+        and all(clean_label(label) for label in labels)
+    )
+    return {
+        "categories": labels,
+        "numbers": numbers,
+        "unit": unit,
+        "confident": confident,
+        "alternatives": [{"categories": l, "numbers": n, "unit": u} for u, l, n in series[1:]],
+    }
@@ -0,0 +1,156 @@
+from typing import AsyncGenerator, Union
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.models import BaseLlm
+
+from lead_agent import callbacks, config
+from lead_agent.events import final_text, slide_index, strip_fence
+from lead_agent.render import (
+    is_template_deck,
+    load_json_state,
+    load_slides_content,
+    render_deck,
+    render_slide,
+    replace_slide,
+    replace_theme,
+    theme_for,
+)
+from lead_agent.render.markdown import parse_slide
+from lead_agent.schemas import DeckEditPlan, SlideDeckContent
+from lead_agent.subagents.parallel_slide_writer_agent.agent import run_concurrently, slide_writer
+
+# Session state key holding {"change": str, "slides": [int] | None} for an edit run.
+EDIT_REQUEST_KEY = "edit_request"
+
+PLANNER_INSTRUCTION = """You are editing an existing presentation. Decide which slides a change request affects.
+
+Current style: {style}
+Current slides (0-based index: title):
+{outline}
+
+Change request:
+{change}
+
+Output a JSON object with:
+1. "edits": one entry per slide that must change, each with "index", the slide's "title" after the change,
+   and an "instruction" describing what to change on that slide. To add a slide, use the next index after the
+   last slide. Leave out every slide the change does not affect.
+2. "style": a new one-word style only if the change asks for a different look; otherwise omit it.
+"""
+
+
+class DeckEditor(BaseAgent):
+    """Applies a change request to an existing deck, rewriting only the slides it affects.
+
+    Reads `json_plan`, `all_slides_content` and `edit_request` from state, and writes the
+    updated plan and content plus `edited_slides` ({index: slide html}) for the re-rendered
+    fragments. A template-rendered `final_html` in state is patched with those fragments
+    (and the new theme) rather than re-rendered; any other deck, e.g. one from the LLM
+    renderer, has no slide sections to patch and is re-rendered from the updated content.
+    Explicit `slides` in the request skip the planning call.
+    """
+
+    concurrency: int = 8
+    model: Union[str, BaseLlm] = "gemini-2.5-flash"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        plan = dict(load_json_state(state.get("json_plan")))
+        style, slides = load_slides_content(state.get("all_slides_content"), plan.get("style", ""))
+        request = state.get(EDIT_REQUEST_KEY) or {}
+        change = request.get("change", "")
+        titles = [parse_slide(markdown).title for markdown in slides]
+
+        if request.get("slides"):
+            edits = [
+                {"index": i, "title": titles[i] if i < len(titles) else "", "instruction": change}
+                for i in request["slides"]
+            ]
+            new_style = None
+        else:
+            planner = self._planner(style, titles, change)
+            async for event in planner.run_async(ctx):
+                yield event
+            edit_plan = state.get("edit_plan") or {}
+            edits = edit_plan.get("edits", [])
+            new_style = edit_plan.get("style")
+
+        # Valid targets only: an existing slide, or appending right after the last one.
+        targets = {}
+        for edit in edits:
+            index = edit["index"]
+            if 0 <= index <= len(slides) and index not in targets:
+                targets[index] = edit
+        if len(slides) in targets:
+            slides.append("")
+            titles.append(targets[len(slides) - 1]["title"])
+
+        writers = [
+            slide_writer(
+                index, edit["title"] or titles[index], style, titles, self.model,
+                current=slides[index], change=edit["instruction"],
+            )
+            for index, edit in sorted(targets.items())
+        ]
+        async for event in run_concurrently(ctx, self.name, writers, self.concurrency):
+            index = slide_index(event.author)
+            text = final_text(event)
+            if index is not None and text:
+                slides[index] = strip_fence(text)
+            yield event
+
+        changed = sorted(targets)
+        restyled = bool(new_style and new_style != style)
+        if restyled:
+            # The emoji bullets come from the theme, so every slide's markup changes.
+            style = new_style
+            changed = list(range(len(slides)))
+        theme = theme_for(style)
+        fragments = {index: render_slide(slides[index], theme, index) for index in changed}
+
+        plan["style"] = style
+        plan["slides"] = [parse_slide(markdown).title or title for markdown, title in zip(slides, titles)]
+        content = SlideDeckContent(style=style, all_slides_content=slides)
+        delta = {"json_plan": plan, "all_slides_content": content.model_dump(), "edited_slides": fragments}
+        html = state.get("final_html")
+        if is_template_deck(html):
+            if restyled:
+                html = replace_theme(html, style)
+            for index, fragment in sorted(fragments.items()):
+                html = replace_slide(html, index, fragment)
+            delta["final_html"] = html
+        elif html:
+            delta["final_html"] = render_deck(style, slides)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=delta),
+        )
+
+    def _planner(self, style, titles, change):
+        outline = "\n".join(f"{i}: {title}" for i, title in enumerate(titles))
+        instruction = PLANNER_INSTRUCTION.format(style=style, outline=outline, change=change)
+        return LlmAgent(
+            name="SlideEditPlanner",
+            model=self.model,
+            instruction=lambda _: instruction,
+            include_contents="none",
+            output_schema=DeckEditPlan,
+            output_key="edit_plan",
+            disallow_transfer_to_parent=True,
+            disallow_transfer_to_peers=True,
+            before_model_callback=callbacks.BEFORE_MODEL,
+            after_model_callback=callbacks.AFTER_MODEL,
+            on_model_error_callback=callbacks.ON_MODEL_ERROR,
+            description="Works out which slides a change request affects.",
+        )
+
+
+Deck_edit_agent = DeckEditor(
+    name="DeckEditor",
+    concurrency=config.WRITER_CONCURRENCY,
+    description="Applies a change request to an existing deck by rewriting and re-rendering only the affected slides.",
+)
@@ -0,0 +1,56 @@
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.sessions import State
+
+from lead_agent import config
+from lead_agent.render import load_json_state, render_shell
+
+# Invocation-scoped (temp:) so the prebuilt shell is never persisted with the session.
+SHELL_KEY = State.TEMP_PREFIX + "deck_shell"
+
+
+def plan_title(plan):
+    for title in plan.get("slides") or []:
+        title = str(title).strip().lstrip("#").strip()
+        if title:
+            return title
+    return "Presentation"
+
+
+class DeckShellBuilder(BaseAgent):
+    """Speculatively renders the deck shell (document head, runtime, theme) from `json_plan`.
+
+    Runs alongside the writer, since the shell depends only on the planned style and
+    title. Writes {"style", "title", "runtime", "html"} to SHELL_KEY; the template
+    renderer reuses it when the written content kept that style and title, and renders
+    a fresh shell otherwise.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        plan = load_json_state(ctx.session.state.get("json_plan"))
+        style = plan.get("style", "")
+        title = plan_title(plan)
+        shell = {"style": style, "title": title, "runtime": config.RUNTIME, "html": render_shell(style, title)}
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={SHELL_KEY: shell}),
+        )
+
+
+def prebuilt_shell(state, style, title):
+    """Returns the speculative shell's HTML if it was built for this style and title, else None."""
+    shell = state.get(SHELL_KEY)
+    if shell and (shell["style"], shell["title"], shell["runtime"]) == (style, title, config.RUNTIME):
+        return shell["html"]
+    return None
+
+
+Deck_shell_agent = DeckShellBuilder(
+    name="DeckShellBuilder",
+    description="Builds the deck's document shell and theme from the plan while the slides are being written.",
+)
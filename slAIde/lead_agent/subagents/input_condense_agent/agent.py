@@ -0,0 +1,106 @@
+import logging
+from typing import AsyncGenerator, Union
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.models import BaseLlm
+
+from lead_agent import callbacks, config
+from lead_agent.chunking import OUTLINE_KEY, iter_chunks, needs_condensing
+from lead_agent.events import final_text
+from lead_agent.subagents.parallel_slide_writer_agent.agent import run_concurrently
+
+SUMMARIZER_PREFIX = "InputSummarizer_"
+# Reduce rounds over the joined summaries before the outline is used as it is.
+MAX_REDUCE_ROUNDS = 3
+# A chunk whose summary failed (or came back empty) keeps this much of its raw text,
+# about what a summary would take, so one bad chunk neither fails the request nor undoes the condensing.
+FALLBACK_CHARS = 2000
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_INSTRUCTION = """You are condensing part {number} of {total} of a long story, presentation script, or lecture
+so a presentation can be planned from the condensed version.
+
+Write a compact outline of this part only:
+- One line naming its main topic.
+- Up to 6 bullet points with its key points.
+- Keep every statistic, number, and named entity exactly as written, with what it measures.
+
+Output only the outline.
+
+PART {number} OF {total}:
+{chunk}
+"""
+
+
+def summarizer(index, total, text, start, end, model):
+    """Builds the map-step agent for one chunk; the chunk is sliced only when it runs."""
+    return LlmAgent(
+        name=f"{SUMMARIZER_PREFIX}{index}",
+        model=model,
+        instruction=lambda _: SUMMARY_INSTRUCTION.format(number=index + 1, total=total, chunk=text[start:end]),
+        include_contents="none",
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+        before_model_callback=callbacks.BEFORE_MODEL,
+        after_model_callback=callbacks.AFTER_MODEL,
+        on_model_error_callback=callbacks.ON_MODEL_ERROR,
+        description=f"Condenses part {index + 1} of a long input.",
+    )
+
+
+class LongInputCondenser(BaseAgent):
+    """Map-reduce condensing of over-long inputs before the planner.
+
+    Inputs under SLAIDE_CHUNK_THRESHOLD_CHARS pass through untouched. Longer ones are
+    split on section boundaries, each chunk is summarized concurrently, and the joined
+    summaries are condensed again until they fit; the result is written to
+    `input_outline`, which replaces the raw input in every later model call.
+    """
+
+    concurrency: int = 8
+    chunk_chars: int = 12000
+    model: Union[str, BaseLlm] = "gemini-2.5-flash"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        content = ctx.user_content
+        text = "\n".join(part.text for part in (content.parts if content else None) or [] if part.text)
+        if not needs_condensing(text):
+            return
+        for _ in range(MAX_REDUCE_ROUNDS):
+            text = await self._condense(ctx, text)
+            if not needs_condensing(text):
+                break
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={OUTLINE_KEY: text}),
+        )
+
+    async def _condense(self, ctx, text):
+        spans = list(iter_chunks(text, self.chunk_chars))
+        agents = [summarizer(i, len(spans), text, start, end, self.model) for i, (start, end) in enumerate(spans)]
+        summaries = [None] * len(spans)
+
+        def skip_failed(agent, error):
+            logger.warning("%s failed, keeping its chunk's opening text: %r", agent.name, error)
+
+        # The summaries are collected here rather than yielded, so the session history
+        # (and the planner's context) only ever holds the final outline.
+        async for event in run_concurrently(ctx, self.name, agents, self.concurrency, on_error=skip_failed):
+            index = int(event.author[len(SUMMARIZER_PREFIX):])
+            summaries[index] = final_text(event) or summaries[index]
+        return "\n\n".join(
+            summary or text[start:min(end, start + FALLBACK_CHARS)] for summary, (start, end) in zip(summaries, spans)
+        )
+
+
+Input_condense_agent = LongInputCondenser(
+    name="LongInputCondenser",
+    concurrency=config.CHUNK_CONCURRENCY,
+    chunk_chars=config.CHUNK_CHARS,
+    description="Splits long inputs on section boundaries, summarizes the chunks concurrently, and reduces them to a compact outline for the planner.",
+)
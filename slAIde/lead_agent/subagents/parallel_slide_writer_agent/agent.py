@@ -0,0 +1,188 @@
+import asyncio
+from typing import AsyncGenerator, Union
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.models import BaseLlm
+from google.genai import types
+
+from lead_agent import callbacks, config
+from lead_agent.events import SLIDE_WRITER_PREFIX, final_text, slide_index, strip_fence
+from lead_agent.render import load_json_state
+from lead_agent.schemas import SlideDeckContent
+
+SLIDE_INSTRUCTION = """You are an expert content creator for presentations. You are writing ONE slide of a "{style}" presentation.
+
+The full deck, for context only (do not write the other slides):
+{outline}
+
+Write the slide titled: {title}
+
+Output markdown for this slide only:
+- The slide title as a markdown heading ("# {title}").
+- Exactly 5 bullet points ("- ...") summarizing the slide topic.
+- Keep bullet points brief and clear.
+
+Output only the raw markdown, with no code fences and no extra text.
+"""
+
+EDIT_INSTRUCTION = """
+You are revising this slide, not writing it from scratch. Its current content is:
+{current}
+
+Change requested: {change}
+
+Apply the change and keep everything it does not affect. If the current content is a
+bar chart (a ```bar block of "Label: value" lines), keep that format and its title, and
+output the fenced block instead of bullet points.
+"""
+
+
+def chart_stats(plan):
+    """Returns the plan's bar chart rows, or [] when the planner's chart rules aren't met."""
+    categories = plan.get("stats-categories") or []
+    numbers = plan.get("stats-numbers") or []
+    if len(categories) < 3 or len(categories) != len(numbers):
+        return []
+    return list(zip(categories, numbers))
+
+
+def is_chart_slide(title):
+    return "bar chart" in title.lower()
+
+
+def chart_slide(title, stats):
+    rows = "\n".join(f"{label}: {value}" for label, value in stats)
+    return f"# {title}\n```bar\n{rows}\n```"
+
+
+def placeholder_slide(title):
+    """Stands in for a slide nothing was written for, so later slides keep their index."""
+    return f"# {title}"
+
+
+def slide_writer(index, title, style, titles, model="gemini-2.5-flash", current=None, change=None):
+    """Builds the writer for one slide; with `change`, it revises `current` instead."""
+    outline = "\n".join(f"{i + 1}. {t}" for i, t in enumerate(titles))
+    instruction = SLIDE_INSTRUCTION.format(style=style, outline=outline, title=title)
+    if change:
+        instruction += EDIT_INSTRUCTION.format(current=current or "(empty)", change=change)
+    return LlmAgent(
+        name=f"{SLIDE_WRITER_PREFIX}{index}",
+        model=model,
+        # A provider, so titles containing braces are not treated as state placeholders.
+        instruction=lambda _: instruction,
+        include_contents="none",
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+        before_model_callback=callbacks.BEFORE_MODEL,
+        after_model_callback=callbacks.AFTER_MODEL,
+        on_model_error_callback=callbacks.ON_MODEL_ERROR,
+        description=f"Writes the markdown content of slide {index + 1}.",
+    )
+
+
+async def run_concurrently(ctx, owner, agents, concurrency, on_error=None):
+    """Runs `agents` concurrently, each on its own branch, and yields their events as they arrive.
+
+    Like ParallelAgent, each agent waits until its event has been consumed by the
+    runner before producing the next one. At most `concurrency` run at once. An agent
+    that raises cancels the others, unless `on_error(agent, error)` is given: then it
+    is called instead and the rest carry on.
+    """
+    if not agents:
+        return
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    queue = asyncio.Queue()
+    done = object()
+
+    async def run(agent):
+        suffix = f"{owner}.{agent.name}"
+        branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+        try:
+            async with semaphore:
+                async for event in agent.run_async(ctx.model_copy(update={"branch": branch})):
+                    consumed = asyncio.Event()
+                    await queue.put((event, consumed))
+                    await consumed.wait()
+        except Exception as error:
+            if on_error is None:
+                raise
+            on_error(agent, error)
+        finally:
+            await queue.put((done, None))
+
+    async with asyncio.TaskGroup() as group:
+        for agent in agents:
+            group.create_task(run(agent))
+        remaining = len(agents)
+        while remaining:
+            event, consumed = await queue.get()
+            if event is done:
+                remaining -= 1
+                continue
+            yield event
+            consumed.set()
+
+
+class ParallelSlideWriter(BaseAgent):
+    """Fan-out replacement for AllSlidesContentWriter: one concurrent writer call per slide."""
+
+    concurrency: int = 8
+    model: Union[str, BaseLlm] = "gemini-2.5-flash"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        plan = load_json_state(ctx.session.state.get("json_plan"))
+        style = plan.get("style", "")
+        titles = [str(t) for t in plan.get("slides") or []]
+        stats = chart_stats(plan)
+
+        slides = [None] * len(titles)
+        writers = []
+        for index, title in enumerate(titles):
+            if not is_chart_slide(title):
+                writers.append(slide_writer(index, title, style, titles, self.model))
+            elif stats:
+                # The chart rows come straight from the plan, so there is nothing to write.
+                slides[index] = chart_slide(title, stats)
+                yield self._announce(ctx, index, slides[index])
+
+        async for event in run_concurrently(ctx, self.name, writers, self.concurrency):
+            index = slide_index(event.author)
+            text = final_text(event)
+            if index is not None and text:
+                slides[index] = strip_fence(text)
+            yield event
+
+        # A writer that returned nothing (or a chart slide without stats) keeps its place,
+        # so slide i of all_slides_content is still title i of the plan and data-index matches.
+        for index, title in enumerate(titles):
+            if not slides[index]:
+                slides[index] = placeholder_slide(title)
+                yield self._announce(ctx, index, slides[index])
+
+        content = SlideDeckContent(style=style, all_slides_content=slides)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"all_slides_content": content.model_dump()}),
+        )
+
+    def _announce(self, ctx, index, markdown):
+        # A slide not written by a model call is still sent like a written one, so
+        # streaming clients see it.
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=f"{SLIDE_WRITER_PREFIX}{index}",
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=markdown)]),
+        )
+
+
+Parallel_slide_writer_agent = ParallelSlideWriter(
+    name="ParallelSlidesContentWriter",
+    concurrency=config.WRITER_CONCURRENCY,
+    description="Generates slide contents from a presentation plan JSON by writing every slide in its own concurrent model call, then reassembling them in order.",
+)
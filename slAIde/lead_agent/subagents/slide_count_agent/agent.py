@@ -1,9 +1,10 @@
 from google.adk.agents import LlmAgent
 
-Slide_count_agent = LlmAgent(
-    name="SlideTopicAndStyleGenerator",
-    model="gemini-2.5-flash",
-    instruction="""You are a presentation architect.
+from lead_agent import callbacks, prompts
+from lead_agent.schemas import SlidePlan
+from lead_agent.subagents.stats_extract_agent.agent import apply_extracted_stats
+
+INSTRUCTION = """You are a presentation architect.
 You will receive a story, presentation script, or lecture from the user. Based on the user's request, generate a JSON object that outlines a presentation.
 If the user's input contains a lot of numerical data or statistics with the SAME LABEL that could be graphed with a bar chart, include at least 1 slide with a title that 
 mentions "Bar Chart". 
@@ -29,7 +30,7 @@ and 15 asteroid or comet visits. These figures highlight not only international
 knowledge about our solar system."
 Example Output:
 ```json
-{
+{{
   "style": "vintage",
   "slides": [
     "The Dawn of the Space Age",
@@ -42,11 +43,40 @@ Example Output:
   "stats-categories": ["NASA", "European Space Agency", "Roscosmos", "SpaceX"],
   "stats-numbers": [150, 45, 35, 25]
 
-}
+}}
 ```
 
+{stats_hints}
 Output *only* the raw JSON object.
-""",
+"""
+
+COMPACT_INSTRUCTION = """You are a presentation architect. From the user's story, script, or lecture, output a JSON presentation outline with:
+1. "style": one word describing the visual theme (e.g. "modern", "professional", "creative").
+2. "slides": a list of slide titles, one per slide.
+3. "stats-categories": descriptive bar chart labels, or [] if the input has no statistics.
+4. "stats-numbers": bar chart values matching "stats-categories" by index, or [].
+
+Only collect statistics that share the SAME label (e.g. active missions per agency). Include a slide whose
+title mentions "Bar Chart" only if there are at least 3 categories and the same number of values; otherwise
+mention no bar chart.
+
+Example: "NASA leads with 150 active missions, followed by ESA with 45 and Roscosmos at 35..." →
+{{"style": "vintage", "slides": ["The Dawn of the Space Age", "Bar Chart: Most Active Missions"],
+ "stats-categories": ["NASA", "European Space Agency", "Roscosmos"], "stats-numbers": [150, 45, 35]}}
+
+{stats_hints}
+Output *only* the raw JSON object.
+"""
+
+Slide_count_agent = LlmAgent(
+    name="SlideTopicAndStyleGenerator",
+    model="gemini-2.5-flash",
+    instruction=prompts.register("json_plan", INSTRUCTION, COMPACT_INSTRUCTION, keys=["stats_hints"]),
     description="Generates a JSON plan for a presentation including style, slide topics, and statistics.",
-    output_key="json_plan"
+    output_key="json_plan",
+    output_schema=SlidePlan,
+    before_model_callback=callbacks.BEFORE_MODEL,
+    after_model_callback=callbacks.AFTER_MODEL,
+    on_model_error_callback=callbacks.ON_MODEL_ERROR,
+    after_agent_callback=apply_extracted_stats,
 )
\ No newline at end of file
@@ -1,9 +1,9 @@
 from google.adk.agents import LlmAgent
 
-Slide_render_agent = LlmAgent(
-    name="FullDeckHtmlRenderer",
-    model="gemini-2.5-flash",
-    instruction="""
+from lead_agent import callbacks, prompts
+from lead_agent.render.sanitize import clean_final_html
+
+INSTRUCTION = """
 You are an expert HTML, CSS, and JavaScript designer. You will be given a JSON object containing a "style" string and an array "all_slides_content" of markdown slide contents.
 
 GOAL
@@ -406,7 +406,26 @@ Edge cases the agent must handle:
 - Avoid DOM position assumptions: always query `.bar-chart` within the slide content.
 
 Now generate the full HTML document for the given input. Output only the raw HTML.
-""",
+"""
+
+# The full prompt without its worked example document, which is most of its input tokens.
+COMPACT_INSTRUCTION = (
+    INSTRUCTION[:INSTRUCTION.index("EXAMPLE (provide this exact example")]
+    + """IMPORTANT: Output **ONLY** the final raw HTML document as `final_html` (no explanation). It must be a full, runnable HTML document for the given input.
+
+"""
+    + INSTRUCTION[INSTRUCTION.index("Edge cases the agent must handle:"):]
+)
+
+Slide_render_agent = LlmAgent(
+    name="FullDeckHtmlRenderer",
+    model="gemini-2.5-flash",
+    instruction=prompts.register("final_html", INSTRUCTION, COMPACT_INSTRUCTION, keys=["all_slides_content"]),
     description="Renders a full HTML presentation from a list of slide contents with navigable arrows. Ensures bar-chart widths are computed relative to the max value, uses distinct track/fill colors, renders only when visible (or after load), and handles parsing edge-cases and tiny/large numeric disparities.",
     output_key="final_html",
+    before_model_callback=callbacks.BEFORE_MODEL,
+    after_model_callback=callbacks.AFTER_MODEL,
+    on_model_error_callback=callbacks.ON_MODEL_ERROR,
+    # Strip stray fences once here so served decks need no per-request cleanup.
+    after_agent_callback=clean_final_html,
 )
\ No newline at end of file
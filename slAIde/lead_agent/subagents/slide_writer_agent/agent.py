@@ -1,9 +1,9 @@
 from google.adk.agents import LlmAgent
 
-Slide_writer_agent = LlmAgent(
-    name="AllSlidesContentWriter",
-    model="gemini-2.5-flash",
-    instruction="""
+from lead_agent import callbacks, prompts
+from lead_agent.schemas import SlideDeckContent
+
+INSTRUCTION = """
 You are an expert content creator for presentations. You will be given a JSON object containing:
 
 1. "style": A one-word description of the presentation style.
@@ -56,7 +56,30 @@ Guidelines:
     "# Bar Chart of Active Missions\\n- NASA: 150\\n- European Space Agency: 45\\n- Roscosmos: 35\\n- SpaceX: 25\\n\\n```bar\\nNASA: 150\\nEuropean Space Agency: 45\\nRoscosmos: 35\\nSpaceX: 25\\n```"
   ]
 }}
-```""",
+```"""
+
+COMPACT_INSTRUCTION = """You are an expert content creator for presentations. Given the presentation plan below, output a JSON object with:
+1. "style": the plan's style, copied as-is.
+2. "all_slides_content": one markdown string per slide in "slides", in order. Each string is the slide title as a
+   "# " heading followed by exactly 5 brief "- " bullet points.
+   A slide whose title mentions a bar chart (only when "stats-categories" and "stats-numbers" have the same length and at
+   least 3 items) has just the heading and a fenced bar block with one "Label: value" line per category, and no bullets:
+   "# Bar Chart of Active Missions\\n```bar\\nNASA: 150\\nRoscosmos: 35\\nSpaceX: 25\\n```"
+
+Output only the JSON object.
+
+**Input JSON**
+{json_plan}
+"""
+
+Slide_writer_agent = LlmAgent(
+    name="AllSlidesContentWriter",
+    model="gemini-2.5-flash",
+    instruction=prompts.register("all_slides_content", INSTRUCTION, COMPACT_INSTRUCTION, keys=["json_plan"]),
     description="Generates a complete set of slide contents from a presentation plan JSON. Converts slide titles and statistics into markdown with bullets and optional bar chart formatting.",
     output_key="all_slides_content",
+    output_schema=SlideDeckContent,
+    before_model_callback=callbacks.BEFORE_MODEL,
+    after_model_callback=callbacks.AFTER_MODEL,
+    on_model_error_callback=callbacks.ON_MODEL_ERROR,
 )
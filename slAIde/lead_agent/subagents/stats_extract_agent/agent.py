@@ -0,0 +1,74 @@
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from lead_agent.render import load_json_state
+from lead_agent.stats import extract_series
+
+HINT_TEMPLATE = """
+Chart data pre-extracted from the input ({unit}):
+{rows}
+{advice}
+"""
+CONFIDENT_ADVICE = (
+    'These exact values will be used for "stats-categories" and "stats-numbers"; '
+    'include one slide whose title mentions "Bar Chart" and describes them.'
+)
+CANDIDATE_ADVICE = (
+    'Use these for "stats-categories" and "stats-numbers" if they share the same label; '
+    "otherwise pick the series from the input yourself."
+)
+
+
+def format_hint(series):
+    if not series:
+        return ""
+    rows = "\n".join(
+        f"- {label}: {number:g}" for label, number in zip(series["categories"], series["numbers"])
+    )
+    unit = f'unit "{series["unit"]}"' if series["unit"] else "shared unit"
+    return HINT_TEMPLATE.format(
+        unit=unit, rows=rows, advice=CONFIDENT_ADVICE if series["confident"] else CANDIDATE_ADVICE
+    )
+
+
+class StatsExtractor(BaseAgent):
+    """Scans the user's input for a label/number series before the planner runs.
+
+    Writes `stats_series` (or None) and the planner prompt text `stats_hints` to state.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        content = ctx.user_content
+        text = "\n".join(part.text for part in (content.parts if content else None) or [] if part.text)
+        series = extract_series(text)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"stats_series": series, "stats_hints": format_hint(series)}),
+        )
+
+
+def apply_extracted_stats(callback_context):
+    """after_agent_callback for the planner: pins a confident extracted series into `json_plan`."""
+    series = callback_context.state.get("stats_series")
+    if not series or not series.get("confident"):
+        return None
+    plan = dict(load_json_state(callback_context.state.get("json_plan")))
+    plan["stats-categories"] = series["categories"]
+    plan["stats-numbers"] = series["numbers"]
+    slides = list(plan.get("slides") or [])
+    if not any("bar chart" in title.lower() for title in slides):
+        slides.append("Bar Chart: Key Figures")
+    plan["slides"] = slides
+    callback_context.state["json_plan"] = plan
+    return None
+
+
+Stats_extract_agent = StatsExtractor(
+    name="StatsExtractor",
+    description="Extracts candidate bar chart series from the input with regex tokenization and grouping by unit, without a model call.",
+)
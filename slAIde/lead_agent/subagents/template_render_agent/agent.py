@@ -0,0 +1,35 @@
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from lead_agent.render import deck_title, load_json_state, load_slides_content, render_deck
+from lead_agent.subagents.deck_shell_agent.agent import prebuilt_shell
+
+
+class TemplateDeckRenderer(BaseAgent):
+    """Deterministic drop-in for FullDeckHtmlRenderer: renders `final_html` locally.
+
+    Only the slides are rendered when DeckShellBuilder already built a matching shell.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        plan_style = load_json_state(state.get("json_plan")).get("style", "")
+        style, slides = load_slides_content(state.get("all_slides_content"), plan_style)
+        html = render_deck(style, slides, shell=prebuilt_shell(state, style, deck_title(slides)))
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=html)]),
+            actions=EventActions(state_delta={"final_html": html}),
+        )
+
+
+Template_render_agent = TemplateDeckRenderer(
+    name="TemplateDeckRenderer",
+    description="Renders a full HTML presentation from a list of slide contents using a precompiled template and per-style theme tables, without a model call.",
+)
@@ -0,0 +1,249 @@
+"""Per-stage timing and token instrumentation for the pipeline.
+
+Agent callbacks time each stage; model callbacks time each model call and count
+tokens and retries. The agents call the model without streaming, so there is no
+separate time to first token: a call's time is its whole response. Every finished stage is
+logged as one JSON line, aggregated into Prometheus-style metrics, and, with
+SLAIDE_OTEL=on, exported as an OpenTelemetry span.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict, defaultdict
+
+from lead_agent import config
+from lead_agent.cache import stage_for
+
+trace = None
+if config.OTEL == "on":
+    try:
+        from opentelemetry import trace
+    except ImportError:  # Spans are optional; logs and /metrics work without them.
+        pass
+
+logger = logging.getLogger(__name__)
+
+# Open timers and per-request stage records kept at most; the oldest are dropped beyond this.
+MAX_TRACKED = 4096
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80, 160)
+
+tracer = trace.get_tracer("slaide") if trace is not None else None
+
+
+class Histogram:
+    def __init__(self, buckets=SECONDS_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class Metrics:
+    """Aggregates since startup, labelled by stage."""
+
+    def __init__(self):
+        self.histograms = defaultdict(lambda: defaultdict(Histogram))
+        self.counters = defaultdict(lambda: defaultdict(int))
+
+    def observe(self, name, stage, seconds):
+        self.histograms[name][stage].observe(seconds)
+
+    def add(self, name, stage, value=1):
+        self.counters[name][stage] += value
+
+    def render(self, gauges=()):
+        """Returns the Prometheus text exposition of every metric.
+
+        `gauges` are (name, value) pairs from outside the pipeline, where value is a
+        number or a {stage: number} dict (e.g. cache hit counts per stage).
+        """
+        lines = []
+        for name, by_stage in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in sorted(by_stage.items()):
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        for name, by_stage in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f'{name}{{stage="{stage}"}} {value}' for stage, value in sorted(by_stage.items()))
+        for name, value in gauges:
+            lines.append(f"# TYPE {name} gauge")
+            if isinstance(value, dict):
+                lines.extend(f'{name}{{stage="{stage}"}} {v}' for stage, v in sorted(value.items()))
+            else:
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+_stages = OrderedDict()  # (invocation_id, agent_name) -> open stage record
+_calls = OrderedDict()  # (invocation_id, agent_name) -> open model call
+_call_counts = OrderedDict()  # (invocation_id, agent_name) -> model calls started
+_timings = OrderedDict()  # invocation_id -> [finished stage records]
+
+
+def _remember(table, key, value):
+    table[key] = value
+    while len(table) > MAX_TRACKED:
+        table.popitem(last=False)
+
+
+def _output_bytes(value):
+    if value is None:
+        return 0
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    return len(text.encode("utf-8"))
+
+
+def start_stage(callback_context):
+    """before_agent_callback: opens the stage record (and span) for a pipeline sub-agent."""
+    record = {
+        "stage": stage_for(callback_context.agent_name),
+        "agent": callback_context.agent_name,
+        "started": time.monotonic(),
+        "model_calls": 0,
+        "retries": 0,
+        "cache_hits": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "model_seconds": 0.0,
+        "span": tracer.start_span(f"slaide.stage {callback_context.agent_name}") if tracer else None,
+    }
+    _remember(_stages, (callback_context.invocation_id, callback_context.agent_name), record)
+    return None
+
+
+def end_stage(callback_context):
+    """after_agent_callback: closes the stage record, then logs and aggregates it."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    record = _stages.pop(key, None)
+    if record is None:
+        return None
+    stage = record["stage"]
+    # A started call that never reached the after-model callbacks was answered from the
+    # cache; that includes the per-slide writers' calls, which belong to this stage.
+    record["cache_hits"] += _forget_calls(callback_context.invocation_id, stage)
+    record["wall_seconds"] = round(time.monotonic() - record.pop("started"), 4)
+    record["output_bytes"] = _output_bytes(callback_context.state.get(stage))
+    span = record.pop("span")
+
+    metrics.observe("slaide_stage_seconds", stage, record["wall_seconds"])
+    for name in ("model_calls", "retries", "cache_hits", "input_tokens", "output_tokens", "output_bytes"):
+        metrics.add(f"slaide_{name}_total", stage, record[name])
+    if span is not None:
+        span.set_attributes({f"slaide.{k}": v for k, v in record.items() if v is not None})
+        span.end()
+
+    stages = _timings.get(callback_context.invocation_id)
+    if stages is None:
+        stages = []
+        _remember(_timings, callback_context.invocation_id, stages)
+    stages.append(record)
+    logger.info(json.dumps(dict(record, event="stage", invocation_id=callback_context.invocation_id)))
+    return None
+
+
+def start_model_call(callback_context, llm_request):
+    """before_model_callback: starts timing a model call (runs after routing, before the cache)."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    calls = _call_counts.get(key, 0) + 1
+    _remember(_call_counts, key, calls)
+    _remember(_calls, key, {"started": time.monotonic(), "model": llm_request.model})
+    record = _stages.get(key) or _open_stage_for(callback_context.invocation_id, stage_for(key[1]))
+    if record is not None and calls > 1:
+        record["retries"] += 1
+    return None
+
+
+def end_model_call(callback_context, llm_response):
+    """after_model_callback: records the total time and tokens of a model call."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    call = _calls.get(key)
+    if call is None:
+        return None
+    if llm_response.partial:
+        return None
+    del _calls[key]
+    stage = stage_for(callback_context.agent_name)
+    seconds = time.monotonic() - call["started"]
+    usage = llm_response.usage_metadata
+    input_tokens = (usage.prompt_token_count or 0) if usage else 0
+    output_tokens = (usage.candidates_token_count or 0) if usage else 0
+    metrics.observe("slaide_model_seconds", stage, seconds)
+    # Per-slide writers are not pipeline sub-agents; their calls roll up into the stage that ran them.
+    record = _stages.get(key) or _open_stage_for(callback_context.invocation_id, stage)
+    if record is not None:
+        record["model_calls"] += 1
+        record["input_tokens"] += input_tokens
+        record["output_tokens"] += output_tokens
+        record["model_seconds"] = round(record["model_seconds"] + seconds, 4)
+    return None
+
+
+def record_model_error(callback_context, llm_request, error):
+    """on_model_error_callback: counts a failed model call; the error still propagates."""
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    _calls.pop(key, None)
+    metrics.add("slaide_model_errors_total", stage_for(callback_context.agent_name))
+    return None
+
+
+def _open_stage_for(invocation_id, stage):
+    for (open_invocation, _), record in reversed(_stages.items()):
+        if open_invocation == invocation_id and record["stage"] == stage:
+            return record
+    return None
+
+
+def _forget_calls(invocation_id, stage=None):
+    """Drops an invocation's call entries (of one stage); returns how many calls never finished."""
+
+    def matches(key):
+        return key[0] == invocation_id and (stage is None or stage_for(key[1]) == stage)
+
+    for key in [key for key in _call_counts if matches(key)]:
+        del _call_counts[key]
+    unfinished = [key for key in _calls if matches(key)]
+    for key in unfinished:
+        del _calls[key]
+    return len(unfinished)
+
+
+def pop_timings(invocation_id):
+    """Returns and forgets one request's finished stage records, in completion order.
+
+    Also drops what is left of its model calls, e.g. those of agents that are not
+    pipeline stages, such as the edit run's writers.
+    """
+    _forget_calls(invocation_id)
+    return _timings.pop(invocation_id, [])
+
+
+def observe_queue(seconds):
+    """Records how long a request waited for a generation slot before the pipeline started."""
+    metrics.observe("slaide_queue_seconds", "queue", seconds)
+
+
+def instrument(agent):
+    """Adds the stage timing callbacks to a pipeline sub-agent, keeping its own callbacks."""
+    agent.before_agent_callback = [start_stage, *_as_list(agent.before_agent_callback)]
+    agent.after_agent_callback = [*_as_list(agent.after_agent_callback), end_stage]
+    return agent
+
+
+def _as_list(callback):
+    if callback is None:
+        return []
+    return list(callback) if isinstance(callback, list) else [callback]
@@ -0,0 +1,63 @@
+import logging
+from collections import OrderedDict, defaultdict
+
+from lead_agent.cache import stage_for
+from lead_agent.prompts import variant_of
+
+logger = logging.getLogger(__name__)
+
+# Invocations whose usage has not been collected yet; oldest are dropped beyond this.
+MAX_TRACKED_INVOCATIONS = 1024
+
+
+def _counts():
+    return {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cached_input_tokens": 0}
+
+
+class UsageLedger:
+    """Token usage per request (invocation) and stage, plus running totals per prompt variant."""
+
+    def __init__(self):
+        self._invocations = OrderedDict()
+        self.totals = defaultdict(lambda: defaultdict(_counts))
+
+    def record(self, invocation_id, stage, variant, usage):
+        stages = self._invocations.get(invocation_id)
+        if stages is None:
+            stages = self._invocations[invocation_id] = {"variant": variant, "stages": defaultdict(_counts)}
+            while len(self._invocations) > MAX_TRACKED_INVOCATIONS:
+                self._invocations.popitem(last=False)
+        for counts in (stages["stages"][stage], self.totals[variant][stage]):
+            counts["calls"] += 1
+            counts["input_tokens"] += usage.prompt_token_count or 0
+            counts["output_tokens"] += usage.candidates_token_count or 0
+            counts["cached_input_tokens"] += usage.cached_content_token_count or 0
+
+    def pop(self, invocation_id):
+        """Returns and forgets one request's usage: {"variant", "stages": {stage: counts}}."""
+        entry = self._invocations.pop(invocation_id, None)
+        if entry is None:
+            return {"variant": None, "stages": {}}
+        return {"variant": entry["variant"], "stages": {k: dict(v) for k, v in entry["stages"].items()}}
+
+    def summary(self):
+        """Returns {variant: {stage: counts}} accumulated since startup."""
+        return {variant: {stage: dict(c) for stage, c in stages.items()} for variant, stages in self.totals.items()}
+
+
+ledger = UsageLedger()
+
+
+def record_usage(callback_context, llm_response):
+    """after_model_callback: books the response's token counts against its request and stage."""
+    usage = llm_response.usage_metadata
+    if usage is None or llm_response.partial:
+        return None
+    stage = stage_for(callback_context.agent_name)
+    variant = variant_of(callback_context.state)
+    ledger.record(callback_context.invocation_id, stage, variant, usage)
+    logger.debug(
+        "%s [%s]: %s input / %s output tokens",
+        stage, variant, usage.prompt_token_count, usage.candidates_token_count,
+    )
+    return None
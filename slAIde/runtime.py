@@ -0,0 +1,149 @@
+import functools
+import logging
+
+from lead_agent import config
+from lead_agent.prompts import VARIANT_KEY, choose_variant
+from lead_agent.telemetry import pop_timings
+from lead_agent.usage import ledger
+
+logger = logging.getLogger(__name__)
+
+APP_NAME = "slAIde"
+USER_ID = "slaide-server"
+
+
+# Persistent sessions outlive the request, so a deck can be edited later by its session_id.
+KEEP_SESSIONS = config.SESSIONS != "memory"
+
+
+class SessionNotFound(KeyError):
+    pass
+
+
+# Runners (and with them google.adk and every agent) are built on first use, so
+# importing this module stays cheap; call preload() to pay that cost up front.
+@functools.cache
+def session_service():
+    from sessions import build_session_service
+
+    return build_session_service(config.SESSIONS, config.SESSION_PATH, config.SESSION_TTL_SECONDS)
+
+
+@functools.cache
+def pipeline_runner():
+    from google.adk.runners import Runner
+
+    from lead_agent import root_agent
+
+    return Runner(agent=root_agent, app_name=APP_NAME, session_service=session_service())
+
+
+@functools.cache
+def stream_runner():
+    from google.adk.runners import Runner
+
+    from lead_agent import stream_agent
+
+    return Runner(agent=stream_agent, app_name=APP_NAME, session_service=session_service())
+
+
+@functools.cache
+def edit_runner():
+    from google.adk.runners import Runner
+
+    from lead_agent.subagents.deck_edit_agent.agent import Deck_edit_agent
+
+    return Runner(agent=Deck_edit_agent, app_name=APP_NAME, session_service=session_service())
+
+
+def preload():
+    """Imports and builds everything a request needs, e.g. before forking workers."""
+    pipeline_runner()
+    stream_runner()
+    edit_runner()
+
+
+async def run_events(prompt, variant=None, state=None, stream=False):
+    """Runs the pipeline in a fresh session and yields its events.
+
+    With `stream`, the pipeline stops once every slide is written and there is no
+    `final_html`: the caller renders the slides itself as they arrive. If given, `state` is filled with the session's state deltas plus the request's
+    `invocation_id`, token `usage` and per-stage `timings`, and, when sessions are
+    persistent, the `session_id` the deck can later be edited by. In-memory sessions
+    are dropped afterwards.
+    """
+    variant = choose_variant(variant)
+    runner = stream_runner() if stream else pipeline_runner()
+    async for event in _run_session(runner, prompt, {VARIANT_KEY: variant}, state):
+        yield event
+
+
+async def _run_session(runner, prompt, initial_state, state, session_id=None):
+    from google.adk.events import Event, EventActions
+    from google.genai import types
+
+    variant = initial_state.get(VARIANT_KEY)
+    if session_id is None:
+        session = await runner.session_service.create_session(
+            app_name=APP_NAME, user_id=USER_ID, state=initial_state
+        )
+    else:
+        session = await runner.session_service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+        if session is None:
+            raise SessionNotFound(session_id)
+        # Resuming: this run's inputs go into the stored state like any other change.
+        await runner.session_service.append_event(
+            session, Event(author="user", actions=EventActions(state_delta=initial_state))
+        )
+    message = types.Content(role="user", parts=[types.Part(text=prompt)])
+    invocation_id = None
+    try:
+        async for event in runner.run_async(user_id=USER_ID, session_id=session.id, new_message=message):
+            invocation_id = event.invocation_id
+            if state is not None and event.actions and event.actions.state_delta:
+                state.update(event.actions.state_delta)
+            yield event
+    finally:
+        usage = ledger.pop(invocation_id)
+        timings = pop_timings(invocation_id)
+        logger.info("deck %s (%s prompts): %s", invocation_id, variant, usage["stages"])
+        if state is not None:
+            state.update(invocation_id=invocation_id, usage=usage, timings=timings)
+        if KEEP_SESSIONS:
+            if state is not None:
+                state["session_id"] = session.id
+        else:
+            await runner.session_service.delete_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+
+
+async def generate(prompt, variant=None):
+    """Runs the whole pipeline for one prompt and returns its final state."""
+    state = {}
+    async for _ in run_events(prompt, variant, state):
+        pass
+    return state
+
+
+async def edit(deck, change, slides=None, variant=None, session_id=None):
+    """Applies `change` to an existing deck's state and returns the edited state.
+
+    `deck` carries the `json_plan`, `all_slides_content` and optionally `final_html`
+    of an earlier run; alternatively `session_id` names a persisted session holding
+    them, which the edit is then applied to. Only the slides the change affects (or
+    the given `slides` indices) are rewritten. Raises SessionNotFound for an unknown
+    or expired session.
+    """
+    from lead_agent.subagents.deck_edit_agent.agent import EDIT_REQUEST_KEY
+
+    initial_state = {
+        VARIANT_KEY: choose_variant(variant),
+        EDIT_REQUEST_KEY: {"change": change, "slides": slides},
+    }
+    if session_id is None:
+        initial_state.update(json_plan=deck["json_plan"], all_slides_content=deck["all_slides_content"])
+        if deck.get("final_html"):
+            initial_state["final_html"] = deck["final_html"]
+    state = {}
+    async for _ in _run_session(edit_runner(), change, initial_state, state, session_id):
+        pass
+    return state
@@ -0,0 +1,113 @@
+"""Pre-forking launcher for the pipeline server.
+
+    cd slAIde
+    python serve.py --workers 4 --port 8000
+
+The master imports the server and builds the pipeline once (runtime.preload), binds the
+listening socket, then forks the workers. Each worker starts with google.adk, every
+agent and the runners already in memory, shared copy-on-write with its siblings, so a
+new or restarted worker serves its first request without paying the import cost.
+Workers that exit are replaced; SIGTERM/SIGINT stop them all. Linux/macOS only (fork).
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+logger = logging.getLogger("slaide.serve")
+
+# A worker that dies sooner than this after starting is not restarted in a tight loop.
+RESTART_BACKOFF_SECONDS = 1.0
+
+
+def bind(host, port):
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(sock, log_level):
+    import server
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    config = uvicorn.Config(server.app, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def spawn(sock, log_level):
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            run_worker(sock, log_level)
+        except BaseException:
+            logger.exception("worker %d crashed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the slAIde pipeline from pre-forked, pre-loaded workers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+
+    started = time.perf_counter()
+    import server  # noqa: F401  (imported before forking so every worker shares it)
+    from runtime import preload
+
+    preload()
+    logger.info("pipeline preloaded in %.2fs", time.perf_counter() - started)
+
+    sock = bind(args.host, args.port)
+    workers = {spawn(sock, args.log_level): time.monotonic() for _ in range(args.workers)}
+    logger.info("serving on %s:%d with %d workers", args.host, args.port, len(workers))
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        born = workers.pop(pid, None)
+        if born is None or stopping:
+            continue
+        logger.warning("worker %d exited (status %d); restarting", pid, status)
+        if time.monotonic() - born < RESTART_BACKOFF_SECONDS:
+            time.sleep(RESTART_BACKOFF_SECONDS)
+        workers[spawn(sock, args.log_level)] = time.monotonic()
+    sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,16 +1,239 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 import asyncio
-from lead_agent import root_agent
-from google.adk.runners import InMemoryRunner
+import contextlib
+import os
+from typing import Any, Optional
+from lead_agent import config
+from lead_agent.cache import stage_cache
+from lead_agent.prompts import prompt_sizes
+from lead_agent.telemetry import metrics, observe_queue
+from lead_agent.render import RUNTIME_FILES
+from lead_agent.usage import ledger
 
-app = FastAPI()
-runner = InMemoryRunner(agent=root_agent)
+from artifacts import ArtifactStore, JobRegistry
+from gate import GateFull, GenerationGate
+from runtime import SessionNotFound, edit, generate, preload, run_events
+from streaming import DeckStream
+
+# Generations running at once, and requests allowed to wait for a slot before
+# new ones get 429 + Retry-After.
+MAX_CONCURRENT = int(os.getenv("SLAIDE_MAX_CONCURRENT", "8"))
+MAX_QUEUED = int(os.getenv("SLAIDE_MAX_QUEUED", "32"))
+DISCONNECT_POLL_SECONDS = 0.5
+# Where finished decks are stored by content hash, and the longest a status request may block.
+ARTIFACT_DIR = os.getenv("SLAIDE_ARTIFACT_DIR", os.path.join(os.path.dirname(__file__), ".artifacts"))
+MAX_WAIT_SECONDS = 60.0
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    if config.PRELOAD == "on":
+        # Pays the agent/ADK import cost before the first request rather than during it.
+        preload()
+    yield
+
+app = FastAPI(lifespan=lifespan)
+gate = GenerationGate(MAX_CONCURRENT, MAX_QUEUED, on_start=observe_queue)
+artifacts = ArtifactStore(ARTIFACT_DIR)
+jobs = JobRegistry()
 
 class PromptRequest(BaseModel):
     prompt: str
+    # "full" or "compact"; omitted requests follow SLAIDE_PROMPT_VARIANT / SLAIDE_PROMPT_COMPACT_SHARE.
+    prompt_variant: Optional[str] = None
+
+class DeckState(BaseModel):
+    json_plan: Any
+    all_slides_content: Any
+    # The deck as last served; when given, the response carries it with the edited slides patched in.
+    final_html: Optional[str] = None
+
+class EditRequest(BaseModel):
+    # The deck to edit: its state, or the session_id a persistent-session server returned for it.
+    deck: Optional[DeckState] = None
+    session_id: Optional[str] = None
+    change: str
+    # 0-based slide indices to rewrite; omitted lets the editor pick the affected slides.
+    slides: Optional[list[int]] = None
+    prompt_variant: Optional[str] = None
+
+def admit():
+    try:
+        return gate.admit()
+    except GateFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+async def generate_deck(request, slot):
+    async with slot:
+        return await generate(request.prompt, request.prompt_variant)
+
+async def wait_for_disconnect(request):
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
 
 @app.post("/run")
-async def run_agent(request: PromptRequest):
-    response = runner.invoke(request.prompt)
-    return {"output": response.output_text}
+async def run_agent(request: PromptRequest, http_request: Request):
+    slot = admit()
+    generation = asyncio.create_task(generate_deck(request, slot))
+    disconnect = asyncio.create_task(wait_for_disconnect(http_request))
+    try:
+        await asyncio.wait({generation, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect.cancel()
+        if not generation.done():
+            # The client went away (or we are shutting down): stop spending model calls on it.
+            generation.cancel()
+            slot.close()
+    # A task cancelled above is only marked cancelled once it next runs, so it is not done yet.
+    if not generation.done() or generation.cancelled():
+        raise HTTPException(status_code=499, detail="Client disconnected")
+    state = generation.result()
+    html = state.get("final_html", "")
+    artifact_id = artifacts.put(html) if html else None
+    return {
+        "output": html,
+        "artifact_id": artifact_id,
+        "html_path": artifacts.path(artifact_id) if artifact_id else None,
+        "session_id": state.get("session_id"),
+        "usage": state.get("usage"),
+        "timings": state.get("timings"),
+    }
+
+@app.post("/artifacts", status_code=202)
+async def start_artifact(request: PromptRequest):
+    """Starts a generation in the background; its job reports the stored deck's artifact id."""
+    slot = admit()
+
+    async def run(job):
+        try:
+            state = await generate_deck(request, slot)
+            html = state.get("final_html")
+            if not html:
+                raise RuntimeError("pipeline produced no final_html")
+            job.finish(artifact_id=artifacts.put(html), usage=state.get("usage"))
+        except Exception as e:
+            job.finish(error=f"{type(e).__name__}: {e}")
+        finally:
+            slot.close()
+
+    job = jobs.start(run)
+    return dict(job.to_dict(), status_url=f"/artifacts/jobs/{job.id}")
+
+@app.get("/artifacts/jobs/{job_id}")
+async def artifact_job(job_id: str, wait: float = 0):
+    """Job status; with `wait` (seconds) the request blocks until the job finishes or the time runs out."""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    if wait > 0:
+        await job.wait(min(wait, MAX_WAIT_SECONDS))
+    return job.to_dict()
+
+# Artifacts are named by their content hash, so the id is a strong ETag and never goes stale.
+ARTIFACT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@app.get("/artifacts/{artifact_id}")
+async def artifact(artifact_id: str, if_none_match: Optional[str] = Header(None)):
+    """Serves a stored deck as-is; it was cleaned once when it was generated."""
+    if not artifacts.exists(artifact_id):
+        raise HTTPException(status_code=404, detail="Unknown artifact")
+    etag = f'"{artifact_id}"'
+    headers = {"ETag": etag, "Cache-Control": ARTIFACT_CACHE_CONTROL}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(artifacts.path(artifact_id), media_type="text/html; charset=utf-8", headers=headers)
+
+async def stream_deck(prompt, variant, slot):
+    deck = DeckStream()
+    yield deck.start()
+    async with slot:
+        try:
+            async for event in run_events(prompt, variant, stream=True):
+                for chunk in deck.feed(event):
+                    yield chunk
+        except Exception as e:
+            yield deck.error(str(e))
+    yield deck.finish()
+
+class SlotStreamingResponse(StreamingResponse):
+    """A StreamingResponse that gives its gate slot back however the response ends.
+
+    A generator's own finally block is not enough: when the client is gone before the
+    first chunk, the generator is never started and so never finalized.
+    """
+
+    def __init__(self, content, slot, **kwargs):
+        super().__init__(content, **kwargs)
+        self.slot = slot
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.slot.close()
+
+def deck_stream_response(prompt, variant=None):
+    slot = admit()
+    return SlotStreamingResponse(
+        stream_deck(prompt, variant, slot),
+        slot,
+        media_type="text/html; charset=utf-8",
+        # Keep proxies from buffering the chunks until the deck is complete.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.post("/run/stream")
+async def run_agent_stream(request: PromptRequest):
+    return deck_stream_response(request.prompt, request.prompt_variant)
+
+@app.get("/run/stream")
+async def run_agent_stream_get(prompt: str, prompt_variant: Optional[str] = None):
+    return deck_stream_response(prompt, prompt_variant)
+
+@app.post("/edit")
+async def edit_deck(request: EditRequest):
+    """Rewrites only the slides a change affects and returns their re-rendered fragments."""
+    if (request.deck is None) == (request.session_id is None):
+        raise HTTPException(status_code=422, detail="Give exactly one of deck or session_id")
+    deck = request.deck.model_dump() if request.deck else None
+    async with admit():
+        try:
+            state = await edit(deck, request.change, request.slides, request.prompt_variant, request.session_id)
+        except SessionNotFound:
+            raise HTTPException(status_code=404, detail="Unknown or expired session")
+    return {
+        "deck": {
+            "json_plan": state.get("json_plan"),
+            "all_slides_content": state.get("all_slides_content"),
+            "final_html": state.get("final_html"),
+        },
+        "edited_slides": state.get("edited_slides", {}),
+        "session_id": state.get("session_id"),
+        "usage": state.get("usage"),
+    }
+
+@app.get("/runtime/{name}")
+async def runtime_bundle(name: str):
+    """Serves the versioned deck runtime referenced by decks rendered with SLAIDE_RUNTIME=link."""
+    if name not in RUNTIME_FILES:
+        raise HTTPException(status_code=404, detail="Unknown runtime bundle")
+    media_type, body = RUNTIME_FILES[name]
+    # The name carries the content hash, so a given URL never changes.
+    return Response(body, media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+if config.METRICS == "on":
+    @app.get("/metrics")
+    async def metrics_endpoint():
+        """Prometheus text metrics: stage/model/queue latency histograms, token and cache counters."""
+        gauges = [("slaide_generations_active", gate.active), ("slaide_generations_waiting", gate.waiting)]
+        if stage_cache is not None:
+            cache_stats = stage_cache.stats()
+            gauges += [(f"slaide_cache_{name}", {stage: c[name] for stage, c in cache_stats.items()})
+                       for name in ("hits", "misses", "stores")]
+        return Response(metrics.render(gauges), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/usage")
+async def usage_summary():
+    """Token totals per prompt variant and stage since startup, plus each prompt's size."""
+    return {"totals": ledger.summary(), "prompt_chars": prompt_sizes()}
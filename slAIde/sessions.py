@@ -0,0 +1,313 @@
+"""Persistent session backends for the pipeline runners.
+
+ADK's InMemorySessionService keeps every session in one process's memory, so a deck's
+state is gone on restart and invisible to other workers. These services store each
+session's state (json_plan, all_slides_content, final_html, ...) as zlib-compressed
+JSON, either in a SQLite database (one node, any number of processes) or as one file
+per session in a shared directory, so any worker can resume or edit a deck another
+one generated.
+
+Only state is persisted. Events live on the Session object for the run in progress
+(the pipeline's agents read each other's output from state, not from history), which
+keeps records small and writes to one per state change. Sessions expire `ttl` seconds
+after their last update; expired ones are invisible immediately and swept
+periodically.
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session, State
+from google.adk.sessions.base_session_service import ListSessionsResponse
+
+from artifacts import write_atomic
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sessions")
+# Each backend gets its own directory under DEFAULT_ROOT, so neither trips over the other's files.
+DEFAULT_SQLITE_PATH = os.path.join(DEFAULT_ROOT, "sqlite", "sessions.db")
+DEFAULT_FILE_ROOT = os.path.join(DEFAULT_ROOT, "files")
+# Expired sessions are swept at most this often (they are never returned in between).
+SWEEP_INTERVAL_SECONDS = 60.0
+COMPRESSION_LEVEL = 6
+
+# App, user and session ids become file names (and come from API requests).
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]{0,127}$")
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value):
+    # NumPy scalars/arrays from the stats pass; anything else is stored as its string form.
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def dump_state(state):
+    text = json.dumps(state, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def load_state(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class PersistentSessionService(BaseSessionService):
+    """Shared ADK plumbing; subclasses store (state blob, update time) per session id."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._last_sweep = 0.0
+
+    async def create_session(self, *, app_name, user_id, state=None, session_id=None):
+        session_id = (session_id or "").strip() or uuid.uuid4().hex
+        if not all(_SAFE_ID.match(part) for part in (app_name, user_id, session_id)):
+            raise ValueError(f"invalid session key {app_name!r}/{user_id!r}/{session_id!r}")
+        now = time.time()
+        state = {key: value for key, value in (state or {}).items() if not key.startswith(State.TEMP_PREFIX)}
+        await asyncio.to_thread(self._save, app_name, user_id, session_id, dump_state(state), now)
+        await self._maybe_sweep(now)
+        return Session(id=session_id, app_name=app_name, user_id=user_id, state=state, last_update_time=now)
+
+    async def get_session(self, *, app_name, user_id, session_id, config=None):
+        if not all(_SAFE_ID.match(part) for part in (app_name, user_id, session_id)):
+            return None
+        record = await asyncio.to_thread(self._load, app_name, user_id, session_id)
+        if record is None:
+            return None
+        blob, updated = record
+        if self._expired(updated, time.time()):
+            await asyncio.to_thread(self._delete, app_name, user_id, session_id)
+            return None
+        return Session(
+            id=session_id, app_name=app_name, user_id=user_id, state=load_state(blob), last_update_time=updated
+        )
+
+    async def list_sessions(self, *, app_name, user_id=None):
+        """Ids and update times only; fetch a session to read its state."""
+        now = time.time()
+        rows = await asyncio.to_thread(self._list, app_name, user_id)
+        return ListSessionsResponse(sessions=[
+            Session(id=session_id, app_name=app_name, user_id=owner, last_update_time=updated)
+            for owner, session_id, updated in rows
+            if not self._expired(updated, now)
+        ])
+
+    async def delete_session(self, *, app_name, user_id, session_id):
+        if all(_SAFE_ID.match(part) for part in (app_name, user_id, session_id)):
+            await asyncio.to_thread(self._delete, app_name, user_id, session_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        if event.partial or not (event.actions and event.actions.state_delta):
+            return event
+        session.last_update_time = event.timestamp
+        state = {key: value for key, value in session.state.items() if not key.startswith(State.TEMP_PREFIX)}
+        await asyncio.to_thread(
+            self._save, session.app_name, session.user_id, session.id, dump_state(state), event.timestamp
+        )
+        return event
+
+    async def evict_expired(self):
+        """Deletes every expired session; returns how many were removed."""
+        self._last_sweep = time.time()
+        return await asyncio.to_thread(self._sweep, self._last_sweep - self.ttl)
+
+    def _expired(self, updated, now):
+        return self.ttl > 0 and updated < now - self.ttl
+
+    async def _maybe_sweep(self, now):
+        if self.ttl > 0 and now - self._last_sweep >= SWEEP_INTERVAL_SECONDS:
+            # Housekeeping only: expired sessions are never returned anyway, so a failed
+            # sweep must not fail the request that triggered it.
+            try:
+                await self.evict_expired()
+            except Exception:
+                logger.exception("session sweep failed")
+
+    @abc.abstractmethod
+    def _save(self, app_name, user_id, session_id, blob, updated):
+        """Stores a session's state blob and update time, replacing any previous one."""
+
+    @abc.abstractmethod
+    def _load(self, app_name, user_id, session_id):
+        """(state blob, update time) of a session, or None."""
+
+    @abc.abstractmethod
+    def _list(self, app_name, user_id):
+        """(user id, session id, update time) of every session of an app (and user)."""
+
+    @abc.abstractmethod
+    def _delete(self, app_name, user_id, session_id):
+        """Removes a session; a no-op if it does not exist."""
+
+    @abc.abstractmethod
+    def _sweep(self, cutoff):
+        """Removes every session last updated before `cutoff`; returns how many."""
+
+
+class SqliteSessionService(PersistentSessionService):
+    """Sessions in one SQLite file (WAL mode), safe to share between processes on one node.
+
+    The connection is opened lazily by each process that uses it: SQLite connections must
+    not cross a fork, and the pre-forking launcher builds this service before forking.
+    """
+
+    def __init__(self, path, ttl):
+        super().__init__(ttl)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._pid = None
+        self._lock = None
+        self._db = None
+
+    def _connection(self):
+        if self._pid != os.getpid():
+            # A connection inherited from the parent is abandoned, never used or closed here.
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (app_name TEXT, user_id TEXT, id TEXT, state BLOB,"
+                " updated REAL, PRIMARY KEY (app_name, user_id, id))"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated)")
+            self._db = db
+        return self._db, self._lock
+
+    def _execute(self, sql, args=()):
+        db, lock = self._connection()
+        with lock:
+            return db.execute(sql, args).fetchall()
+
+    def _save(self, app_name, user_id, session_id, blob, updated):
+        self._execute(
+            "INSERT OR REPLACE INTO sessions (app_name, user_id, id, state, updated) VALUES (?, ?, ?, ?, ?)",
+            (app_name, user_id, session_id, blob, updated),
+        )
+
+    def _load(self, app_name, user_id, session_id):
+        rows = self._execute(
+            "SELECT state, updated FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?",
+            (app_name, user_id, session_id),
+        )
+        return rows[0] if rows else None
+
+    def _list(self, app_name, user_id):
+        if user_id is None:
+            return self._execute("SELECT user_id, id, updated FROM sessions WHERE app_name = ?", (app_name,))
+        return self._execute(
+            "SELECT user_id, id, updated FROM sessions WHERE app_name = ? AND user_id = ?", (app_name, user_id)
+        )
+
+    def _delete(self, app_name, user_id, session_id):
+        self._execute(
+            "DELETE FROM sessions WHERE app_name = ? AND user_id = ? AND id = ?", (app_name, user_id, session_id)
+        )
+
+    def _sweep(self, cutoff):
+        db, lock = self._connection()
+        with lock:
+            return db.execute("DELETE FROM sessions WHERE updated < ?", (cutoff,)).rowcount
+
+
+class FileSessionService(PersistentSessionService):
+    """One file per session under <root>/<app>/<user>/, for a directory shared between workers or hosts.
+
+    Files are replaced atomically and their mtime is the session's update time.
+    """
+
+    def __init__(self, root, ttl):
+        super().__init__(ttl)
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, app_name, user_id, session_id):
+        return os.path.join(self.root, app_name, user_id, f"{session_id}.json.z")
+
+    def _save(self, app_name, user_id, session_id, blob, updated):
+        path = self._path(app_name, user_id, session_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, blob)
+        os.utime(path, (updated, updated))
+
+    def _load(self, app_name, user_id, session_id):
+        path = self._path(app_name, user_id, session_id)
+        try:
+            with open(path, "rb") as f:
+                return f.read(), os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _files(self, app_name=None, user_id=None):
+        # Stray files under the root or an app directory are skipped, not treated as directories.
+        apps = [app_name] if app_name else _subdirs(self.root)
+        for app in apps:
+            users = [user_id] if user_id else _subdirs(os.path.join(self.root, app))
+            for user in users:
+                directory = os.path.join(self.root, app, user)
+                for name in _listdir(directory):
+                    if name.endswith(".json.z"):
+                        yield user, name[:-len(".json.z")], os.path.join(directory, name)
+
+    def _list(self, app_name, user_id):
+        rows = []
+        for user, session_id, path in self._files(app_name, user_id):
+            try:
+                rows.append((user, session_id, os.path.getmtime(path)))
+            except FileNotFoundError:
+                pass
+        return rows
+
+    def _delete(self, app_name, user_id, session_id):
+        try:
+            os.remove(self._path(app_name, user_id, session_id))
+        except FileNotFoundError:
+            pass
+
+    def _sweep(self, cutoff):
+        removed = 0
+        for _, _, path in self._files():
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+def _listdir(path):
+    try:
+        return os.listdir(path)
+    except OSError:
+        return []
+
+
+def _subdirs(path):
+    return [name for name in _listdir(path) if os.path.isdir(os.path.join(path, name))]
+
+
+def build_session_service(backend, path, ttl):
+    """The session service for SLAIDE_SESSIONS: "memory" (ADK's, default), "sqlite" or "file"."""
+    if backend == "memory":
+        from google.adk.sessions import InMemorySessionService
+
+        return InMemorySessionService()
+    if backend == "sqlite":
+        return SqliteSessionService(path or DEFAULT_SQLITE_PATH, ttl)
+    if backend == "file":
+        return FileSessionService(path or DEFAULT_FILE_ROOT, ttl)
+    raise ValueError(f"SLAIDE_SESSIONS must be memory, sqlite or file, not {backend!r}")
@@ -0,0 +1,68 @@
+from html import escape
+
+from lead_agent.events import final_text, slide_index, strip_fence
+from lead_agent.render import (
+    SHELL_TAIL,
+    load_json_state,
+    load_slides_content,
+    render_shell,
+    render_slide,
+    render_theme,
+    theme_for,
+)
+
+MOUNT_SCRIPT = "<script>slaide.mount(document.currentScript.previousElementSibling)</script>\n"
+
+
+class DeckStream:
+    """Turns pipeline events into progressive HTML chunks for one streamed deck.
+
+    The shell goes out before the planner runs, the theme once `json_plan` is known,
+    and each slide as soon as its content exists: per-slide writer events in
+    parallel mode, or the whole `all_slides_content` list in single mode.
+    """
+
+    def __init__(self):
+        self.style = ""
+        self.themed = False
+        self.streamed = set()
+
+    def start(self):
+        return render_shell(self.style)
+
+    def feed(self, event):
+        chunks = []
+        delta = event.actions.state_delta if event.actions else None
+        if delta and "json_plan" in delta:
+            style = load_json_state(delta["json_plan"]).get("style", "")
+            # json_plan can be written twice (e.g. pinned chart stats); send the theme once per style.
+            if style != self.style or not self.themed:
+                self.style, self.themed = style, True
+                chunks.append(render_theme(self.style) + "\n")
+
+        index = slide_index(event.author)
+        text = final_text(event) if index is not None else None
+        if text:
+            chunks.append(self._slide(strip_fence(text), index))
+
+        if delta and "all_slides_content" in delta and not self.streamed:
+            _, slides = load_slides_content(delta["all_slides_content"], self.style)
+            chunks.extend(self._slide(markdown, i) for i, markdown in enumerate(slides))
+        return [chunk for chunk in chunks if chunk]
+
+    def _slide(self, markdown, index):
+        if index in self.streamed:
+            return ""
+        html = render_slide(markdown, theme_for(self.style), index)
+        if html is None:
+            return ""
+        self.streamed.add(index)
+        return html + MOUNT_SCRIPT
+
+    def error(self, message):
+        index = max(self.streamed, default=-1) + 1
+        html = f'<div class="slide" data-index="{index}"><h1>Generation failed</h1><p>{escape(message)}</p></div>'
+        return html + MOUNT_SCRIPT
+
+    def finish(self):
+        return SHELL_TAIL
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from lead_agent.cache import DiskCache, MemoryCache, stage_for
+
+
+class DiskCacheTest(unittest.TestCase):
+    """Tests for the size-bounded on-disk cache tier."""
+
+    def setUp(self):
+        """Set up a cache of 100 bytes in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = DiskCache(self.directory.name, max_bytes=100)
+
+    def _age(self, key, mtime):
+        os.utime(self.cache._path(key), (mtime, mtime))
+
+    def test_round_trip(self):
+        """Values are read back as written; unknown keys miss."""
+        self.cache.set("aa01", b"value")
+        self.assertEqual(self.cache.get("aa01"), b"value")
+        self.assertIsNone(self.cache.get("bb02"))
+        self.cache.set("aa01", b"other")
+        self.assertEqual(self.cache._size, 5)
+
+    def test_evicts_least_recently_used(self):
+        """Going over the limit removes the oldest entries down to 90% of it."""
+        for i, key in enumerate(("aa01", "bb02", "cc03")):
+            self.cache.set(key, b"x" * 30)
+            self._age(key, 1000 + i)
+        # Reading refreshes an entry, so bb02 is now the oldest.
+        self.assertEqual(self.cache.get("aa01"), b"x" * 30)
+        self.cache.set("dd04", b"x" * 30)
+        self.assertIsNone(self.cache.get("bb02"))
+        self.assertIsNotNone(self.cache.get("aa01"))
+        self.assertIsNotNone(self.cache.get("dd04"))
+        self.assertLessEqual(self.cache._size, 90)
+
+    def test_size_survives_restart(self):
+        """A new instance counts the files already on disk."""
+        self.cache.set("aa01", b"x" * 40)
+        self.assertEqual(DiskCache(self.directory.name, max_bytes=100)._size, 40)
+
+
+class MemoryCacheTest(unittest.TestCase):
+    """Tests for the in-process LRU tier."""
+
+    def test_evicts_least_recently_used(self):
+        """The entry not read for longest goes first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1")
+
+    def test_stage_for(self):
+        """Per-slide writers share the all_slides_content stage."""
+        self.assertEqual(stage_for("SlideWriter_12"), "all_slides_content")
+        self.assertEqual(stage_for("Unknown"), "Unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from lead_agent.chunking import iter_chunks
+
+
+class IterChunksTest(unittest.TestCase):
+    """Tests for splitting long inputs on section boundaries."""
+
+    def _chunks(self, text, max_chars):
+        spans = list(iter_chunks(text, max_chars))
+        # Spans tile the whole text, in order, within the limit.
+        self.assertEqual("".join(text[start:end] for start, end in spans), text)
+        self.assertTrue(all(0 < end - start <= max_chars for start, end in spans))
+        return [text[start:end] for start, end in spans]
+
+    def test_prefers_headings(self):
+        """A heading is preferred over a later paragraph or sentence break."""
+        text = "# One\nFirst part. More.\n\nStill one.\n# Two\nSecond part.\n\nEnd."
+        chunks = self._chunks(text, 50)
+        self.assertTrue(chunks[1].startswith("# Two"))
+
+    def test_falls_back_to_sentences(self):
+        """Without headings or paragraphs, chunks end at sentence ends."""
+        text = "Alpha beta gamma. Delta epsilon zeta. Eta theta iota. Kappa lambda."
+        for chunk in self._chunks(text, 30)[:-1]:
+            self.assertTrue(chunk.rstrip().endswith("."))
+
+    def test_hard_cut(self):
+        """Text with no boundary at all is cut at the limit."""
+        self.assertEqual(self._chunks("x" * 25, 10), ["x" * 10, "x" * 10, "x" * 5])
+        self.assertEqual(list(iter_chunks("", 10)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
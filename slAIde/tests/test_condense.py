@@ -0,0 +1,71 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from bench import fake_llm
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from lead_agent.chunking import OUTLINE_KEY
+from lead_agent.subagents.input_condense_agent.agent import FALLBACK_CHARS, LongInputCondenser
+
+# Five 12000-character chapters: long enough to be condensed, one chunk each.
+LONG_INPUT = "\n".join(f"# Chapter {n}\n" + "A fact about orbits. " * 570 for n in range(5))
+
+
+def condense(fixture=fake_llm.DEFAULT_FIXTURE):
+    """Runs a fresh LongInputCondenser on LONG_INPUT and returns the outline it stored."""
+    fake_llm.install(fixture)
+    runner = Runner(
+        agent=LongInputCondenser(name="LongInputCondenser", chunk_chars=12000),
+        app_name="test",
+        session_service=InMemorySessionService(),
+    )
+
+    async def run():
+        session = await runner.session_service.create_session(app_name="test", user_id="test")
+        message = types.Content(role="user", parts=[types.Part(text=LONG_INPUT)])
+        async for _ in runner.run_async(user_id="test", session_id=session.id, new_message=message):
+            pass
+        session = await runner.session_service.get_session(app_name="test", user_id="test", session_id=session.id)
+        return session.state.get(OUTLINE_KEY)
+
+    return asyncio.run(run())
+
+
+class LongInputCondenserTest(unittest.TestCase):
+    """Tests for condensing long inputs, run against the recorded fake model."""
+
+    def tearDown(self):
+        """Put the default fixture back for other tests."""
+        fake_llm.install()
+
+    def test_chunks_are_summarized(self):
+        """Every chunk's summary goes into the outline, in order."""
+        outline = condense()
+        self.assertEqual(outline.count(fake_llm.settings.fixture["input_outline"]), 5)
+
+    def test_failed_chunks_keep_their_opening_text(self):
+        """A chunk whose summary fails keeps the start of its raw text instead of failing the run."""
+        with open(fake_llm.DEFAULT_FIXTURE, encoding="utf-8") as f:
+            fixture = json.load(f)
+        # Without a recorded outline, every summarizer call raises.
+        fixture.pop("input_outline")
+        fixture.pop("final_html_file")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(fixture, f)
+            with self.assertLogs("lead_agent.subagents.input_condense_agent.agent", "WARNING") as logs:
+                outline = condense(path)
+        self.assertEqual(len(logs.records), 5)
+        parts = outline.split("\n\n")
+        self.assertEqual([part.split("\n", 1)[0] for part in parts], [f"# Chapter {n}" for n in range(5)])
+        self.assertTrue(all(len(part) <= FALLBACK_CHARS for part in parts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from lead_agent.render import SHELL_TAIL, render_deck, render_slide, replace_slide, theme_for
+
+
+class RenderDeckTest(unittest.TestCase):
+    """Tests for the template renderer and slide replacement used by edits."""
+
+    def setUp(self):
+        """Render a three-slide deck whose middle slide has an empty chart."""
+        self.slides = ["# One\n- a", "# Two\n```bar\nnothing\n```", "# Three\n- c"]
+        self.html = render_deck("Minimal", self.slides)
+
+    def test_render_deck(self):
+        """Slides keep their position as data-index, and dropped ones leave a gap."""
+        self.assertTrue(self.html.endswith(SHELL_TAIL))
+        self.assertIn('<div class="slide" data-index="0">', self.html)
+        self.assertNotIn('data-index="1"', self.html)
+        self.assertIn('<div class="slide" data-index="2">', self.html)
+        self.assertIn("<title>One</title>", self.html)
+
+    def test_render_slide_escapes(self):
+        """Markdown text is escaped, with bold and code turned into tags."""
+        html = render_slide("# A <b>\n- **bold** and `x<y`", theme_for("Minimal"), 4)
+        self.assertIn('data-index="4"', html)
+        self.assertIn("A &lt;b&gt;", html)
+        self.assertIn("<strong>bold</strong>", html)
+        self.assertIn("<code>x&lt;y</code>", html)
+        self.assertIsNone(render_slide("", theme_for("Minimal")))
+
+    def test_replace_slide(self):
+        """An existing slide is swapped in place and None removes it."""
+        fragment = render_slide("# Uno\n- z", theme_for("Minimal"), 0)
+        html = replace_slide(self.html, 0, fragment)
+        self.assertIn("Uno", html)
+        self.assertNotIn("<h1>One</h1>", html)
+        self.assertNotIn('data-index="0"', replace_slide(self.html, 0, None))
+
+    def test_replace_slide_inserts_in_order(self):
+        """A slide missing from the deck is inserted before the next higher index, or last."""
+        theme = theme_for("Minimal")
+        html = replace_slide(self.html, 1, render_slide("# Dos\n- y", theme, 1))
+        self.assertLess(html.index('data-index="1"'), html.index('data-index="2"'))
+        html = replace_slide(html, 5, render_slide("# Cinco\n- v", theme, 5))
+        self.assertLess(html.index('data-index="5"'), html.index(SHELL_TAIL))
+        with self.assertRaises(ValueError):
+            replace_slide("<html></html>", 0, "<div></div>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import asyncio
+import tempfile
+import unittest
+
+from bench import fake_llm
+from google.adk.runners import Runner
+from google.genai import types
+
+from lead_agent import config, root_agent
+from lead_agent.render import load_slides_content, render_deck
+from lead_agent.subagents.deck_shell_agent.agent import SHELL_KEY, Deck_shell_agent, plan_title, prebuilt_shell
+from sessions import FileSessionService
+
+
+class PrebuiltShellTest(unittest.TestCase):
+    """Tests for when the renderer may reuse the speculative shell."""
+
+    def setUp(self):
+        """A shell as DeckShellBuilder writes it."""
+        self.state = {
+            SHELL_KEY: {"style": "vintage", "title": "Space", "runtime": config.RUNTIME, "html": "<shell>"}
+        }
+
+    def test_matching_shell_is_reused(self):
+        """The same style, title and runtime give back the prebuilt HTML."""
+        self.assertEqual(prebuilt_shell(self.state, "vintage", "Space"), "<shell>")
+
+    def test_changed_style_or_title_is_rebuilt(self):
+        """A written deck that changed its style or title gets no prebuilt shell."""
+        self.assertIsNone(prebuilt_shell(self.state, "modern", "Space"))
+        self.assertIsNone(prebuilt_shell(self.state, "vintage", "Mars"))
+        self.assertIsNone(prebuilt_shell({}, "vintage", "Space"))
+
+    def test_plan_title_skips_blank_titles(self):
+        """The shell's title is the first non-empty planned slide title, without heading marks."""
+        self.assertEqual(plan_title({"slides": ["", "## Space"]}), "Space")
+        self.assertEqual(plan_title({}), "Presentation")
+
+
+class SpeculativeShellPipelineTest(unittest.TestCase):
+    """Tests for the shell key in a full run, against the recorded fake model and file sessions."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Route model calls to the fake."""
+        cls.settings = fake_llm.install()
+
+    @unittest.skipUnless(
+        config.RENDERER == "template" and config.SPECULATIVE_SHELL == "on", "the speculative shell is off"
+    )
+    def test_shell_is_built_but_not_stored(self):
+        """The shell is built during the run but not persisted, and the deck matches a fresh render."""
+
+        async def run(service):
+            runner = Runner(agent=root_agent, app_name="slAIde", session_service=service)
+            session = await service.create_session(app_name="slAIde", user_id="tester")
+            message = types.Content(role="user", parts=[types.Part(text=self.settings.fixture["prompt"])])
+            authors = []
+            async for event in runner.run_async(user_id="tester", session_id=session.id, new_message=message):
+                authors.append(event.author)
+            stored = await service.get_session(app_name="slAIde", user_id="tester", session_id=session.id)
+            return authors, stored.state
+
+        with tempfile.TemporaryDirectory() as directory:
+            authors, state = asyncio.run(run(FileSessionService(directory, 3600)))
+        self.assertIn(Deck_shell_agent.name, authors)
+        self.assertNotIn(SHELL_KEY, state)
+        style, slides = load_slides_content(state["all_slides_content"])
+        self.assertEqual(state["final_html"], render_deck(style, slides))
+
+
+if __name__ == "__main__":
+    unittest.main()
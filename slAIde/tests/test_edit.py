@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from bench import fake_llm
+
+import runtime
+from lead_agent.render import is_template_deck, load_slides_content, render_deck
+
+
+class EditTest(unittest.TestCase):
+    """Tests for /edit's deck editor, run against the recorded fake model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Route model calls to the fake and load the recorded deck."""
+        settings = fake_llm.install()
+        cls.plan = settings.fixture["json_plan"]
+        cls.content = settings.fixture["all_slides_content"]
+        cls.style, cls.slides = load_slides_content(cls.content)
+
+    def _edit(self, final_html, slides=(1,)):
+        deck = {"json_plan": self.plan, "all_slides_content": self.content, "final_html": final_html}
+        return asyncio.run(runtime.edit(deck, "Make it shorter", list(slides)))
+
+    def test_template_deck_is_patched(self):
+        """Only the edited slide of a template-rendered deck changes."""
+        html = render_deck(self.style, self.slides)
+        state = self._edit(html)
+        self.assertEqual(sorted(state["edited_slides"]), [1])
+        edited = state["final_html"]
+        self.assertIn(state["edited_slides"][1], edited)
+        start = html.index('<div class="slide" data-index="2">')
+        self.assertEqual(edited[edited.index('<div class="slide" data-index="2">'):], html[start:])
+
+    def test_llm_rendered_deck_is_re_rendered(self):
+        """A deck without slide sections of ours is rendered again instead of patched."""
+        state = self._edit("<!DOCTYPE html><html><body><section>Slide</section></body></html>")
+        self.assertTrue(is_template_deck(state["final_html"]))
+        for index in range(len(self.slides)):
+            self.assertIn(f'data-index="{index}"', state["final_html"])
+
+    def test_planned_edit_without_html(self):
+        """Without explicit slides the planner picks them; no deck means no final_html."""
+        deck = {"json_plan": self.plan, "all_slides_content": self.content}
+        state = asyncio.run(runtime.edit(deck, "Make it shorter"))
+        self.assertTrue(state["edited_slides"])
+        self.assertNotIn("final_html", state)
+
+
+if __name__ == "__main__":
+    unittest.main()
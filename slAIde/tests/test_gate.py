@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from gate import GateFull, GenerationGate
+
+
+class GenerationGateTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for the admission gate in front of deck generations."""
+
+    async def asyncSetUp(self):
+        """Set up a gate with one running slot and one waiting."""
+        self.started = []
+        self.gate = GenerationGate(1, 1, on_start=self.started.append)
+
+    async def test_admit_limits(self):
+        """Admission fails with a Retry-After once both slots are taken."""
+        first, second = self.gate.admit(), self.gate.admit()
+        with self.assertRaises(GateFull) as caught:
+            self.gate.admit()
+        self.assertGreaterEqual(caught.exception.retry_after, 1)
+        first.close()
+        second.close()
+        self.assertEqual(self.gate.admitted, 0)
+
+    async def test_waiting_slot_runs_after_release(self):
+        """A second slot waits until the first is released."""
+        first, second = self.gate.admit(), self.gate.admit()
+        await first.__aenter__()
+        waiter = asyncio.create_task(second.__aenter__())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+        self.assertEqual((self.gate.active, self.gate.waiting), (1, 1))
+        await first.__aexit__(None, None, None)
+        await waiter
+        self.assertEqual((self.gate.active, self.gate.waiting), (1, 0))
+        second.close()
+        self.assertEqual((self.gate.admitted, self.gate.active), (0, 0))
+        self.assertEqual(len(self.started), 2)
+
+    async def test_close_is_idempotent(self):
+        """Closing twice, or without entering, gives the reservation back once."""
+        slot = self.gate.admit()
+        slot.close()
+        slot.close()
+        self.assertEqual(self.gate.admitted, 0)
+        async with self.gate.admit():
+            self.assertEqual(self.gate.active, 1)
+        self.assertEqual((self.gate.admitted, self.gate.active), (0, 0))
+
+    async def test_cancelled_waiter_releases(self):
+        """A waiter cancelled before it gets a slot frees its reservation."""
+        async with self.gate.admit():
+            waiter = asyncio.create_task(self.gate.admit().__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(self.gate.admitted, 1)
+        self.assertEqual(self.gate.admitted, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
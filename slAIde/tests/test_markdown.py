@@ -0,0 +1,48 @@
+import unittest
+
+from lead_agent.render.markdown import parse_bar_chart, parse_number, parse_slide
+
+
+class ParseSlideTest(unittest.TestCase):
+    """Tests for splitting a writer's markdown slide into its parts."""
+
+    def test_title_bullets_and_paragraphs(self):
+        """The first heading is the title; list items are bullets, other lines paragraphs."""
+        slide = parse_slide("# The Moon\nIntro line.\n- one\n* two\n1. three\n## Aside")
+        self.assertEqual(slide.title, "The Moon")
+        self.assertEqual(slide.bullets, ["one", "two", "three"])
+        self.assertEqual(slide.paragraphs, ["Intro line.", "Aside"])
+        self.assertIsNone(slide.chart)
+
+    def test_bar_fence(self):
+        """A ```bar fence becomes chart rows, split on the first colon only."""
+        slide = parse_slide("# Launches\n```bar\nNASA: 150\nESA: 1,250.5\nRatio: 3:1\n\n```\n- after")
+        self.assertEqual(slide.chart, [("NASA", 150), ("ESA", 1250.5)])
+        self.assertEqual(slide.bullets, ["after"])
+
+    def test_unterminated_bar_fence(self):
+        """A bar fence missing its closing ``` still yields its rows."""
+        self.assertEqual(parse_slide("# T\r\n```bar\r\nA: 1\r\nB: 2").chart, [("A", 1), ("B", 2)])
+
+    def test_other_fences_are_skipped(self):
+        """Lines inside a non-bar fence are neither bullets nor chart rows."""
+        slide = parse_slide("# T\n```python\n- not a bullet\n```")
+        self.assertEqual(slide.bullets, [])
+        self.assertIsNone(slide.chart)
+
+    def test_bar_fence_without_rows(self):
+        """A bar fence with nothing parsable is an empty chart, not a missing one."""
+        self.assertEqual(parse_slide("```bar\nno numbers here\n```").chart, [])
+
+    def test_parse_number(self):
+        """Numbers may carry commas, a sign, decimals or a percent sign."""
+        self.assertEqual(parse_number("1,234"), 1234)
+        self.assertEqual(parse_number("-3.5"), -3.5)
+        self.assertEqual(parse_number(" 42% "), 42)
+        self.assertIsNone(parse_number("abc"))
+        self.assertIsNone(parse_number("."))
+        self.assertEqual(parse_bar_chart(": 5\nA: x\nB: 7"), [("B", 7)])
+
+
+if __name__ == "__main__":
+    unittest.main()
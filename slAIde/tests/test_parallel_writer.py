@@ -0,0 +1,93 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from bench import fake_llm
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from lead_agent.events import slide_index
+from lead_agent.subagents.parallel_slide_writer_agent.agent import ParallelSlideWriter, chart_slide
+
+
+def write_slides(plan, fixture=fake_llm.DEFAULT_FIXTURE, jitter=0.0):
+    """Runs a fresh ParallelSlideWriter on `plan` and returns its slides and announced indices."""
+    fake_llm.install(fixture, jitter=jitter)
+    runner = Runner(
+        agent=ParallelSlideWriter(name="ParallelSlidesContentWriter", concurrency=4),
+        app_name="test",
+        session_service=InMemorySessionService(),
+    )
+
+    async def run():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="test", state={"json_plan": plan}
+        )
+        message = types.Content(role="user", parts=[types.Part(text="Write the slides")])
+        announced = []
+        content = None
+        async for event in runner.run_async(user_id="test", session_id=session.id, new_message=message):
+            index = slide_index(event.author)
+            if index is not None and event.content:
+                announced.append(index)
+            if event.actions and event.actions.state_delta.get("all_slides_content"):
+                content = event.actions.state_delta["all_slides_content"]
+        return content["all_slides_content"], announced
+
+    return asyncio.run(run())
+
+
+class ParallelSlideWriterTest(unittest.TestCase):
+    """Tests for the per-slide writer's ordering and placeholders, run against the recorded fake model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the recorded plan and slides."""
+        with open(fake_llm.DEFAULT_FIXTURE, encoding="utf-8") as f:
+            cls.fixture = json.load(f)
+        cls.plan = cls.fixture["json_plan"]
+        cls.titles = cls.plan["slides"]
+
+    def tearDown(self):
+        """Put the default fixture back for other tests."""
+        fake_llm.install()
+
+    def test_slides_stay_in_plan_order(self):
+        """Writers finishing in any order still give slide i for title i, chart rows from the plan."""
+        slides, announced = write_slides(self.plan, jitter=0.02)
+        self.assertEqual(len(slides), len(self.titles))
+        for markdown, title in zip(slides[:-1], self.titles[:-1]):
+            self.assertTrue(markdown.startswith(f"# {title}\n"))
+        stats = list(zip(self.plan["stats-categories"], self.plan["stats-numbers"]))
+        self.assertEqual(slides[-1], chart_slide(self.titles[-1], stats))
+        self.assertEqual(sorted(announced), list(range(len(self.titles))))
+
+    def test_empty_writer_keeps_its_place(self):
+        """A writer that returns nothing gets a title-only slide, so later slides keep their index."""
+        fixture = dict(self.fixture, slides=list(self.fixture["slides"]))
+        fixture["slides"][2] = ""
+        fixture.pop("final_html_file")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(fixture, f)
+            slides, announced = write_slides(self.plan, path)
+        self.assertEqual(len(slides), len(self.titles))
+        self.assertEqual(slides[2], f"# {self.titles[2]}")
+        self.assertTrue(slides[3].startswith(f"# {self.titles[3]}\n"))
+        self.assertIn(2, announced)
+
+    def test_chart_without_stats_is_a_placeholder(self):
+        """A chart slide whose plan breaks the chart rules is kept as a title-only slide."""
+        plan = dict(self.plan, **{"stats-numbers": [1, 2]})
+        slides, announced = write_slides(plan)
+        self.assertEqual(len(slides), len(self.titles))
+        self.assertEqual(slides[-1], f"# {self.titles[-1]}")
+        self.assertIn(len(self.titles) - 1, announced)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from lead_agent.render import clean_html
+
+
+class CleanHtmlTest(unittest.TestCase):
+    """Tests for the one-time cleanup of the LLM renderer's final_html."""
+
+    def test_strips_wrapping_fences(self):
+        """Fences wrapping the document or alone between tags are removed."""
+        html = "```html\n<!DOCTYPE html><html><body><div>```json</div>\n  '''\n</body></html>\n```"
+        self.assertEqual(clean_html(html), "<!DOCTYPE html><html><body><div></div>\n</body></html>\n")
+
+    def test_keeps_quotes_in_text(self):
+        """Triple quotes and backticks inside prose are content, not fences."""
+        html = "<p>He said '''hi''' and ```x</p>"
+        self.assertEqual(clean_html(html), html + "\n")
+
+    def test_raw_text_elements_untouched(self):
+        """Scripts, styles and pre blocks are copied byte for byte."""
+        html = "<script>\n```\nlet  a = 1;\n</script><pre>  ```bar\n  x</pre>"
+        self.assertEqual(clean_html(html), html + "\n")
+
+    def test_comments_and_whitespace(self):
+        """Comments go except conditional ones; whitespace runs collapse."""
+        html = "<p>a   b\n\n c</p><!-- note --><!--[if IE]><p>x</p><![endif]-->"
+        self.assertEqual(clean_html(html), "<p>a b\nc</p><!--[if IE]><p>x</p><![endif]-->\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import re
+import unittest
+
+from bench import fake_llm
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import server
+from lead_agent.render import SHELL_TAIL
+from streaming import MOUNT_SCRIPT
+
+
+def gone_request():
+    """A /run request whose client has already disconnected."""
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "method": "POST", "path": "/run", "headers": []}, receive)
+
+
+class RunCancellationTest(unittest.TestCase):
+    """Tests for /run stopping the generation of a client that went away."""
+
+    def tearDown(self):
+        """Put the default fixture back for other tests."""
+        fake_llm.install()
+
+    def test_disconnect_returns_499_and_frees_the_slot(self):
+        """The generation is cancelled, the answer is 499 and the gate slot is given back."""
+        fake_llm.install(latency=5.0)
+        request = server.PromptRequest(prompt="The history of space exploration")
+
+        async def run():
+            with self.assertRaises(HTTPException) as raised:
+                await asyncio.wait_for(server.run_agent(request, gone_request()), timeout=2.0)
+            return raised.exception
+
+        error = asyncio.run(run())
+        self.assertEqual(error.status_code, 499)
+        self.assertEqual(server.gate.admitted, 0)
+        self.assertEqual(server.gate.active, 0)
+
+
+class DeckStreamTest(unittest.TestCase):
+    """Tests for the chunk order of a streamed deck, run against the recorded fake model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Route model calls to the fake."""
+        cls.settings = fake_llm.install(jitter=0.02)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Put the default fixture back for other tests."""
+        fake_llm.install()
+
+    def _chunks(self):
+        async def run():
+            slot = server.gate.admit()
+            return [chunk async for chunk in server.stream_deck(self.settings.fixture["prompt"], None, slot)]
+
+        return asyncio.run(run())
+
+    def test_shell_theme_slides_tail(self):
+        """The shell comes first, then the theme, then each slide once, then the closing tail."""
+        chunks = self._chunks()
+        self.assertIn("<html", chunks[0])
+        self.assertTrue(chunks[1].startswith("<style"))
+        self.assertEqual(chunks[-1], SHELL_TAIL)
+        slides = chunks[2:-1]
+        titles = self.settings.fixture["json_plan"]["slides"]
+        self.assertEqual(len(slides), len(titles))
+        indices = [int(re.search(r'data-index="(\d+)"', chunk).group(1)) for chunk in slides]
+        self.assertEqual(sorted(indices), list(range(len(titles))))
+        for chunk in slides:
+            self.assertTrue(chunk.endswith(MOUNT_SCRIPT))
+        self.assertEqual(server.gate.admitted, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
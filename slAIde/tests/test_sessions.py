@@ -0,0 +1,126 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from google.adk.events import Event, EventActions
+
+from sessions import FileSessionService, SqliteSessionService
+
+APP = "slAIde"
+USER = "tester"
+
+
+class SessionServiceTests:
+    """Shared tests for the persistent session backends; subclasses build the service."""
+
+    def setUp(self):
+        """Give every test its own storage location."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def service(self, ttl=3600):
+        raise NotImplementedError
+
+    def test_state_survives_a_new_service(self):
+        """State written through one service is read back by another on the same storage."""
+
+        async def run():
+            session = await self.service().create_session(app_name=APP, user_id=USER, state={"json_plan": {"a": 1}})
+            return session.id, await self.service().get_session(app_name=APP, user_id=USER, session_id=session.id)
+
+        session_id, session = asyncio.run(run())
+        self.assertEqual(session.id, session_id)
+        self.assertEqual(session.state, {"json_plan": {"a": 1}})
+
+    def test_events_persist_state_but_not_temp_keys(self):
+        """A state delta is stored with the session; `temp:` keys stay in memory only."""
+
+        async def run():
+            service = self.service()
+            session = await service.create_session(app_name=APP, user_id=USER, state={"temp:shell": "x"})
+            delta = {"final_html": "<html></html>", "temp:deck_shell": "<html>"}
+            await service.append_event(session, Event(author="user", actions=EventActions(state_delta=delta)))
+            return session, await self.service().get_session(app_name=APP, user_id=USER, session_id=session.id)
+
+        live, stored = asyncio.run(run())
+        self.assertEqual(live.state["temp:deck_shell"], "<html>")
+        self.assertEqual(stored.state, {"final_html": "<html></html>"})
+
+    def test_list_and_delete(self):
+        """Sessions are listed by app and user, and gone once deleted."""
+
+        async def run():
+            service = self.service()
+            first = await service.create_session(app_name=APP, user_id=USER)
+            await service.create_session(app_name=APP, user_id="other")
+            listed = await service.list_sessions(app_name=APP, user_id=USER)
+            await service.delete_session(app_name=APP, user_id=USER, session_id=first.id)
+            deleted = await service.get_session(app_name=APP, user_id=USER, session_id=first.id)
+            return first, listed, deleted, await service.list_sessions(app_name=APP)
+
+        first, listed, deleted, remaining = asyncio.run(run())
+        self.assertEqual([s.id for s in listed.sessions], [first.id])
+        self.assertIsNone(deleted)
+        self.assertEqual([s.user_id for s in remaining.sessions], ["other"])
+
+    def test_expired_sessions_are_hidden(self):
+        """A session past its TTL is neither listed nor returned."""
+
+        async def run():
+            service = self.service(ttl=0.05)
+            expired = await service.create_session(app_name=APP, user_id=USER)
+            await asyncio.sleep(0.1)
+            fresh = await service.create_session(app_name=APP, user_id=USER)
+            listed = await service.list_sessions(app_name=APP, user_id=USER)
+            got = await service.get_session(app_name=APP, user_id=USER, session_id=expired.id)
+            return fresh, listed, got
+
+        fresh, listed, got = asyncio.run(run())
+        self.assertEqual([s.id for s in listed.sessions], [fresh.id])
+        self.assertIsNone(got)
+
+    def test_sweep_removes_expired_sessions(self):
+        """evict_expired deletes what expired and keeps the rest."""
+
+        async def run():
+            service = self.service(ttl=3600)
+            old = await service.create_session(app_name=APP, user_id=USER)
+            await service.create_session(app_name=APP, user_id=USER)
+            service._save(APP, USER, old.id, b"", time.time() - 7200)
+            swept = await service.evict_expired()
+            return swept, await service.list_sessions(app_name=APP)
+
+        swept, remaining = asyncio.run(run())
+        self.assertEqual(swept, 1)
+        self.assertEqual(len(remaining.sessions), 1)
+
+    def test_unsafe_ids_are_rejected(self):
+        """Ids that could escape the storage location are refused or not found."""
+
+        async def run():
+            service = self.service()
+            with self.assertRaises(ValueError):
+                await service.create_session(app_name=APP, user_id=USER, session_id="../escape")
+            return await service.get_session(app_name=APP, user_id="../..", session_id="x")
+
+        self.assertIsNone(asyncio.run(run()))
+
+
+class SqliteSessionServiceTest(SessionServiceTests, unittest.TestCase):
+    """Tests for sessions stored in one SQLite database."""
+
+    def service(self, ttl=3600):
+        return SqliteSessionService(os.path.join(self.directory.name, "sessions.db"), ttl)
+
+
+class FileSessionServiceTest(SessionServiceTests, unittest.TestCase):
+    """Tests for sessions stored as one file each."""
+
+    def service(self, ttl=3600):
+        return FileSessionService(self.directory.name, ttl)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from lead_agent.stats import candidates, clean_label, extract_series
+
+
+class ExtractSeriesTest(unittest.TestCase):
+    """Tests for the regex chart-data extraction run before the planner."""
+
+    def test_list_series_is_confident(self):
+        """A clean list of labelled percentages is pinned as-is."""
+        series = extract_series("- North America: 45%\n- Europe: 30%\n- Asia: 20%\n- Other: 5%")
+        self.assertEqual(series["categories"], ["North America", "Europe", "Asia", "Other"])
+        self.assertEqual(series["numbers"], [45.0, 30.0, 20.0, 5.0])
+        self.assertEqual(series["unit"], "%")
+        self.assertTrue(series["confident"])
+
+    def test_labels_skip_pronouns_and_verbs(self):
+        """"In Q1 we sold 500 units" is labelled Q1, and scales are applied."""
+        text = "In Q1 we sold 500 units. In Q2 we sold 700 units. In Q3 we sold 1.5k units."
+        self.assertEqual(
+            candidates(text), [("Q1", 500.0, "unit"), ("Q2", 700.0, "unit"), ("Q3", 1500.0, "unit")]
+        )
+
+    def test_junk_labels_are_only_a_hint(self):
+        """Lowercase fragments make the series a hint rather than a pinned chart."""
+        series = extract_series("Revenue was $5 million. costs $3 million. margins $2 million. ads $1 million.")
+        self.assertEqual(series["unit"], "$")
+        self.assertFalse(series["confident"])
+        self.assertFalse(clean_label("costs"))
+        self.assertFalse(clean_label("Q1 we sold stuff"))
+        self.assertTrue(clean_label("Q1"))
+
+    def test_alternatives_and_years(self):
+        """Years are not values; a second unit's series is offered as an alternative."""
+        text = (
+            "In 2020 Alpha had 10 stores. Beta had 20 stores. Gamma had 30 stores.\n"
+            "- Alpha: 5%\n- Beta: 6%\n- Gamma: 7%"
+        )
+        series = extract_series(text)
+        self.assertEqual(series["numbers"], [10.0, 20.0, 30.0])
+        self.assertEqual(series["alternatives"][0]["unit"], "%")
+        self.assertFalse(series["confident"])
+
+    def test_no_series(self):
+        """Fewer than three rows sharing a unit is no series at all."""
+        self.assertIsNone(extract_series("We launched 3 rockets and 2 probes."))
+        self.assertIsNone(extract_series(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from types import SimpleNamespace
+
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+from lead_agent import telemetry
+
+
+def context(agent_name, invocation_id="inv"):
+    """The parts of a callback context the telemetry callbacks read."""
+    return SimpleNamespace(invocation_id=invocation_id, agent_name=agent_name, state={})
+
+
+def response():
+    usage = types.GenerateContentResponseUsageMetadata(prompt_token_count=10, candidates_token_count=5)
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text="# Slide")]), usage_metadata=usage)
+
+
+class StageTelemetryTest(unittest.TestCase):
+    """Tests for how model calls roll up into stage records."""
+
+    def call(self, agent_name, finished=True):
+        telemetry.start_model_call(context(agent_name), LlmRequest(model="gemini-2.5-flash"))
+        if finished:
+            telemetry.end_model_call(context(agent_name), response())
+
+    def test_per_slide_writers_count_toward_their_stage(self):
+        """Writer calls, retries and cache hits land on the parallel writer's record and are cleared."""
+        telemetry.start_stage(context("ParallelSlidesContentWriter"))
+        self.call("SlideWriter_0")
+        self.call("SlideWriter_1", finished=False)
+        self.call("SlideWriter_2", finished=False)
+        self.call("SlideWriter_2")
+        telemetry.end_stage(context("ParallelSlidesContentWriter"))
+
+        [record] = telemetry.pop_timings("inv")
+        self.assertEqual(record["stage"], "all_slides_content")
+        self.assertEqual(record["model_calls"], 2)
+        self.assertEqual(record["input_tokens"], 20)
+        self.assertEqual(record["retries"], 1)
+        self.assertEqual(record["cache_hits"], 1)
+        self.assertFalse([key for key in telemetry._calls if key[0] == "inv"])
+        self.assertFalse([key for key in telemetry._call_counts if key[0] == "inv"])
+
+    def test_other_stages_keep_their_calls(self):
+        """Ending one stage leaves a concurrently running stage's open call alone."""
+        telemetry.start_stage(context("ParallelSlidesContentWriter"))
+        telemetry.start_stage(context("DeckShellBuilder"))
+        self.call("SlideEditPlanner", finished=False)
+        telemetry.end_stage(context("DeckShellBuilder"))
+        self.assertIn(("inv", "SlideEditPlanner"), telemetry._calls)
+        telemetry.end_stage(context("ParallelSlidesContentWriter"))
+        telemetry.pop_timings("inv")
+        self.assertNotIn(("inv", "SlideEditPlanner"), telemetry._calls)
+
+
+if __name__ == "__main__":
+    unittest.main()